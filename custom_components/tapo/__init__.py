@@ -17,21 +17,31 @@ from homeassistant.helpers.event import async_track_time_interval
 from plugp100.discovery import DiscoveredDevice
 import voluptuous as vol
 
+from custom_components.tapo.connection_cache import async_get_connection_cache
 from custom_components.tapo.coordinators import HassTapoDeviceData
-from custom_components.tapo.discovery import discovery_tapo_devices
+from custom_components.tapo.discovery import get_discovery_cache
 from custom_components.tapo.errors import DeviceNotSupported
 from custom_components.tapo.hass_tapo import HassTapo
+from custom_components.tapo.host_tracking import async_move_discovered_devices
 from custom_components.tapo.migrations import migrate_entry_to_v8
+from custom_components.tapo.session_pool import get_session_pool
 from custom_components.tapo.setup_helpers import create_device_config
 
 from .const import (
     CONF_DISCOVERED_DEVICE_INFO,
     CONF_HOST,
     CONF_MAC,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_MAX_HOST_REQUESTS,
+    CONF_SETUP_CONCURRENCY,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_MAX_HOST_REQUESTS,
     DEFAULT_POLLING_RATE_S,
+    DEFAULT_SETUP_CONCURRENCY,
     DISCOVERY_FEATURE_FLAG,
     DISCOVERY_INTERVAL,
     DOMAIN,
+    DOMAIN_CONFIG,
     PLATFORMS,
 )
 
@@ -42,6 +52,16 @@ CONFIG_SCHEMA = vol.Schema(
         DOMAIN: vol.Schema(
             {
                 vol.Optional(DISCOVERY_FEATURE_FLAG, default=True): cv.boolean,
+                vol.Optional(
+                    CONF_SETUP_CONCURRENCY, default=DEFAULT_SETUP_CONCURRENCY
+                ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                vol.Optional(
+                    CONF_MAX_CONCURRENT_REQUESTS,
+                    default=DEFAULT_MAX_CONCURRENT_REQUESTS,
+                ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                vol.Optional(
+                    CONF_MAX_HOST_REQUESTS, default=DEFAULT_MAX_HOST_REQUESTS
+                ): vol.All(vol.Coerce(int), vol.Range(min=1)),
             }
         )
     },
@@ -53,12 +73,16 @@ async def async_setup(hass: HomeAssistant, config: dict):
     """Set up the tapo_p100 component."""
     hass.data.setdefault(DOMAIN, {})
     domain_config = config.get(DOMAIN, {})
+    hass.data[DOMAIN][DOMAIN_CONFIG] = domain_config
     discovery_enabled = domain_config.get(DISCOVERY_FEATURE_FLAG, True)
     if discovery_enabled:
 
         async def _start_discovery(_: Any = None) -> None:
-            if device_found := await discovery_tapo_devices(hass):
-                async_create_discovery_flow(hass, device_found)
+            async for device in get_discovery_cache(hass).async_discover():
+                found = {dr.format_mac(device.mac): device}
+                async_create_discovery_flow(
+                    hass, await async_move_discovered_devices(hass, found)
+                )
 
         hass.async_create_background_task(_start_discovery(), "Initial tapo discovery")
         async_track_time_interval(
@@ -100,9 +124,15 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
 
     if data and unload_ok:
         data.config_entry_update_unsub()
+        await get_session_pool(hass).async_release(data.device.host)
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Drop the cached connection of a removed entry."""
+    (await async_get_connection_cache(hass)).invalidate(entry.entry_id)
+
+
 def async_create_discovery_flow(
     hass: HomeAssistant,
     discovered_devices: dict[str, DiscoveredDevice],
@@ -0,0 +1,45 @@
+from collections import deque
+import math
+
+from custom_components.tapo.const import (
+    ADAPTIVE_TIMEOUT_FACTOR,
+    ADAPTIVE_TIMEOUT_MAX_S,
+    ADAPTIVE_TIMEOUT_MIN_S,
+    ADAPTIVE_TIMEOUT_MIN_SAMPLES,
+    ADAPTIVE_TIMEOUT_WINDOW,
+)
+
+
+class AdaptiveTimeout:
+    """Request timeout derived from the latencies observed for an operation.
+
+    Once enough samples are collected the timeout is the p99 latency times
+    ADAPTIVE_TIMEOUT_FACTOR, clamped. After a timeout the next attempt gets
+    the maximum value, so slow but legit requests (e.g. a new handshake)
+    are not abandoned over and over.
+    """
+
+    def __init__(self):
+        self._samples: deque[float] = deque(maxlen=ADAPTIVE_TIMEOUT_WINDOW)
+        self._relaxed = False
+
+    @property
+    def timeout(self) -> float:
+        if self._relaxed or len(self._samples) < ADAPTIVE_TIMEOUT_MIN_SAMPLES:
+            return ADAPTIVE_TIMEOUT_MAX_S
+        return min(
+            ADAPTIVE_TIMEOUT_MAX_S,
+            max(ADAPTIVE_TIMEOUT_MIN_S, self.p99 * ADAPTIVE_TIMEOUT_FACTOR),
+        )
+
+    @property
+    def p99(self) -> float:
+        ordered = sorted(self._samples)
+        return ordered[math.ceil(0.99 * len(ordered)) - 1] if ordered else 0
+
+    def record_success(self, latency_s: float) -> None:
+        self._samples.append(latency_s)
+        self._relaxed = False
+
+    def record_timeout(self) -> None:
+        self._relaxed = True
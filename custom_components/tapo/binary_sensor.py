@@ -22,7 +22,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_d
     # get tapo helper
     data = cast(HassTapoDeviceData, hass.data[DOMAIN][entry.entry_id])
     if data.device.has_component(OverheatComponent):
-        async_add_devices([OverheatSensor(data.coordinator, data.device)], True)
+        async_add_devices([OverheatSensor(data.coordinator, data.device)])
     if data.coordinator.is_hub:
         await async_setup_binary_sensors(hass, entry, async_add_devices)
 
@@ -0,0 +1,76 @@
+import asyncio
+import logging
+from typing import Optional
+
+from custom_components.tapo.const import (
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    CIRCUIT_BREAKER_MAX_BACKOFF_S,
+    CIRCUIT_BREAKER_PROBE_TIMEOUT_S,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class DeviceCircuitBreaker:
+    """Tracks the reachability of a device to back off its polling.
+
+    After `failure_threshold` consecutive connection failures the breaker
+    opens: polls are spaced exponentially, up to `max_backoff_s`, and each of
+    them is preceded by a cheap TCP probe. The first success closes it again.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: Optional[int],
+        failure_threshold: int = CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+        max_backoff_s: float = CIRCUIT_BREAKER_MAX_BACKOFF_S,
+    ):
+        self._host = host
+        self._port = port or 80
+        self._failure_threshold = failure_threshold
+        self._max_backoff_s = max_backoff_s
+        self._failures = 0
+
+    @property
+    def is_open(self) -> bool:
+        return self._failures >= self._failure_threshold
+
+    @property
+    def failures(self) -> int:
+        return self._failures
+
+    def record_success(self) -> None:
+        if self.is_open:
+            _LOGGER.info("Device %s is reachable again", self._host)
+        self._failures = 0
+
+    def reset(self, host: str, port: Optional[int]) -> None:
+        """Point the breaker to a new address of the device, closing it."""
+        self._host = host
+        self._port = port or 80
+        self._failures = 0
+
+    def record_failure(self, interval_s: float) -> Optional[float]:
+        """Count a failure, returning the backoff delay once the breaker is open."""
+        self._failures += 1
+        if not self.is_open:
+            return None
+        exponent = self._failures - self._failure_threshold
+        return min(self._max_backoff_s, interval_s * 2 ** min(exponent, 16))
+
+    async def async_probe(self) -> bool:
+        """Check the device accepts TCP connections, without any request."""
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(self._host, self._port),
+                CIRCUIT_BREAKER_PROBE_TIMEOUT_S,
+            )
+        except (OSError, asyncio.TimeoutError):
+            return False
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+        return True
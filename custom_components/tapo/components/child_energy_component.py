@@ -1,11 +1,118 @@
+import asyncio
+import logging
+from time import monotonic, time
 from typing import Any, Optional
 
-from plugp100.api.requests.tapo_request import TapoRequest
+from plugp100.api.requests.tapo_request import MultipleRequestParams, TapoRequest
 from plugp100.api.tapo_client import TapoClient
+from plugp100.common.functional.tri import Failure, Success, Try
 from plugp100.components.base import DeviceComponent
+from plugp100.errors import TapoException
 from plugp100.models.energy import EnergyInfo
 from plugp100.models.power import PowerInfo
 
+from custom_components.tapo.helpers import is_unsupported_request_error
+
+_LOGGER = logging.getLogger(__name__)
+
+Json = dict[str, Any]
+ChildEnergyResult = tuple[Try[Json], Try[Json]]
+
+
+class StripEnergyFetcher:
+    """Fetches energy and power of every strip socket in one request.
+
+    All the sockets queries are packed into a single top level multipleRequest
+    of control_child requests. Strips rejecting that request as unsupported
+    fall back to one control_child per socket, carrying both queries in its
+    multipleRequest; other failures only fail the current cycle. Results are cached for `validity` seconds, so the socket coordinators
+    polling in the same cycle share a single fetch.
+    """
+
+    def __init__(self, client: TapoClient, child_ids: list[str], validity: float):
+        self._client = client
+        self._child_ids = child_ids
+        self._validity = validity
+        self._lock = asyncio.Lock()
+        self._results: dict[str, ChildEnergyResult] = {}
+        self._fetched_at: Optional[float] = None
+        self._batch_supported: Optional[bool] = None if len(child_ids) > 1 else False
+
+    async def fetch(self, child_id: str) -> ChildEnergyResult:
+        async with self._lock:
+            if (
+                self._fetched_at is None
+                or monotonic() - self._fetched_at >= self._validity
+                or child_id not in self._results
+            ):
+                self._results = await self._fetch_all()
+                self._fetched_at = monotonic()
+            return self._results.get(child_id, _missing_result(child_id))
+
+    async def _fetch_all(self) -> dict[str, ChildEnergyResult]:
+        if self._batch_supported is not False:
+            batch = await self._fetch_batch()
+            if batch.is_success():
+                self._batch_supported = True
+                return batch.get()
+            if not is_unsupported_request_error(batch.error()):
+                # transient, the batch is tried again in the next cycle
+                error = Failure(batch.error())
+                return {child_id: (error, error) for child_id in self._child_ids}
+            _LOGGER.debug(
+                "Strip rejected batched energy request, using one per socket: %s",
+                batch.error(),
+            )
+            self._batch_supported = False
+        return {
+            child_id: await self._fetch_child(child_id) for child_id in self._child_ids
+        }
+
+    async def _fetch_batch(self) -> Try[dict[str, ChildEnergyResult]]:
+        request = _multiple_request(
+            [
+                TapoRequest.control_child(child_id, _energy_request())
+                for child_id in self._child_ids
+            ]
+        )
+        response = await self._client.execute_raw_request(request)
+        if not response.is_success():
+            return response
+        try:
+            responses = response.get()["responses"]
+            if len(responses) != len(self._child_ids):
+                return Failure(Exception("Unexpected number of responses"))
+            results = {}
+            for child_id, child_response in zip(self._child_ids, responses):
+                if (error_code := child_response.get("error_code", 0)) != 0:
+                    error = TapoException(
+                        error_code, f"control_child error {error_code}"
+                    )
+                    if is_unsupported_request_error(error):
+                        return Failure(error)
+                    # a socket failing does not fail the others
+                    results[child_id] = (Failure(error), Failure(error))
+                    continue
+                results[child_id] = _parse_energy_responses(
+                    child_response["result"]["responseData"]["result"]["responses"]
+                )
+            return Success(results)
+        except Exception as e:
+            return Failure(e)
+
+    async def _fetch_child(self, child_id: str) -> ChildEnergyResult:
+        response = await self._client.execute_raw_request(
+            TapoRequest.control_child(child_id, _energy_request())
+        )
+        if not response.is_success():
+            return response, response
+        try:
+            return _parse_energy_responses(
+                response.get()["responseData"]["result"]["responses"]
+            )
+        except Exception as e:
+            return Failure(e), Failure(e)
+
 
 class ChildEnergyComponent(DeviceComponent):
     """Energy component for power strip child sockets.
@@ -14,19 +121,20 @@ class ChildEnergyComponent(DeviceComponent):
     library's EnergyComponent only polls the parent device directly.
     """
 
-    def __init__(self, client: TapoClient, child_id: str):
+    def __init__(
+        self,
+        client: TapoClient,
+        child_id: str,
+        fetcher: Optional[StripEnergyFetcher] = None,
+    ):
         self._client = client
         self._child_id = child_id
+        self._fetcher = fetcher or StripEnergyFetcher(client, [child_id], 0)
         self._energy_info: Optional[EnergyInfo] = None
         self._power_info: Optional[PowerInfo] = None
 
     async def update(self, current_state: dict[str, Any] | None = None):
-        energy = await self._client.control_child(
-            self._child_id, TapoRequest.get_energy_usage()
-        )
-        power = await self._client.control_child(
-            self._child_id, TapoRequest.get_current_power()
-        )
+        energy, power = await self._fetcher.fetch(self._child_id)
 
         if energy.is_success():
             energy_dict = dict(energy.value)
@@ -50,3 +158,36 @@ class ChildEnergyComponent(DeviceComponent):
     @property
     def power_info(self) -> Optional[PowerInfo]:
         return self._power_info
+
+
+def _multiple_request(requests: list[TapoRequest]) -> TapoRequest:
+    return TapoRequest.multiple_request(
+        MultipleRequestParams(requests)
+    ).with_request_time_millis(round(time() * 1000))
+
+
+def _energy_request() -> TapoRequest:
+    return _multiple_request(
+        [TapoRequest.get_energy_usage(), TapoRequest.get_current_power()]
+    )
+
+
+def _parse_energy_responses(responses: list[Json]) -> ChildEnergyResult:
+    by_method = {response.get("method"): response for response in responses}
+    return (
+        _response_result(by_method.get("get_energy_usage")),
+        _response_result(by_method.get("get_current_power")),
+    )
+
+
+def _response_result(response: Optional[Json]) -> Try[Json]:
+    if response is None:
+        return Failure(Exception("Missing response from child"))
+    if response.get("error_code", 0) != 0:
+        return Failure(Exception(f"Child request error {response['error_code']}"))
+    return Success(response.get("result", response))
+
+
+def _missing_result(child_id: str) -> ChildEnergyResult:
+    error = Failure(Exception(f"No energy data for socket {child_id}"))
+    return error, error
@@ -0,0 +1,144 @@
+import time
+from typing import Any, Optional
+
+from plugp100.api.tapo_client import TapoClient
+from plugp100.components.countdown import Countdown, RuleTimer, TapoRuleList
+from plugp100.components.energy import EnergyComponent
+from plugp100.devices.base import TapoDevice
+from plugp100.models.energy import EnergyInfo
+from plugp100.models.power import PowerInfo
+
+from custom_components.tapo.device_adapter import set_component
+
+
+class _PollTier:
+    """Tells whether a tier is due, given it refreshes once every N polls.
+
+    It goes by the time elapsed since its last refresh rather than by the
+    updates seen, as refreshes requested after a command update the device
+    out of the polling schedule. Half a poll of slack absorbs the jitter of
+    the scheduled polls.
+    """
+
+    def __init__(self, every: int, interval_s: float):
+        self._every = max(1, every)
+        self._interval_s = interval_s
+        self._refreshed_at: Optional[float] = None
+
+    def mark_refreshed(self) -> None:
+        self._refreshed_at = time.monotonic()
+
+    def is_due(self) -> bool:
+        if (
+            self._every > 1
+            and self._refreshed_at is not None
+            and time.monotonic() - self._refreshed_at
+            < (self._every - 0.5) * self._interval_s
+        ):
+            return False
+        self.mark_refreshed()
+        return True
+
+
+class TieredEnergyComponent(EnergyComponent):
+    """Energy component refreshing current power and energy usage at own rates.
+
+    The readings of `current`, the component it replaces, are kept until
+    their tier is due again.
+    """
+
+    def __init__(
+        self,
+        client: TapoClient,
+        power_every: int,
+        energy_every: int,
+        interval_s: float,
+        current: Optional[EnergyComponent] = None,
+    ):
+        super().__init__(client)
+        self._power_tier = _PollTier(power_every, interval_s)
+        self._energy_tier = _PollTier(energy_every, interval_s)
+        self._energy: Optional[EnergyInfo] = None
+        self._power: Optional[PowerInfo] = None
+        if current is not None:
+            self._energy = current.energy_info
+            self._power = current.power_info
+            self._power_tier.mark_refreshed()
+            self._energy_tier.mark_refreshed()
+
+    async def update(self, current_state: dict[str, Any] | None = None):
+        if self._energy_tier.is_due():
+            energy_usage = await self._client.get_energy_usage()
+            self._energy = energy_usage.value if energy_usage.is_success() else None
+        if self._power_tier.is_due():
+            power_info = await self._client.get_current_power()
+            self._power = power_info.value if power_info.is_success() else None
+
+    @property
+    def energy_info(self) -> Optional[EnergyInfo]:
+        return self._energy
+
+    @property
+    def power_info(self) -> Optional[PowerInfo]:
+        return self._power
+
+
+class TieredCountdown(Countdown):
+    """Countdown component fetching its rules once every N polls.
+
+    The rules of `current`, the component it replaces, are served until the
+    first fetch.
+    """
+
+    def __init__(
+        self,
+        client: TapoClient,
+        every: int,
+        interval_s: float,
+        current: Optional[Countdown] = None,
+    ):
+        super().__init__(client)
+        self._tier = _PollTier(every, interval_s)
+        self._current = current
+        if current is not None:
+            self._tier.mark_refreshed()
+
+    async def update(self, current_state: dict[str, Any] | None = None):
+        if self._tier.is_due():
+            await super().update(current_state)
+            self._current = None
+
+    def get_countdown_rules(self) -> TapoRuleList[RuleTimer]:
+        if self._current is not None:
+            return self._current.get_countdown_rules()
+        return super().get_countdown_rules()
+
+
+def apply_component_tiers(
+    device: TapoDevice,
+    interval_s: float,
+    power_every: int,
+    energy_every: int,
+    countdown_every: int,
+) -> None:
+    """Replace the request issuing components of `device` with tiered ones.
+
+    The tiers are expressed in polls of `interval_s` seconds. The device
+    update already fetched everything, so the tiers start counting from the
+    readings of the replaced components.
+    """
+    # only the plain plugp100 components are replaced, custom ones are kept
+    if type(current := device.get_component(EnergyComponent)) is EnergyComponent:
+        set_component(
+            device,
+            EnergyComponent,
+            TieredEnergyComponent(
+                device.client, power_every, energy_every, interval_s, current
+            ),
+        )
+    if type(current := device.get_component(Countdown)) is Countdown:
+        set_component(
+            device,
+            Countdown,
+            TieredCountdown(device.client, countdown_every, interval_s, current),
+        )
@@ -1,6 +1,7 @@
 """Config flow for tapo integration."""
 
 import dataclasses
+from functools import partial
 import logging
 from typing import Any, Optional
 
@@ -20,12 +21,24 @@ import voluptuous as vol
 
 from custom_components.tapo.const import (
     CONF_ADVANCED_SETTINGS,
+    CONF_BUTTON_IDLE_AFTER,
+    CONF_BUTTON_IDLE_POLLING_RATE,
+    CONF_BUTTON_POLLING_CONTROLLER,
+    CONF_COUNTDOWN_POLLING_EVERY,
     CONF_DISCOVERED_DEVICE_INFO,
+    CONF_ENERGY_POLLING_EVERY,
     CONF_HOST,
     CONF_MAC,
     CONF_PASSWORD,
+    CONF_POWER_POLLING_EVERY,
     CONF_USERNAME,
+    DEFAULT_BUTTON_IDLE_AFTER_S,
+    DEFAULT_BUTTON_IDLE_POLLING_RATE_S,
+    DEFAULT_BUTTON_POLLING_CONTROLLER,
+    DEFAULT_COUNTDOWN_POLLING_EVERY,
+    DEFAULT_ENERGY_POLLING_EVERY,
     DEFAULT_POLLING_RATE_S,
+    DEFAULT_POWER_POLLING_EVERY,
     DOMAIN,
     STEP_ADVANCED_SETTINGS,
     STEP_DISCOVERY_REQUIRE_AUTH,
@@ -33,7 +46,11 @@ from custom_components.tapo.const import (
 )
 from custom_components.tapo.discovery import discover_tapo_device
 from custom_components.tapo.errors import CannotConnect, InvalidAuth, InvalidHost
-from custom_components.tapo.setup_helpers import create_aiohttp_session, get_host_port
+from custom_components.tapo.host_tracking import async_move_device_host
+from custom_components.tapo.hub.polling_controller import POLLING_CONTROLLERS
+from custom_components.tapo.request_limiter import async_connect_device
+from custom_components.tapo.session_pool import get_session_pool
+from custom_components.tapo.setup_helpers import get_host_port
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -83,6 +100,49 @@ def step_options(entry: config_entries.ConfigEntry) -> vol.Schema:
                 description="Polling rate in seconds (e.g. 0.5 seconds means 500ms)",
                 default=entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_POLLING_RATE_S),
             ): vol.All(vol.Coerce(float), vol.Clamp(min=1)),
+            vol.Optional(
+                CONF_POWER_POLLING_EVERY,
+                description="Current power is fetched once every N polls",
+                default=entry.data.get(
+                    CONF_POWER_POLLING_EVERY, DEFAULT_POWER_POLLING_EVERY
+                ),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+            vol.Optional(
+                CONF_ENERGY_POLLING_EVERY,
+                description="Energy usage is fetched once every N polls",
+                default=entry.data.get(
+                    CONF_ENERGY_POLLING_EVERY, DEFAULT_ENERGY_POLLING_EVERY
+                ),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+            vol.Optional(
+                CONF_COUNTDOWN_POLLING_EVERY,
+                description="Countdown rules are fetched once every N polls",
+                default=entry.data.get(
+                    CONF_COUNTDOWN_POLLING_EVERY, DEFAULT_COUNTDOWN_POLLING_EVERY
+                ),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+            vol.Optional(
+                CONF_BUTTON_IDLE_AFTER,
+                description="Seconds without activity before slowing down the "
+                "polling of the hub buttons, 0 to never slow down",
+                default=entry.data.get(
+                    CONF_BUTTON_IDLE_AFTER, DEFAULT_BUTTON_IDLE_AFTER_S
+                ),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+            vol.Optional(
+                CONF_BUTTON_IDLE_POLLING_RATE,
+                description="Polling rate in seconds of idle hub buttons",
+                default=entry.data.get(
+                    CONF_BUTTON_IDLE_POLLING_RATE, DEFAULT_BUTTON_IDLE_POLLING_RATE_S
+                ),
+            ): vol.All(vol.Coerce(float), vol.Clamp(min=1)),
+            vol.Optional(
+                CONF_BUTTON_POLLING_CONTROLLER,
+                description="Algorithm adapting the polling rate of the hub buttons",
+                default=entry.data.get(
+                    CONF_BUTTON_POLLING_CONTROLLER, DEFAULT_BUTTON_POLLING_CONTROLLER
+                ),
+            ): vol.In(list(POLLING_CONTROLLERS)),
         }
     )
 
@@ -209,6 +269,8 @@ class TapoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 existing_entry, discovered_device.ip
             ):
                 return result
+            if await async_move_device_host(self.hass, existing_entry, host):
+                return self.async_abort(reason="already_configured")
 
         self._abort_if_unique_id_configured(updates={CONF_HOST: host})
         self._async_abort_entries_match({CONF_HOST: host})
@@ -304,21 +366,25 @@ class TapoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if not config[CONF_HOST]:
             raise InvalidHost
         try:
-            session = create_aiohttp_session(self.hass)
             credential = AuthCredential(config[CONF_USERNAME], config[CONF_PASSWORD])
-            if discovered_device is None:
-                host, port = get_host_port(config[CONF_HOST])
-                config = DeviceConnectConfiguration(
-                    credentials=credential,
-                    host=host,
-                    port=port,
-                )
-                device = await connect(config=config, session=session)
-            else:
-                device = await connect_discovered_device(
-                    discovered_device, credential, session
-                )
-            await device.update()
+            host, port = get_host_port(config[CONF_HOST])
+            async with get_session_pool(self.hass).probe_session() as session:
+                if discovered_device is None:
+                    config = DeviceConnectConfiguration(
+                        credentials=credential,
+                        host=host,
+                        port=port,
+                    )
+                    connect_device = partial(connect, config=config, session=session)
+                else:
+                    connect_device = partial(
+                        connect_discovered_device,
+                        discovered_device,
+                        credential,
+                        session,
+                    )
+                device = await async_connect_device(self.hass, host, connect_device)
+                await device.update()
             return device
         except InvalidAuthentication as error:
             raise InvalidAuth from error
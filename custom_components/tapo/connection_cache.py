@@ -0,0 +1,89 @@
+import dataclasses
+import logging
+from typing import Any, Optional
+
+from homeassistant.core import HomeAssistant
+from plugp100.devices import DeviceConnectConfiguration, TapoDevice
+from plugp100.models.components import Components
+
+from custom_components.tapo.const import (
+    CONNECTION_CACHE,
+    CONNECTION_CACHE_SAVE_DELAY_S,
+    CONNECTION_CACHE_STORAGE_VERSION,
+)
+from custom_components.tapo.device_adapter import async_apply_state
+from custom_components.tapo.domain_data import TapoDomainStore, async_get_domain_store
+
+_LOGGER = logging.getLogger(__name__)
+
+# protocol name -> (encryption type, encryption version)
+_PROTOCOL_ENCRYPTION = {
+    "Passthrough": ("aes", None),
+    "Klap V1": ("klap", 1),
+    "Klap V2": ("klap", 2),
+}
+
+
+class TapoConnectionCache(TapoDomainStore[dict[str, Any]]):
+    """Persisted connection details of the devices, to speed up restarts.
+
+    For every config entry the working protocol, the device type and the
+    negotiated components are kept, so the next setup can skip protocol
+    guessing and component negotiation. Session keys are never stored: they
+    expire on the device side and would be credential equivalent on disk.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        super().__init__(
+            hass,
+            CONNECTION_CACHE,
+            CONNECTION_CACHE_STORAGE_VERSION,
+            CONNECTION_CACHE_SAVE_DELAY_S,
+        )
+
+    def get(self, entry_id: str) -> Optional[dict[str, Any]]:
+        return self._get(entry_id)
+
+    def save(self, entry_id: str, device: TapoDevice) -> None:
+        encryption = _PROTOCOL_ENCRYPTION.get(device.protocol_version)
+        components = device.components.component_list
+        if encryption is None or not isinstance(components, dict):
+            return
+        self._set(
+            entry_id,
+            {
+                "encryption_type": encryption[0],
+                "encryption_version": encryption[1],
+                "device_type": device.device_info.type,
+                "firmware_version": device.firmware_version,
+                "components": components,
+            },
+        )
+
+    def invalidate(self, entry_id: str) -> None:
+        self._remove(entry_id)
+
+
+async def async_get_connection_cache(hass: HomeAssistant) -> TapoConnectionCache:
+    return await async_get_domain_store(
+        hass, CONNECTION_CACHE, lambda: TapoConnectionCache(hass)
+    )
+
+
+def cached_connect_config(
+    config: DeviceConnectConfiguration, cached: dict[str, Any]
+) -> DeviceConnectConfiguration:
+    return dataclasses.replace(
+        config,
+        device_type=cached["device_type"],
+        encryption_type=cached["encryption_type"],
+        encryption_version=cached["encryption_version"],
+    )
+
+
+async def async_update_with_cached_components(
+    device: TapoDevice, cached: dict[str, Any]
+) -> None:
+    """First device update reusing the cached components, without negotiation."""
+    state = (await device.client.get_device_info()).get_or_raise()
+    await async_apply_state(device, state, Components(cached["components"]))
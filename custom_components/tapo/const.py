@@ -9,8 +9,14 @@ DOMAIN = "tapo"
 VERSION = "3.5.0"
 
 DISCOVERY_FEATURE_FLAG = "discovery"
+DOMAIN_CONFIG = "domain_config"
 DISCOVERY_INTERVAL = timedelta(minutes=10)
 DISCOVERY_TIMEOUT = 5
+DISCOVERY_PORT = 20002
+DISCOVERY_CACHE = "discovery_cache"
+# between two broadcasts known devices are only checked with unicast probes
+DISCOVERY_FULL_SCAN_EVERY = 6
+DISCOVERY_VERIFY_TIMEOUT = 2
 
 ISSUE_URL = "https://github.com/petretiandrea/home-assistant-tapo-p100/issues"
 
@@ -42,6 +48,65 @@ STEP_DISCOVERY_REQUIRE_AUTH = "discovery_auth_confirm"
 
 DEFAULT_POLLING_RATE_S = 30  # 30 seconds
 DEFAULT_BUTTON_POLLING_RATE_MS = 1000  # 1 second
+CONF_BUTTON_IDLE_AFTER = "button_idle_after"
+DEFAULT_BUTTON_IDLE_AFTER_S = 600  # 10 minutes
+CONF_BUTTON_IDLE_POLLING_RATE = "button_idle_polling_rate"
+DEFAULT_BUTTON_IDLE_POLLING_RATE_S = 10
+CONF_BUTTON_POLLING_CONTROLLER = "button_polling_controller"
+DEFAULT_BUTTON_POLLING_CONTROLLER = "ema"
+
+POLL_SCHEDULER = "poll_scheduler"
+POLL_SLOT_WIDTH_S = 1
+# long intervals (e.g. the firmware checks) get wider slots
+POLL_MAX_SLOTS = 600
+
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = 3
+CIRCUIT_BREAKER_MAX_BACKOFF_S = 600  # 10 minutes
+CIRCUIT_BREAKER_PROBE_TIMEOUT_S = 2
+
+ADAPTIVE_TIMEOUT_MIN_S = 0.5
+ADAPTIVE_TIMEOUT_MAX_S = 10
+ADAPTIVE_TIMEOUT_FACTOR = 3
+ADAPTIVE_TIMEOUT_WINDOW = 100
+ADAPTIVE_TIMEOUT_MIN_SAMPLES = 20
+
+CONF_SETUP_CONCURRENCY = "setup_concurrency"
+DEFAULT_SETUP_CONCURRENCY = 4
+
+SESSION_POOL = "session_pool"
+SESSION_POOL_SIZE = 100
+SESSION_KEEPALIVE_S = 60
+
+CONNECTION_CACHE = "connection_cache"
+CONNECTION_CACHE_STORAGE_VERSION = 1
+CONNECTION_CACHE_SAVE_DELAY_S = 10
+
+HUB_BROKER_AGING_S = 2
+
+EVENT_CURSORS = "event_cursors"
+EVENT_CURSORS_STORAGE_VERSION = 1
+EVENT_CURSORS_SAVE_DELAY_S = 5
+
+FIRMWARE_CACHE = "firmware_cache"
+FIRMWARE_CACHE_STORAGE_VERSION = 1
+FIRMWARE_CACHE_SAVE_DELAY_S = 10
+FIRMWARE_CACHE_TTL_S = 24 * 60 * 60
+# the first firmware check after startup is spread over this window
+FIRMWARE_REFRESH_DELAY_MAX_S = 300
+
+REQUEST_LIMITER = "request_limiter"
+HOST_MOVE_LOCKS = "host_move_locks"
+CONF_MAX_CONCURRENT_REQUESTS = "max_concurrent_requests"
+DEFAULT_MAX_CONCURRENT_REQUESTS = 8
+CONF_MAX_HOST_REQUESTS = "max_host_requests"
+DEFAULT_MAX_HOST_REQUESTS = 1
+
+CONF_POWER_POLLING_EVERY = "power_polling_every"
+DEFAULT_POWER_POLLING_EVERY = 1
+CONF_ENERGY_POLLING_EVERY = "energy_polling_every"
+DEFAULT_ENERGY_POLLING_EVERY = 4
+CONF_COUNTDOWN_POLLING_EVERY = "countdown_polling_every"
+DEFAULT_COUNTDOWN_POLLING_EVERY = 4
 
 CONF_ALTERNATIVE_IP = "ip_address"
 
@@ -1,21 +1,32 @@
 from abc import ABC
-from dataclasses import dataclass
+import asyncio
+import dataclasses
+from dataclasses import dataclass, field
 from datetime import timedelta
+from enum import Enum
 import logging
-from typing import Dict, List, Type, TypeVar
+from typing import Any, Dict, Hashable, List, Optional, Type, TypeVar
 
 import aiohttp
-import async_timeout
-from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from plugp100.components.countdown import Countdown
+from plugp100.components.energy import EnergyComponent
 from plugp100.devices.base import TapoDevice
 from plugp100.devices.hub import TapoHub
 from plugp100.errors import InvalidAuthentication, TapoException
 from plugp100.models.child import PowerStripChild
+from plugp100.models.energy import EnergyInfo
+from plugp100.models.power import PowerInfo
 
+from custom_components.tapo.circuit_breaker import DeviceCircuitBreaker
+from custom_components.tapo.components.child_energy_component import (
+    ChildEnergyComponent,
+)
 from custom_components.tapo.const import DOMAIN
 from custom_components.tapo.helpers import _raise_from_tapo_exception
+from custom_components.tapo.scheduler import get_poll_scheduler
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,6 +39,9 @@ class HassTapoDeviceData:
     coordinator: "TapoDataCoordinator"
     config_entry_update_unsub: CALLBACK_TYPE
     child_coordinators: List["TapoDataCoordinator"]
+    setup_diagnostics: dict[str, Any] = field(default_factory=dict)
+    # the entry data the device is running with, to skip reloads on no changes
+    config_data: dict[str, Any] = field(default_factory=dict)
 
 
 # def create_tapo_device(model: str, client: TapoClient) -> Optional[TapoDevice]:
@@ -55,6 +69,7 @@ class TapoDataCoordinator(ABC, DataUpdateCoordinator[StateMap]):
         hass: HomeAssistant,
         device: TapoDevice,
         polling_interval: timedelta,
+        poll_group: Optional[Hashable] = None,
     ):
         self._device = device
         super().__init__(
@@ -67,6 +82,11 @@ class TapoDataCoordinator(ABC, DataUpdateCoordinator[StateMap]):
             ),
         )
         self._states: StateMap = {}
+        self._poll_scheduler = get_poll_scheduler(hass)
+        # coordinators of the same poll group share their scheduler slot
+        self._poll_group = poll_group
+        self._fingerprints: dict[int, Optional[Hashable]] = {}
+        self._circuit_breaker = DeviceCircuitBreaker(device.host, device.port)
         # TODO: expose .state from self.device as raw json
 
     @property
@@ -78,18 +98,129 @@ class TapoDataCoordinator(ABC, DataUpdateCoordinator[StateMap]):
         return isinstance(self.device, TapoHub)
 
     async def _async_update_data(self) -> StateMap:
+        if (
+            self._circuit_breaker.is_open
+            and not await self._circuit_breaker.async_probe()
+        ):
+            raise self._connection_failed("Device unreachable")
         try:
-            async with async_timeout.timeout(10):
-                return await self.poll_update()
+            # every request is bounded by the adaptive timeout of the limiter
+            data = await self.poll_update()
+        except asyncio.TimeoutError as error:
+            raise self._connection_failed(str(error)) from error
         except (InvalidAuthentication, TapoException) as error:
+            # the device answered, so it is reachable
+            self._circuit_breaker.record_success()
             _raise_from_tapo_exception(error, _LOGGER)
-        except aiohttp.ClientError as error:
-            raise UpdateFailed(f"Error communication with API: {str(error)}") from error
+        except (aiohttp.ClientError, OSError) as error:
+            raise self._connection_failed(
+                f"Error communication with API: {str(error)}"
+            ) from error
         except Exception as exception:
             raise UpdateFailed(f"Unexpected exception: {str(exception)}") from exception
+        self._circuit_breaker.record_success()
+        return data
+
+    @callback
+    def async_follow_host(self, host: str) -> None:
+        """Poll the device at its new `host` from scratch, without backoff."""
+        self._circuit_breaker.reset(host, self.device.port)
+
+    def _connection_failed(self, message: str) -> UpdateFailed:
+        retry_after = None
+        if self._update_interval_seconds:
+            retry_after = self._circuit_breaker.record_failure(
+                self._update_interval_seconds
+            )
+        return UpdateFailed(message, retry_after=retry_after)
 
     async def poll_update(self):
         return await self.device.update()
 
+    def state_fingerprint(self, device: TapoDevice) -> Optional[Hashable]:
+        """Hashable snapshot of the state of `device`, None when not computable.
+
+        It is computed once per coordinator update and lets the entities skip
+        writing a state which did not change since their last write.
+        """
+        key = id(device)
+        if key not in self._fingerprints:
+            self._fingerprints[key] = _device_fingerprint(device, self.data)
+        return self._fingerprints[key]
+
+    @callback
+    def async_update_listeners(self) -> None:
+        self._fingerprints.clear()
+        super().async_update_listeners()
+
+    async def async_shutdown(self) -> None:
+        self._poll_scheduler.release(id(self))
+        await super().async_shutdown()
+
+    @callback
+    def _schedule_refresh(self) -> None:
+        # Retries keep the default scheduling, regular ticks follow the
+        # domain wide scheduler slot to avoid polling in lockstep.
+        if self._update_interval_seconds is None or self._retry_after is not None:
+            super()._schedule_refresh()
+            return
+        if self.config_entry and self.config_entry.pref_disable_polling:
+            return
+        self._async_unsub_refresh()
+        loop = self.hass.loop
+        next_refresh = self._poll_scheduler.next_refresh(
+            id(self), loop.time(), self._update_interval_seconds, self._poll_group
+        )
+        self._unsub_refresh = loop.call_at(
+            next_refresh, self._handle_scheduled_refresh
+        ).cancel
+
+    @callback
+    def _handle_scheduled_refresh(self) -> None:
+        if self.config_entry:
+            self.config_entry.async_create_background_task(
+                self.hass,
+                self._handle_refresh_interval(),
+                name=f"{self.name} - {self.config_entry.title} - refresh",
+                eager_start=True,
+            )
+        else:
+            self.hass.async_create_background_task(
+                self._handle_refresh_interval(),
+                name=f"{self.name} - refresh",
+                eager_start=True,
+            )
+
+
+def _device_fingerprint(device: TapoDevice, data: Any) -> Optional[Hashable]:
+    try:
+        components = []
+        for component in device.get_device_components:
+            # components holding state fetched outside of the device info,
+            # strip sockets have their own energy component
+            if isinstance(component, (EnergyComponent, ChildEnergyComponent)):
+                components.append((component.energy_info, component.power_info))
+            elif isinstance(component, Countdown):
+                components.append(component.get_countdown_rules())
+        return _freeze((device.raw_state, components, data))
+    except Exception:
+        return None
+
+
+def _freeze(value: Any) -> Hashable:
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (EnergyInfo, PowerInfo)):
+        return _freeze(value.info)
+    if isinstance(value, Enum):
+        return _freeze(value.value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return _freeze(dataclasses.asdict(value))
+    raise TypeError(f"Cannot fingerprint {type(value)}")
+
 
 PowerStripChildrenState = dict[str, PowerStripChild]
@@ -0,0 +1,138 @@
+"""Access to the plugp100 internals the integration relies on.
+
+plugp100 offers no public way to feed a device a state fetched by someone
+else, to create the children of a hub without updating them one by one, to
+read the id of a child, to register a component under the type of the one
+it replaces, to wrap or re-point the protocol of a client, or to stream the
+replies of a discovery broadcast, so these go through private members of
+plugp100. They are all kept here, to be checked in one place on plugp100
+upgrades.
+"""
+
+import logging
+from typing import Any, Callable, Generator, Optional, TypeVar
+
+from plugp100.api.protocol.tapo_protocol import TapoProtocol
+from plugp100.api.tapo_client import TapoClient
+from plugp100.components.base import DeviceComponent
+from plugp100.components.hub_children import HubChildrenComponent, _hub_child_create
+from plugp100.devices.base import LastUpdate, TapoDevice
+from plugp100.devices.hub import TapoHub
+from plugp100.discovery import TapoDiscovery
+from plugp100.models.child import ChildDeviceList
+from plugp100.models.components import Components
+from plugp100.models.device import DeviceInfo
+
+_LOGGER = logging.getLogger(__name__)
+
+C = TypeVar("C", bound=DeviceComponent)
+P = TypeVar("P", bound=TapoProtocol)
+
+
+def child_id(device: TapoDevice) -> Optional[str]:
+    """Id of `device` within its hub or strip, None for standalone devices."""
+    return device._child_id
+
+
+def is_initialized(device: TapoDevice) -> bool:
+    """Whether `device` was updated once, so its components are set up."""
+    return device._last_update is not None
+
+
+def set_component(device: TapoDevice, component_type: type[C], component: C) -> None:
+    """Register `component` in place of the `component_type` one.
+
+    Unlike TapoDevice.add_component, which registers a component under its
+    own type, get_component(component_type) then returns the replacement.
+    """
+    device._active_components[component_type] = component
+
+
+async def async_apply_state(
+    device: TapoDevice,
+    state: dict[str, Any],
+    components: Optional[Components] = None,
+) -> None:
+    """Update `device` from its device info `state`, fetched by the caller.
+
+    This is TapoDevice.update() without the device info request: the
+    `components` are set up on the first update, later updates keep the
+    ones already set up. The components still refresh from `state` and the
+    ones holding data outside of the device info, like Countdown, issue
+    their own requests to do so.
+    """
+    if device._last_update is None:
+        if components is None:
+            raise ValueError("components are required on the first update")
+        await device._setup_components(components)
+    else:
+        components = device._last_update.components
+    await _async_set_state(device, state, components)
+
+
+async def async_initialize_hub(
+    hub: TapoHub,
+    state: dict[str, Any],
+    components: Components,
+    child_list: ChildDeviceList,
+) -> None:
+    """First update of `hub` from the `state`, `components` and `child_list` given.
+
+    TapoHub.update() creates the children and then updates them one at a
+    time, each with its own device info request and component negotiation.
+    Here they are only created, it is up to the caller to apply their state.
+    """
+    await hub._setup_components(components)
+    # the children are created with the device id of the hub, from its state
+    hub._last_update = LastUpdate(
+        device_info=DeviceInfo(**state), components=components, raw_state=state
+    )
+    if (children := hub.get_component(HubChildrenComponent)) is not None:
+        children._children = []
+        for info in child_list.get_children_base_info():
+            if (child := _hub_child_create(hub, hub.client, info)) is not None:
+                children._children.append(child)
+            else:
+                _LOGGER.warning(
+                    "Found child device not supported, model %s", info.model
+                )
+    await _async_set_state(hub, state, components)
+
+
+async def _async_set_state(
+    device: TapoDevice, state: dict[str, Any], components: Components
+) -> None:
+    device._last_update = LastUpdate(
+        device_info=DeviceInfo(**state), components=components, raw_state=state
+    )
+    await device._update_from_state(state)
+    for component in device.get_device_components:
+        await component.update(state)
+
+
+def set_client_protocol(client: TapoClient, protocol: TapoProtocol) -> None:
+    """Send the requests of `client`, shared by its children, to `protocol`."""
+    client._protocol = protocol
+
+
+def wrap_protocol(client: TapoClient, wrap: Callable[[TapoProtocol], P]) -> P:
+    """Replace the protocol of `client` with `wrap` applied to it."""
+    wrapped = wrap(client.protocol)
+    set_client_protocol(client, wrapped)
+    return wrapped
+
+
+def set_client_url(client: TapoClient, host: str, port: Optional[int]) -> None:
+    """Point the url `client` was created with to `host`."""
+    client._url = f"http://{host}:{port or 80}/app"
+
+
+def scan(
+    broadcast: str, port: int, timeout: float
+) -> Generator[dict[str, Any], None, None]:
+    """Blocking discovery broadcast yielding the replies as they arrive.
+
+    TapoDiscovery.scan() returns only once `timeout` elapsed; closing the
+    returned generator stops the scan before.
+    """
+    return TapoDiscovery(broadcast, port, timeout)._scan()
@@ -6,6 +6,9 @@ from homeassistant.helpers.device_registry import format_mac
 
 from . import HassTapoDeviceData
 from .const import DOMAIN
+from .hub.request_broker import get_hub_request_broker
+from .request_limiter import get_request_limiter
+from .scheduler import get_poll_scheduler
 
 
 async def async_get_config_entry_diagnostics(
@@ -19,10 +22,15 @@ async def async_get_config_entry_diagnostics(
             {"nickname": child.device.nickname, "raw_state": child.device.raw_state}
             for child in data.child_coordinators
         ]
+    broker = get_hub_request_broker(data.coordinator.device)
     return {
         "oui": oui,
         "protocol_name": data.coordinator.device.protocol_version,
         "raw_state": data.coordinator.device.raw_state,
         "components": data.coordinator.device.components,
         "children": children_diagnostics,
+        "setup": data.setup_diagnostics,
+        "poll_scheduler": get_poll_scheduler(hass).diagnostics(),
+        "request_limiter": get_request_limiter(hass).diagnostics(),
+        "hub_request_broker": broker.diagnostics() if broker else None,
     }
@@ -1,35 +1,202 @@
 import asyncio
-from itertools import chain
 import logging
-from typing import Optional
+import threading
+from typing import Any, AsyncIterator, Optional
 
 from homeassistant.components import network
+from homeassistant.config_entries import SOURCE_IGNORE, ConfigEntry, ConfigEntryState
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import (
     device_registry as dr,
 )
 from plugp100.discovery import DiscoveredDevice, TapoDiscovery
 
-from custom_components.tapo.const import DISCOVERY_TIMEOUT
+from custom_components.tapo.const import (
+    CONF_HOST,
+    DISCOVERY_CACHE,
+    DISCOVERY_FULL_SCAN_EVERY,
+    DISCOVERY_PORT,
+    DISCOVERY_TIMEOUT,
+    DISCOVERY_VERIFY_TIMEOUT,
+    DOMAIN,
+)
+from custom_components.tapo.coordinators import HassTapoDeviceData
+from custom_components.tapo.device_adapter import scan
+from custom_components.tapo.domain_data import get_domain_singleton
+from custom_components.tapo.setup_helpers import get_host_port
+
+_LOGGER = logging.getLogger(__name__)
+
 
+async def stream_tapo_devices(
+    hass: HomeAssistant, expected_macs: Optional[set[str]] = None
+) -> AsyncIterator[DiscoveredDevice]:
+    """Yield the devices answering the broadcasts as soon as they reply.
 
-async def discovery_tapo_devices(hass: HomeAssistant) -> dict[str, DiscoveredDevice]:
+    Every device is yielded once, even when it answers on more broadcast
+    addresses. The scans run for DISCOVERY_TIMEOUT, unless all the
+    `expected_macs` answered before.
+    """
     broadcast_addresses = await network.async_get_ipv4_broadcast_addresses(hass)
-    discovery_tasks = [
-        TapoDiscovery.scan(timeout=DISCOVERY_TIMEOUT, broadcast=str(address))
-        for address in broadcast_addresses
-    ]
-    return {
-        dr.format_mac(device.mac): device
-        for device in chain(*await asyncio.gather(*discovery_tasks))
-    }
+    loop = asyncio.get_running_loop()
+    replies: asyncio.Queue[Optional[dict[str, Any]]] = asyncio.Queue()
+    stop = threading.Event()
+
+    def _scan(broadcast: str) -> None:
+        # the scanner blocks between replies, so a stop request is only seen
+        # when the next reply arrives, or at the end of DISCOVERY_TIMEOUT
+        scanner = scan(broadcast, DISCOVERY_PORT, DISCOVERY_TIMEOUT)
+        try:
+            for reply in scanner:
+                if stop.is_set():
+                    break
+                loop.call_soon_threadsafe(replies.put_nowait, reply)
+        finally:
+            # finalize the generator now, releasing its UDP socket
+            scanner.close()
+
+    async def _scan_all() -> None:
+        try:
+            await asyncio.gather(
+                *(
+                    hass.async_add_executor_job(_scan, str(address))
+                    for address in broadcast_addresses
+                ),
+                return_exceptions=True,
+            )
+        finally:
+            replies.put_nowait(None)
+
+    scans = hass.async_create_background_task(_scan_all(), "tapo discovery scan")
+    found: set[str] = set()
+    try:
+        while (reply := await replies.get()) is not None:
+            try:
+                device = DiscoveredDevice.from_dict(reply)
+            except Exception:
+                _LOGGER.debug("Invalid discovery reply: %s", reply, exc_info=True)
+                continue
+            mac = dr.format_mac(device.mac)
+            if mac in found:
+                continue
+            found.add(mac)
+            yield device
+            if expected_macs and expected_macs <= found:
+                break
+    finally:
+        # the scan threads stop at their next reply, or at their timeout
+        stop.set()
+        if not scans.done():
+            scans.cancel()
 
 
 async def discover_tapo_device(
     ip: str,
+    timeout: int = DISCOVERY_TIMEOUT,
 ) -> Optional[DiscoveredDevice]:
     try:
-        return await TapoDiscovery.single_scan(ip, DISCOVERY_TIMEOUT)
+        return await TapoDiscovery.single_scan(ip, timeout)
     except Exception:
         logging.error("Failed during discovery of device with ip {}", ip)
         return None
+
+
+class TapoDiscoveryCache:
+    """Devices found by the periodic discovery, keyed by MAC.
+
+    Only devices never seen before, or seen at a different address, are
+    reported, and configured or ignored devices are reported only when their
+    address changed. A full broadcast runs once every
+    DISCOVERY_FULL_SCAN_EVERY rounds; in between, configured devices failing
+    to set up or to poll are checked with a unicast probe at their address,
+    and a broadcast is brought forward only when one of them is not found
+    there, stopping as soon as all of them answered. Devices with neither an
+    entry nor a discovery flow are forgotten, to be offered again.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        self._hass = hass
+        self._devices: dict[str, DiscoveredDevice] = {}
+        self._rounds = 0
+
+    async def async_discover(self) -> AsyncIterator[DiscoveredDevice]:
+        """Run a discovery round, yielding the new or moved devices."""
+        full_scan = self._rounds % DISCOVERY_FULL_SCAN_EVERY == 0
+        self._rounds += 1
+        self._forget_unclaimed_devices()
+        missing = None
+        if not full_scan and not (missing := await self._async_missing_devices()):
+            return
+        async for device in stream_tapo_devices(self._hass, missing):
+            mac = dr.format_mac(device.mac)
+            changed = self._is_new_or_moved(mac, device)
+            self._devices[mac] = device
+            if changed:
+                _LOGGER.debug("Discovered new or moved device %s", mac)
+                yield device
+
+    def _is_new_or_moved(self, mac: str, device: DiscoveredDevice) -> bool:
+        entry = self._hass.config_entries.async_entry_for_domain_unique_id(DOMAIN, mac)
+        if entry is not None:
+            return entry.source != SOURCE_IGNORE and _entry_ip(entry) != device.ip
+        known = self._devices.get(mac)
+        return known is None or known.ip != device.ip
+
+    def _forget_unclaimed_devices(self) -> None:
+        claimed = {
+            entry.unique_id for entry in self._hass.config_entries.async_entries(DOMAIN)
+        } | {
+            flow["context"].get("unique_id")
+            for flow in self._hass.config_entries.flow.async_progress_by_handler(DOMAIN)
+        }
+        self._devices = {
+            mac: device for mac, device in self._devices.items() if mac in claimed
+        }
+
+    async def _async_missing_devices(self) -> set[str]:
+        """MAC of the devices to check which did not answer at their address."""
+        entries = [
+            entry
+            for entry in self._hass.config_entries.async_entries(DOMAIN)
+            if _needs_verification(self._hass, entry)
+        ]
+        found = await asyncio.gather(
+            *(
+                discover_tapo_device(_entry_ip(entry), DISCOVERY_VERIFY_TIMEOUT)
+                for entry in entries
+            )
+        )
+        return {
+            entry.unique_id
+            for entry, device in zip(entries, found)
+            if device is None or dr.format_mac(device.mac) != entry.unique_id
+        }
+
+
+def _entry_ip(entry: ConfigEntry) -> Optional[str]:
+    """Address of the device of `entry`, without the port the host may carry."""
+    if (host := entry.data.get(CONF_HOST)) is None:
+        return None
+    return get_host_port(host)[0]
+
+
+def _needs_verification(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    if (
+        entry.source == SOURCE_IGNORE
+        or entry.unique_id is None
+        or CONF_HOST not in entry.data
+    ):
+        return False
+    if entry.state in (ConfigEntryState.SETUP_ERROR, ConfigEntryState.SETUP_RETRY):
+        return True
+    # a device changing address while loaded fails its polls
+    data: Optional[HassTapoDeviceData] = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    return (
+        entry.state is ConfigEntryState.LOADED
+        and data is not None
+        and not data.coordinator.last_update_success
+    )
+
+
+def get_discovery_cache(hass: HomeAssistant) -> TapoDiscoveryCache:
+    return get_domain_singleton(hass, DISCOVERY_CACHE, lambda: TapoDiscoveryCache(hass))
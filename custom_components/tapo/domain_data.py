@@ -0,0 +1,65 @@
+import asyncio
+from typing import Callable, Generic, Optional, TypeVar
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from custom_components.tapo.const import DOMAIN
+
+T = TypeVar("T")
+V = TypeVar("V")
+S = TypeVar("S", bound="TapoDomainStore")
+
+
+def get_domain_singleton(hass: HomeAssistant, key: str, factory: Callable[[], T]) -> T:
+    """Domain wide object kept under `key`, created by `factory` on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if key not in domain_data:
+        domain_data[key] = factory()
+    return domain_data[key]
+
+
+class TapoDomainStore(Generic[V]):
+    """Domain wide dict persisted in the `tapo.<key>` storage file.
+
+    It is loaded once, by the first caller of async_load, and reads as empty
+    before. Changes are saved after `save_delay_s`, and flushed on shutdown.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, key: str, version: int, save_delay_s: float
+    ):
+        self._store: Store[dict[str, V]] = Store(hass, version, f"{DOMAIN}.{key}")
+        self._save_delay_s = save_delay_s
+        self._load_lock = asyncio.Lock()
+        self._data: Optional[dict[str, V]] = None
+
+    async def async_load(self) -> None:
+        async with self._load_lock:
+            if self._data is None:
+                self._data = await self._store.async_load() or {}
+
+    def _get(self, key: str) -> Optional[V]:
+        return (self._data or {}).get(key)
+
+    def _set(self, key: str, value: V) -> None:
+        if self._get(key) != value:
+            self._data = {**(self._data or {}), key: value}
+            self._async_schedule_save()
+
+    def _remove(self, key: str) -> None:
+        if self._get(key) is not None:
+            self._data.pop(key)
+            self._async_schedule_save()
+
+    def _async_schedule_save(self) -> None:
+        self._store.async_delay_save(lambda: self._data or {}, self._save_delay_s)
+
+
+async def async_get_domain_store(
+    hass: HomeAssistant, key: str, factory: Callable[[], S]
+) -> S:
+    """Domain wide store kept under `key`, loaded before being returned."""
+    store = get_domain_singleton(hass, key, factory)
+    await store.async_load()
+    return store
@@ -1,4 +1,5 @@
 import logging
+from typing import Hashable, Optional
 
 from homeassistant.core import callback
 from homeassistant.helpers import device_registry, device_registry as dr
@@ -15,6 +16,9 @@ _LOGGER = logging.getLogger(__name__)
 class CoordinatedTapoEntity(CoordinatorEntity[TapoDataCoordinator]):
     _attr_has_entity_name = True
     _attr_name = None
+    # entities whose state is not derived from the device state must opt out
+    _skip_unchanged_writes = True
+    _written_fingerprint: Optional[Hashable] = None
 
     def __init__(self, coordinator: TapoDataCoordinator, device: TapoDevice):
         super().__init__(coordinator)
@@ -41,4 +45,22 @@ class CoordinatedTapoEntity(CoordinatorEntity[TapoDataCoordinator]):
 
     @callback
     def _handle_coordinator_update(self) -> None:
+        fingerprint = self._state_fingerprint()
+        if fingerprint is not None and fingerprint == self._written_fingerprint:
+            return
         self.async_write_ha_state()
+        self._written_fingerprint = fingerprint
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        # a write outside of a coordinator update may change the state anyhow
+        self._written_fingerprint = None
+        super().async_write_ha_state()
+
+    def _state_fingerprint(self) -> Optional[Hashable]:
+        if not self._skip_unchanged_writes:
+            return None
+        device_fingerprint = self.coordinator.state_fingerprint(self.device)
+        if device_fingerprint is None:
+            return None
+        return self.available, device_fingerprint
@@ -0,0 +1,56 @@
+import dataclasses
+import time
+from typing import Any, Optional
+
+from homeassistant.core import HomeAssistant
+from plugp100.devices.base import TapoDevice
+from plugp100.models.firmware import LatestFirmware
+
+from custom_components.tapo.const import (
+    FIRMWARE_CACHE,
+    FIRMWARE_CACHE_SAVE_DELAY_S,
+    FIRMWARE_CACHE_STORAGE_VERSION,
+    FIRMWARE_CACHE_TTL_S,
+)
+from custom_components.tapo.domain_data import TapoDomainStore, async_get_domain_store
+
+
+def firmware_key(device: TapoDevice) -> str:
+    """Devices sharing the key get the same answer to a firmware check."""
+    return "/".join(
+        (device.model, device.device_info.hardware_version, device.firmware_version)
+    )
+
+
+class TapoFirmwareCache(TapoDomainStore[dict[str, Any]]):
+    """Persisted result of the latest firmware checks.
+
+    Results are kept by model, hardware and firmware version, so all the
+    devices of a kind share one check, and they are trusted for
+    FIRMWARE_CACHE_TTL_S, across restarts too.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        super().__init__(
+            hass,
+            FIRMWARE_CACHE,
+            FIRMWARE_CACHE_STORAGE_VERSION,
+            FIRMWARE_CACHE_SAVE_DELAY_S,
+        )
+
+    def get(self, key: str) -> Optional[LatestFirmware]:
+        entry = self._get(key)
+        if entry is None or time.time() - entry["checked_at"] > FIRMWARE_CACHE_TTL_S:
+            return None
+        return LatestFirmware(**entry["latest"])
+
+    def save(self, key: str, latest: LatestFirmware) -> None:
+        self._set(
+            key, {"checked_at": time.time(), "latest": dataclasses.asdict(latest)}
+        )
+
+
+async def async_get_firmware_cache(hass: HomeAssistant) -> TapoFirmwareCache:
+    return await async_get_domain_store(
+        hass, FIRMWARE_CACHE, lambda: TapoFirmwareCache(hass)
+    )
@@ -1,6 +1,10 @@
 from datetime import timedelta
+from functools import partial
 import logging
+import time
+from typing import Any
 
+import aiohttp
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_SCAN_INTERVAL
 from homeassistant.core import HomeAssistant
@@ -10,16 +14,38 @@ from plugp100.discovery import DiscoveredDevice, connect_discovered_device
 
 from custom_components.tapo.components.child_energy_component import (
     ChildEnergyComponent,
+    StripEnergyFetcher,
+)
+from custom_components.tapo.components.tiered_components import apply_component_tiers
+from custom_components.tapo.connection_cache import (
+    async_get_connection_cache,
+    async_update_with_cached_components,
+    cached_connect_config,
 )
 from custom_components.tapo.const import (
+    CONF_COUNTDOWN_POLLING_EVERY,
     CONF_DISCOVERED_DEVICE_INFO,
+    CONF_ENERGY_POLLING_EVERY,
+    CONF_POWER_POLLING_EVERY,
+    CONF_SETUP_CONCURRENCY,
+    DEFAULT_COUNTDOWN_POLLING_EVERY,
+    DEFAULT_ENERGY_POLLING_EVERY,
     DEFAULT_POLLING_RATE_S,
+    DEFAULT_POWER_POLLING_EVERY,
+    DEFAULT_SETUP_CONCURRENCY,
     DOMAIN,
     PLATFORMS,
 )
 from custom_components.tapo.coordinators import HassTapoDeviceData, TapoDataCoordinator
+from custom_components.tapo.device_adapter import child_id, set_component
+from custom_components.tapo.helpers import gather_with_concurrency
+from custom_components.tapo.host_tracking import entry_needs_reload
 from custom_components.tapo.hub.hass_tapo_hub import HassTapoHub, TapoHub
-from custom_components.tapo.setup_helpers import create_aiohttp_session
+from custom_components.tapo.request_limiter import async_connect_device
+from custom_components.tapo.setup_helpers import (
+    create_aiohttp_session,
+    get_domain_option,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,19 +56,26 @@ class HassTapo:
         self.config = config
 
     async def initialize_device(self, hass: HomeAssistant) -> bool:
-        session = create_aiohttp_session(hass)
-        if discover_data := self.entry.data.get(CONF_DISCOVERED_DEVICE_INFO):
-            _LOGGER.info("Found discovered data, avoid to guess protocol")
-            discovered_device = DiscoveredDevice.from_dict(discover_data)
-            device = await connect_discovered_device(
-                discovered_device=discovered_device,
-                credentials=self.config.credentials,
-                session=session,
-            )
-        else:
-            device = await connect(config=self.config, session=session)
+        cache = await async_get_connection_cache(hass)
+        device = None
+        if cached := cache.get(self.entry.entry_id):
+            try:
+                device = await self._connect_from_cache(hass, cached)
+            except (aiohttp.ClientConnectionError, OSError):
+                # the device is offline, the cached connection may still be right
+                raise
+            except Exception:
+                _LOGGER.debug(
+                    "Cached connection of %s not working, connecting from scratch",
+                    self.config.host,
+                    exc_info=True,
+                )
+            if device is None:
+                cache.invalidate(self.entry.entry_id)
+        if device is None:
+            device = await self._connect(hass)
+        cache.save(self.entry.entry_id, device)
 
-        await device.update()
         _LOGGER.info("Detected model of %s: %s", str(device.host), str(device.model))
         if isinstance(device, TapoHub):
             hub = HassTapoHub(self.entry, device)
@@ -51,8 +84,63 @@ class HassTapo:
             polling_rate = timedelta(
                 seconds=self.entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_POLLING_RATE_S)
             )
+            apply_component_tiers(
+                device,
+                polling_rate.total_seconds(),
+                power_every=self.entry.data.get(
+                    CONF_POWER_POLLING_EVERY, DEFAULT_POWER_POLLING_EVERY
+                ),
+                energy_every=self.entry.data.get(
+                    CONF_ENERGY_POLLING_EVERY, DEFAULT_ENERGY_POLLING_EVERY
+                ),
+                countdown_every=self.entry.data.get(
+                    CONF_COUNTDOWN_POLLING_EVERY, DEFAULT_COUNTDOWN_POLLING_EVERY
+                ),
+            )
             return await self._initialize_device(hass, device, polling_rate)
 
+    async def _connect_from_cache(
+        self, hass: HomeAssistant, cached: dict[str, Any]
+    ) -> TapoDevice | None:
+        session = create_aiohttp_session(hass, self.config.host)
+        device = await async_connect_device(
+            hass,
+            self.config.host,
+            partial(
+                connect,
+                config=cached_connect_config(self.config, cached),
+                session=session,
+            ),
+        )
+        try:
+            await async_update_with_cached_components(device, cached)
+        except BaseException:
+            await device.client.close()
+            raise
+        if device.firmware_version != cached["firmware_version"]:
+            _LOGGER.info("Firmware of %s changed, negotiating again", device.host)
+            await device.client.close()
+            return None
+        return device
+
+    async def _connect(self, hass: HomeAssistant) -> TapoDevice:
+        session = create_aiohttp_session(hass, self.config.host)
+        if discover_data := self.entry.data.get(CONF_DISCOVERED_DEVICE_INFO):
+            _LOGGER.info("Found discovered data, avoid to guess protocol")
+            discovered_device = DiscoveredDevice.from_dict(discover_data)
+            connect_device = partial(
+                connect_discovered_device,
+                discovered_device=discovered_device,
+                credentials=self.config.credentials,
+                session=session,
+            )
+        else:
+            connect_device = partial(connect, config=self.config, session=session)
+
+        device = await async_connect_device(hass, self.config.host, connect_device)
+        await device.update()
+        return device
+
     async def _initialize_device(
         self, hass: HomeAssistant, device: TapoDevice, polling_rate: timedelta
     ):
@@ -62,24 +150,11 @@ class HassTapo:
         )  # could raise ConfigEntryNotReady
 
         child_coordinators = []
+        setup_diagnostics: dict[str, Any] = {}
         if isinstance(device, TapoPlug) and device.is_strip:
-            for socket in device.sockets:
-                # Register ChildEnergyComponent under the EnergyComponent key so that
-                # has_component/get_component(EnergyComponent) work transparently downstream.
-                socket._active_components[EnergyComponent] = ChildEnergyComponent(
-                    device.client, socket._child_id
-                )
-                socket_coordinator = TapoDataCoordinator(hass, socket, polling_rate)
-                try:
-                    await socket_coordinator.async_config_entry_first_refresh()
-                    child_coordinators.append(socket_coordinator)
-                except Exception:
-                    _LOGGER.warning(
-                        "Failed to set up energy coordinator for socket %s (%s); skipping",
-                        socket.nickname,
-                        socket._child_id,
-                        exc_info=True,
-                    )
+            child_coordinators = await self._setup_sockets(
+                hass, device, polling_rate, setup_diagnostics
+            )
 
         hass.data[DOMAIN][self.entry.entry_id] = HassTapoDeviceData(
             coordinator=coordinator,
@@ -88,12 +163,83 @@ class HassTapo:
             ),
             child_coordinators=child_coordinators,
             device=device,
+            setup_diagnostics=setup_diagnostics,
+            config_data=dict(self.entry.data),
         )
 
         await hass.config_entries.async_forward_entry_setups(self.entry, PLATFORMS)
         return True
 
+    async def _setup_sockets(
+        self,
+        hass: HomeAssistant,
+        device: TapoPlug,
+        polling_rate: timedelta,
+        setup_diagnostics: dict[str, Any],
+    ) -> list[TapoDataCoordinator]:
+        # Sockets polled in the same cycle share one strip-wide energy request,
+        # so they share the scheduler slot of the strip too.
+        energy_fetcher = StripEnergyFetcher(
+            device.client,
+            [child_id(socket) for socket in device.sockets],
+            validity=polling_rate.total_seconds() / 2,
+        )
+        socket_coordinators = []
+        for socket in device.sockets:
+            # Register ChildEnergyComponent under the EnergyComponent key so that
+            # has_component/get_component(EnergyComponent) work transparently downstream.
+            set_component(
+                socket,
+                EnergyComponent,
+                ChildEnergyComponent(device.client, child_id(socket), energy_fetcher),
+            )
+            socket_coordinators.append(
+                TapoDataCoordinator(
+                    hass, socket, polling_rate, poll_group=device.device_id
+                )
+            )
+
+        # Sockets are refreshed concurrently and fail in isolation: a broken
+        # socket is skipped without holding back or failing the others.
+        concurrency = get_domain_option(
+            hass, CONF_SETUP_CONCURRENCY, DEFAULT_SETUP_CONCURRENCY
+        )
+        refresh_start = time.monotonic()
+        results = await gather_with_concurrency(
+            concurrency,
+            [
+                coordinator.async_config_entry_first_refresh()
+                for coordinator in socket_coordinators
+            ],
+            return_exceptions=True,
+        )
+
+        child_coordinators = []
+        for coordinator, result in zip(socket_coordinators, results):
+            if isinstance(result, BaseException):
+                _LOGGER.warning(
+                    "Failed to set up energy coordinator for socket %s (%s); skipping",
+                    coordinator.device.nickname,
+                    child_id(coordinator.device),
+                    exc_info=result,
+                )
+            else:
+                child_coordinators.append(coordinator)
+
+        setup_diagnostics.update(
+            {
+                "sockets_count": len(socket_coordinators),
+                "sockets_failed": len(socket_coordinators) - len(child_coordinators),
+                "sockets_refresh_concurrency": concurrency,
+                "sockets_refresh_ms": round(
+                    (time.monotonic() - refresh_start) * 1000, 1
+                ),
+            }
+        )
+        return child_coordinators
+
 
 async def _on_options_update_listener(hass: HomeAssistant, config_entry: ConfigEntry):
     """Handle options update."""
-    await hass.config_entries.async_reload(config_entry.entry_id)
+    if entry_needs_reload(hass, config_entry):
+        await hass.config_entries.async_reload(config_entry.entry_id)
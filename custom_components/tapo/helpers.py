@@ -1,5 +1,6 @@
+import asyncio
 from logging import Logger
-from typing import Optional, TypeVar
+from typing import Awaitable, Iterable, Optional, TypeVar
 
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import UpdateFailed
@@ -8,11 +9,51 @@ from plugp100.errors import InvalidAuthentication, TapoError, TapoException
 
 T = TypeVar("T")
 
+# error codes of devices rejecting a request itself (unknown method, invalid
+# request or params), as opposed to transient failures
+_UNSUPPORTED_REQUEST_ERROR_CODES = {
+    TapoError.INVALID_REQUEST.value,
+    TapoError.INVALID_JSON.value,
+    TapoError.ERR_PARAMS.value,
+    -40106,  # unknown method
+}
+
 
 def value_optional(tri: Try[T]) -> Optional[T]:
     return tri.get() if tri.is_success() else None
 
 
+def is_unsupported_request_error(error: Exception) -> bool:
+    return (
+        isinstance(error, TapoException)
+        and error.error_code in _UNSUPPORTED_REQUEST_ERROR_CODES
+    )
+
+
+async def gather_with_concurrency(
+    limit: int, awaitables: Iterable[Awaitable[T]], return_exceptions: bool = False
+) -> list[T | BaseException]:
+    """Await `awaitables` with at most `limit` of them running at once.
+
+    Unless `return_exceptions` is set, the first failure cancels the others
+    before it is raised, so none of them outlives the caller.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _bounded(awaitable: Awaitable[T]) -> T:
+        async with semaphore:
+            return await awaitable
+
+    tasks = [asyncio.ensure_future(_bounded(awaitable)) for awaitable in awaitables]
+    try:
+        return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
 def clamp(value, min_value, max_value):
     return max(min(value, max_value), min_value)
 
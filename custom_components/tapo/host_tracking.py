@@ -0,0 +1,184 @@
+import asyncio
+from collections import defaultdict
+import dataclasses
+from functools import partial
+import logging
+from typing import Optional
+
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+from plugp100.api.protocol.tapo_protocol import TapoProtocol
+from plugp100.api.requests.tapo_request import TapoRequest
+from plugp100.devices import TapoDevice, connect
+from plugp100.discovery import DiscoveredDevice
+
+from custom_components.tapo.connection_cache import (
+    async_get_connection_cache,
+    cached_connect_config,
+)
+from custom_components.tapo.const import CONF_HOST, CONF_MAC, DOMAIN, HOST_MOVE_LOCKS
+from custom_components.tapo.coordinators import HassTapoDeviceData
+from custom_components.tapo.device_adapter import set_client_protocol, set_client_url
+from custom_components.tapo.domain_data import get_domain_singleton
+from custom_components.tapo.hub.request_broker import (
+    HubBrokerProtocol,
+    HubRequestBroker,
+    get_hub_request_broker,
+)
+from custom_components.tapo.request_limiter import (
+    LimitedTapoProtocol,
+    ProtocolWrapper,
+    async_connect_device,
+)
+from custom_components.tapo.session_pool import get_session_pool
+from custom_components.tapo.setup_helpers import (
+    create_aiohttp_session,
+    create_device_config,
+    get_host_port,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_move_device_host(
+    hass: HomeAssistant, entry: ConfigEntry, host: str
+) -> bool:
+    """Point the live device of a loaded `entry` to `host`, without a reload.
+
+    A new transport is opened towards `host` and checked to reach the same
+    device (by MAC) before it replaces the previous one inside the protocol
+    wrappers, so coordinators and entities keep working on the same device
+    objects; their circuit breakers follow the device and it is polled at
+    once, without waiting out the backoff of the old address. Moves of the
+    same entry run one at a time. Returns False when the entry is not loaded
+    or the device does not answer at `host`, leaving the caller to fall back
+    to a reload.
+    """
+    async with _host_move_lock(hass, entry.entry_id):
+        return await _async_move_device_host(hass, entry, host)
+
+
+async def _async_move_device_host(
+    hass: HomeAssistant, entry: ConfigEntry, host: str
+) -> bool:
+    data: Optional[HassTapoDeviceData] = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    old_host, port = get_host_port(entry.data[CONF_HOST])
+    if entry.state is not ConfigEntryState.LOADED or data is None:
+        return False
+    # a concurrent move may have completed while waiting for the lock
+    if old_host == host:
+        return True
+
+    protocol = await _async_connect_transport(
+        hass, entry, host, port, get_hub_request_broker(data.device)
+    )
+    if protocol is None:
+        return False
+    previous = _replace_transport(data.device, protocol, host)
+    for child in (
+        *getattr(data.device, "children", []),
+        *getattr(data.device, "sockets", []),
+    ):
+        if child.host == old_host:
+            child.host = host
+    coordinators = [data.coordinator, *data.child_coordinators]
+    for coordinator in coordinators:
+        coordinator.async_follow_host(host)
+    _LOGGER.info("Device %s moved from %s to %s", entry.unique_id, old_host, host)
+
+    new_host = host if ":" not in entry.data[CONF_HOST] else f"{host}:{port}"
+    data.config_data = {**entry.data, CONF_HOST: new_host}
+    hass.config_entries.async_update_entry(entry, data=data.config_data)
+    await previous.close()
+    await get_session_pool(hass).async_release(old_host)
+    # hub children are refreshed by the hub poll, the others poll on their own
+    for coordinator in coordinators[:1] if data.coordinator.is_hub else coordinators:
+        await coordinator.async_request_refresh()
+    return True
+
+
+async def async_move_discovered_devices(
+    hass: HomeAssistant, discovered_devices: dict[str, DiscoveredDevice]
+) -> dict[str, DiscoveredDevice]:
+    """Move the loaded entries of the discovered devices to their new address.
+
+    Returns the devices still needing a discovery flow.
+    """
+    entries = {
+        dr.format_mac(entry.data[CONF_MAC]): entry
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.data.get(CONF_MAC)
+    }
+    remaining = {}
+    for mac, device in discovered_devices.items():
+        entry = entries.get(mac)
+        if entry is None or not await async_move_device_host(hass, entry, device.ip):
+            remaining[mac] = device
+    return remaining
+
+
+def entry_needs_reload(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Whether `entry` changed since the live device was set up from it."""
+    data: Optional[HassTapoDeviceData] = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    return data is None or dict(entry.data) != data.config_data
+
+
+def _host_move_lock(hass: HomeAssistant, entry_id: str) -> asyncio.Lock:
+    locks = get_domain_singleton(
+        hass, HOST_MOVE_LOCKS, lambda: defaultdict(asyncio.Lock)
+    )
+    return locks[entry_id]
+
+
+async def _async_connect_transport(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    host: str,
+    port: int,
+    broker: Optional[HubRequestBroker],
+) -> Optional[TapoProtocol]:
+    config = dataclasses.replace(create_device_config(entry), host=host, port=port)
+    cache = await async_get_connection_cache(hass)
+    if cached := cache.get(entry.entry_id):
+        config = cached_connect_config(config, cached)
+    try:
+        device = await async_connect_device(
+            hass,
+            host,
+            partial(connect, config=config, session=create_aiohttp_session(hass, host)),
+        )
+    except Exception:
+        _LOGGER.debug("Failed to connect to %s", host, exc_info=True)
+        return None
+    # the check waits its turn like any other request to the device, then
+    # only the raw transport is swapped in
+    limited = device.client.protocol
+    checking = limited if broker is None else HubBrokerProtocol(limited, broker)
+    info = await checking.send_request(TapoRequest.get_device_info())
+    if info.is_success() and dr.format_mac(
+        info.get().result.get("mac", "")
+    ) == dr.format_mac(entry.data.get(CONF_MAC) or entry.unique_id or ""):
+        return limited.inner
+    _LOGGER.debug("Device %s not found at %s", entry.unique_id, host)
+    await limited.close()
+    return None
+
+
+def _replace_transport(
+    device: TapoDevice, protocol: TapoProtocol, host: str
+) -> TapoProtocol:
+    """Swap the transport under the protocol wrappers, returning the old one."""
+    wrapper: Optional[ProtocolWrapper] = None
+    previous = device.client.protocol
+    while isinstance(previous, ProtocolWrapper):
+        if isinstance(previous, LimitedTapoProtocol):
+            previous.follow_host(host)
+        wrapper, previous = previous, previous.inner
+    if wrapper is None:
+        set_client_protocol(device.client, protocol)
+    else:
+        wrapper.inner = protocol
+    set_client_url(device.client, host, device.port)
+    device.host = host
+    return previous
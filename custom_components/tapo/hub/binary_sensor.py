@@ -36,7 +36,7 @@ async def async_setup_entry(
             for (component, cls) in COMPONENT_MAPPING.items()
             if child_coordinator.device.has_component(component)
         ]
-        async_add_entities(sensors, True)
+        async_add_entities(sensors)
 
 
 class SmartDoorSensor(CoordinatedTapoEntity, BinarySensorEntity):
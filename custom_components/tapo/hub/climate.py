@@ -25,7 +25,7 @@ async def async_setup_entry(
     for child_coordinator in data.child_coordinators:
         device = child_coordinator.device
         if isinstance(device, KE100Device):
-            async_add_entities([TRVClimate(child_coordinator, device)], True)
+            async_add_entities([TRVClimate(child_coordinator, device)])
 
 
 class TRVClimate(CoordinatedTapoEntity, ClimateEntity):
@@ -1,244 +1,422 @@
 import asyncio
 from dataclasses import dataclass
-from datetime import timedelta
 import logging
 import time
-from typing import Callable, cast
+from typing import Any, Callable, Optional, cast
 
 from homeassistant.components.event import EventDeviceClass, EventEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
-from homeassistant.core import CoreState, HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
+from plugp100.api.requests.tapo_request import MultipleRequestParams, TapoRequest
+from plugp100.api.requests.trigger_logs_params import GetTriggerLogsParams
+from plugp100.common.functional.tri import Failure, Success, Try
+from plugp100.components.motion_sensor import MotionSensorComponent
+from plugp100.components.smart_door import SmartDoorComponent
 from plugp100.components.trigger_log import TriggerLogComponent
+from plugp100.devices.base import TapoDevice
 from plugp100.devices.children.trigger_button import TriggerButtonDevice
 from plugp100.models.hub_children.button import (
     DoubleClickEvent,
     RotationEvent,
     S200BEvent,
     SingleClickEvent,
+    parse_s200b_event,
+)
+from plugp100.models.hub_children.logs import TriggerLogResponse
+
+from custom_components.tapo.const import (
+    CONF_BUTTON_IDLE_AFTER,
+    CONF_BUTTON_IDLE_POLLING_RATE,
+    CONF_BUTTON_POLLING_CONTROLLER,
+    DEFAULT_BUTTON_IDLE_AFTER_S,
+    DEFAULT_BUTTON_IDLE_POLLING_RATE_S,
+    DEFAULT_BUTTON_POLLING_CONTROLLER,
+    DOMAIN,
 )
-
-from custom_components.tapo.const import DOMAIN
 from custom_components.tapo.coordinators import HassTapoDeviceData, TapoDataCoordinator
+from custom_components.tapo.device_adapter import child_id
 from custom_components.tapo.entity import CoordinatedTapoEntity
+from custom_components.tapo.helpers import is_unsupported_request_error
+from custom_components.tapo.hub.event_cursors import (
+    TapoEventCursorStore,
+    async_get_event_cursor_store,
+)
+from custom_components.tapo.hub.polling_controller import (
+    POLLING_CONTROLLERS,
+    AdaptivePollingState,
+    EmaPollingController,
+    PollingController,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
-# Cache validity window — within the same update cycle, all entities
-# reuse the same event log fetch instead of hitting the hub 3 times.
-_CACHE_VALIDITY_S = 0.2
+# Each cycle only probes the latest event of every button; pages are fetched
+# only to catch up when more events happened since the last one seen.
+EVENT_LOG_PROBE_SIZE = 1
+EVENT_LOG_PAGE_SIZE = 10
+EVENT_LOG_MAX_CATCH_UP_PAGES = 10
+
+EventLogs = TriggerLogResponse[S200BEvent]
 
 
 @dataclass
 class EventLogPollResult:
-    logs: object
+    # the events newer than the previous result, oldest first
+    events: list[S200BEvent]
     latency_ms: float
 
 
-@dataclass
-class AdaptivePollingState:
-    latency_ms: float | None = None
-    ema_ms: float | None = None
-    ema_jitter_ms: float | None = None
-    computed_interval_ms: float | None = None
-    cycles_since_change: int = 0
-
-
 EventLogListener = Callable[[EventLogPollResult | None], None]
 
 
-def _get_hub_lock(hass, entry_id):
-    """Get or create a per-hub asyncio.Lock to serialize event log fetches.
-
-    All child devices on the same hub share one lock so HTTP requests
-    to the hub never overlap, which keeps latency low.
-    """
-    key = f"tapo_hub_event_lock_{entry_id}"
-    lock = hass.data.get(key)
-    if lock is None:
-        lock = asyncio.Lock()
-        hass.data[key] = lock
-    return lock
-
-
-async def fetch_event_logs(coordinator, device, page_size=5, hass=None, entry_id=None):
-    """Fetch event logs with per-cycle caching on the coordinator.
-
-    Returns (logs, latency_ms). The first caller in each update cycle
-    does the actual HTTP request; subsequent callers get the cached result.
-    A per-hub lock serializes requests across child devices.
-    """
-    cache = getattr(coordinator, "_event_log_cache", None)
-    now = time.monotonic()
-
-    if cache and (now - cache["timestamp"]) < _CACHE_VALIDITY_S:
-        return cache["logs"], cache["latency_ms"]
-
-    # Acquire hub-level lock if available
-    lock = None
-    if hass and entry_id:
-        lock = _get_hub_lock(hass, entry_id)
-
-    if lock:
-        async with lock:
-            return await _do_fetch(coordinator, device, page_size)
-    else:
-        return await _do_fetch(coordinator, device, page_size)
-
-
-async def _do_fetch(coordinator, device, page_size):
-    """Perform the actual HTTP fetch and update cache."""
-    # Re-check cache inside the lock in case another device just fetched
-    cache = getattr(coordinator, "_event_log_cache", None)
-    now = time.monotonic()
-    if cache and (now - cache["timestamp"]) < _CACHE_VALIDITY_S:
-        return cache["logs"], cache["latency_ms"]
-
-    start = now
-    result = await device.get_event_logs(page_size=page_size, start_id=0)
-    logs = result.get_or_raise()
-    latency_ms = (time.monotonic() - start) * 1000
-
-    coordinator._event_log_cache = {
-        "timestamp": now,
-        "logs": logs,
-        "latency_ms": latency_ms,
-    }
-
-    return logs, latency_ms
-
-
 class HubEventLogPoller:
-    """Shared event-log poller for a trigger-button coordinator."""
+    """Event-log poller shared by all the trigger buttons of a hub.
+
+    Each cycle fetches the logs of every registered button in one
+    multipleRequest of control_child requests (one request per button on
+    hubs rejecting it as unsupported) and dispatches the results to the listeners of each
+    button. A single interval is computed by a PollingController from the
+    latency of the whole cycle against the hub utilization budget, so adding
+    buttons grows the request payload instead of the number of polling loops.
+
+    Fetching is incremental: a cursor keeps the id of the last event seen
+    for each button and only the events newer than it are dispatched. When
+    the probed latest event is further ahead than one, the poller pages
+    back (the hub returns the events up to `start_id`, newest first) until
+    the cursor is reached, so bursts between two cycles are not lost.
+
+    After `idle_after_s` without activity the poller slows down to
+    `idle_interval_s`. Any button event, or any change of a motion or
+    contact sensor of the same hub, brings back the fast interval at once.
+    """
 
-    EMA_ALPHA = 0.3
     DEFAULT_U_MAX = 0.35
-    JITTER_WEIGHT = 2.0
-    MIN_INTERVAL_MS = 300
-    MAX_INTERVAL_MS = 5000
-    HYSTERESIS_PCT = 0.15
-    COOLDOWN_CYCLES = 5
 
     def __init__(
         self,
         hass: HomeAssistant,
-        coordinator: TapoDataCoordinator,
-        device: TriggerButtonDevice,
-        entry_id: str | None,
-    ) -> None:
+        hub_coordinator: TapoDataCoordinator,
+        cursor_store: TapoEventCursorStore,
+        idle_after_s: float = DEFAULT_BUTTON_IDLE_AFTER_S,
+        idle_interval_s: float = DEFAULT_BUTTON_IDLE_POLLING_RATE_S,
+        controller: Optional[PollingController] = None,
+    ):
         self._hass = hass
-        self._coordinator = coordinator
-        self._device = device
-        self._entry_id = entry_id
-        self._listeners: set[EventLogListener] = set()
+        self._hub_coordinator = hub_coordinator
+        self._cursor_store = cursor_store
+        self._idle_after_s = idle_after_s
+        self._idle_interval_s = idle_interval_s
+        self._last_activity = time.monotonic()
+        self._sensors_snapshot: Optional[dict[str, tuple]] = None
+        self._unsub_hub_listener: Optional[CALLBACK_TYPE] = None
+        self._coordinators: dict[str, TapoDataCoordinator] = {}
+        self._listeners: dict[str, set[EventLogListener]] = {}
         self._task: asyncio.Task | None = None
-        self._last_result: EventLogPollResult | None = None
-        self._adaptive_state = AdaptivePollingState()
-        self._coordinator._adaptive_polling_state = self._adaptive_state
+        self._unsub_timer: Optional[CALLBACK_TYPE] = None
+        self._started = False
+        self._batch_supported: Optional[bool] = None
+        self._controller = controller or EmaPollingController()
 
     @property
-    def last_result(self) -> EventLogPollResult | None:
-        return self._last_result
+    def controller(self) -> PollingController:
+        return self._controller
 
     @property
     def adaptive_state(self) -> AdaptivePollingState:
-        return self._adaptive_state
+        return self._controller.state
+
+    @property
+    def is_idle(self) -> bool:
+        return (
+            self._idle_after_s > 0
+            and time.monotonic() - self._last_activity >= self._idle_after_s
+        )
+
+    @property
+    def interval_s(self) -> float:
+        interval_ms = self._controller.interval_ms
+        if self.is_idle:
+            return max(self._idle_interval_s, interval_ms / 1000)
+        return interval_ms / 1000
 
     @callback
-    def add_listener(self, listener: EventLogListener) -> Callable[[], None]:
-        self._listeners.add(listener)
+    def add_listener(
+        self, coordinator: TapoDataCoordinator, listener: EventLogListener
+    ) -> Callable[[], None]:
+        device_id = coordinator.device.device_id
+        self._coordinators[device_id] = coordinator
+        self._listeners.setdefault(device_id, set()).add(listener)
+        coordinator._adaptive_polling_state = self._controller.state
 
         def _remove_listener() -> None:
-            self._listeners.discard(listener)
+            listeners = self._listeners.get(device_id, set())
+            listeners.discard(listener)
+            if not listeners:
+                self._listeners.pop(device_id, None)
+                self._coordinators.pop(device_id, None)
+            if not self._listeners:
+                self._stop()
 
         return _remove_listener
 
+    @callback
+    def start(self) -> None:
+        """Start the polling loop."""
+        if not self._started:
+            self._started = True
+            self._last_activity = time.monotonic()
+            self._unsub_hub_listener = self._hub_coordinator.async_add_listener(
+                self._handle_hub_update
+            )
+            self.schedule_refresh()
+
+    @callback
+    def _stop(self) -> None:
+        self._started = False
+        if self._unsub_timer:
+            self._unsub_timer()
+            self._unsub_timer = None
+        if self._unsub_hub_listener:
+            self._unsub_hub_listener()
+            self._unsub_hub_listener = None
+
+    @callback
+    def _mark_activity(self) -> None:
+        was_idle = self.is_idle
+        self._last_activity = time.monotonic()
+        if was_idle and self._unsub_timer:
+            # poll right away instead of waiting for the idle interval
+            self.schedule_refresh()
+
+    @callback
+    def _handle_hub_update(self) -> None:
+        snapshot = _sensors_snapshot(self._hub_coordinator.device.children)
+        if self._sensors_snapshot is not None and snapshot != self._sensors_snapshot:
+            self._mark_activity()
+        self._sensors_snapshot = snapshot
+
     @callback
     def schedule_refresh(self) -> None:
         if self._task and not self._task.done():
             return
+        if self._unsub_timer:
+            self._unsub_timer()
+            self._unsub_timer = None
         self._task = self._hass.async_create_task(self._async_refresh())
 
+    @callback
+    def _handle_timer(self, _now) -> None:
+        self._unsub_timer = None
+        self.schedule_refresh()
+
     async def _async_refresh(self) -> None:
-        result: EventLogPollResult | None = None
+        coordinators = dict(self._coordinators)
+        results: dict[str, Try[EventLogs]] = {}
+        start = time.monotonic()
         try:
-            logs, latency_ms = await fetch_event_logs(
-                self._coordinator,
-                self._device,
-                hass=self._hass,
-                entry_id=self._entry_id,
+            results = await self._fetch_all(coordinators)
+        except Exception as error:
+            _LOGGER.debug("Failed to fetch hub event logs: %s", error)
+        latency_ms = (time.monotonic() - start) * 1000
+
+        if any(result.is_success() for result in results.values()):
+            self._controller.on_sample(latency_ms, self._u_max)
+        else:
+            self._controller.on_failure(self._u_max)
+
+        for device_id, coordinator in coordinators.items():
+            probe = results.get(device_id)
+            new_events = None
+            if probe is not None and probe.is_success():
+                new_events = await self._new_events(coordinator.device, probe.get())
+            poll_result = None
+            if new_events is not None:
+                poll_result = EventLogPollResult(
+                    events=new_events[0], latency_ms=latency_ms
+                )
+            else:
+                _LOGGER.debug("Failed to fetch event logs for %s", device_id)
+            if new_events and new_events[0]:
+                self._mark_activity()
+            for listener in tuple(self._listeners.get(device_id, ())):
+                listener(poll_result)
+            if new_events is not None and new_events[1] is not None:
+                # move the cursor only once the events have been delivered
+                self._cursor_store.save(device_id, new_events[1])
+
+        if self._started and self._listeners:
+            self._unsub_timer = async_call_later(
+                self._hass, self.interval_s, self._handle_timer
             )
-            result = EventLogPollResult(logs=logs, latency_ms=latency_ms)
-            self._apply_latency_sample(latency_ms)
-        except Exception:
-            self._adaptive_state.latency_ms = None
-            _LOGGER.debug("Failed to fetch event logs for %s", self._device.device_id)
 
-        self._last_result = result
-        for listener in tuple(self._listeners):
-            listener(result)
+    async def _fetch_all(
+        self, coordinators: dict[str, TapoDataCoordinator]
+    ) -> dict[str, Try[EventLogs]]:
+        if len(coordinators) > 1 and self._batch_supported is not False:
+            batch = await self._fetch_batch(coordinators)
+            if batch.is_success():
+                self._batch_supported = True
+                return batch.get()
+            if not is_unsupported_request_error(batch.error()):
+                # transient, the batch is tried again in the next cycle
+                return {device_id: Failure(batch.error()) for device_id in coordinators}
+            _LOGGER.debug(
+                "Hub rejected batched event log request, using one per button: %s",
+                batch.error(),
+            )
+            self._batch_supported = False
+        return {
+            device_id: await coordinator.device.get_event_logs(
+                page_size=EVENT_LOG_PROBE_SIZE, start_id=0
+            )
+            for device_id, coordinator in coordinators.items()
+        }
+
+    async def _new_events(
+        self, device: TriggerButtonDevice, probe: EventLogs
+    ) -> Optional[tuple[list[S200BEvent], Optional[int]]]:
+        """Events newer than the cursor of `device` (oldest first) and new cursor.
+
+        Returns None when catching up failed: the cursor is left untouched,
+        so the missing events are fetched again in the next cycle.
+        """
+        cursor = self._cursor_store.get(device.device_id)
+        if not probe.events:
+            return [], None
+        latest_id = probe.events[0].id
+        if cursor is None or latest_id < cursor:
+            # nothing seen yet, or the hub log was reset: start from here
+            return [], latest_id
+        new_events = [event for event in probe.events if event.id > cursor]
+        pages = 0
+        while new_events and new_events[-1].id > cursor + 1:
+            if pages == EVENT_LOG_MAX_CATCH_UP_PAGES:
+                _LOGGER.warning(
+                    "Too many events for %s since the last poll, some were skipped",
+                    device.device_id,
+                )
+                break
+            page = await device.get_event_logs(
+                page_size=min(EVENT_LOG_PAGE_SIZE, new_events[-1].id - cursor - 1),
+                start_id=new_events[-1].id - 1,
+            )
+            if not page.is_success():
+                return None
+            pages += 1
+            older = [event for event in page.get().events if event.id > cursor]
+            if not older:
+                break
+            new_events.extend(older)
+        return list(reversed(new_events)), latest_id
+
+    async def _fetch_batch(
+        self, coordinators: dict[str, TapoDataCoordinator]
+    ) -> Try[dict[str, Try[EventLogs]]]:
+        request = _multiple_request(
+            [
+                TapoRequest.control_child(
+                    child_id(coordinator.device),
+                    _multiple_request([_event_logs_request()]),
+                )
+                for coordinator in coordinators.values()
+            ]
+        )
+        response = await self._hub_coordinator.device.client.execute_raw_request(
+            request
+        )
+        if not response.is_success():
+            return response
+        try:
+            responses = response.get()["responses"]
+            if len(responses) != len(coordinators):
+                return Failure(Exception("Unexpected number of responses"))
+            return Success(
+                {
+                    device_id: _parse_event_logs_response(child_response)
+                    for device_id, child_response in zip(coordinators, responses)
+                }
+            )
+        except Exception as e:
+            return Failure(e)
 
     @property
     def _u_max(self) -> float:
-        pct = getattr(self._coordinator, "_poll_utilization_pct", None)
-        if pct is not None:
-            return pct / 100.0
+        # the buttons share the hub: honour the most conservative budget
+        pcts = [
+            pct
+            for coordinator in self._coordinators.values()
+            if (pct := getattr(coordinator, "_poll_utilization_pct", None)) is not None
+        ]
+        if pcts:
+            return min(pcts) / 100.0
         return self.DEFAULT_U_MAX
 
-    def _apply_latency_sample(self, latency_ms: float) -> None:
-        state = self._adaptive_state
-        state.latency_ms = round(latency_ms, 1)
 
-        if state.ema_ms is None:
-            state.ema_ms = latency_ms
-            state.ema_jitter_ms = 0.0
-            state.computed_interval_ms = max(
-                self.MIN_INTERVAL_MS, latency_ms / self._u_max
-            )
-            self._coordinator.update_interval = timedelta(
-                milliseconds=state.computed_interval_ms
-            )
-            return
-
-        state.ema_ms = self.EMA_ALPHA * latency_ms + (1 - self.EMA_ALPHA) * state.ema_ms
-        jitter = abs(latency_ms - state.ema_ms)
-        state.ema_jitter_ms = (
-            self.EMA_ALPHA * jitter + (1 - self.EMA_ALPHA) * state.ema_jitter_ms
+async def async_get_hub_event_log_poller(
+    hass: HomeAssistant, coordinator: TapoDataCoordinator
+) -> HubEventLogPoller:
+    """Get or create the event-log poller of the hub `coordinator` belongs to."""
+    hub_coordinator = getattr(coordinator, "hub_coordinator", coordinator)
+    cursor_store = await async_get_event_cursor_store(hass)
+    poller = getattr(hub_coordinator, "_hub_event_log_poller", None)
+    if poller is None:
+        entry = getattr(hub_coordinator, "config_entry", None)
+        options = entry.data if entry else {}
+        poller = HubEventLogPoller(
+            hass,
+            hub_coordinator,
+            cursor_store,
+            idle_after_s=options.get(
+                CONF_BUTTON_IDLE_AFTER, DEFAULT_BUTTON_IDLE_AFTER_S
+            ),
+            idle_interval_s=options.get(
+                CONF_BUTTON_IDLE_POLLING_RATE, DEFAULT_BUTTON_IDLE_POLLING_RATE_S
+            ),
+            controller=POLLING_CONTROLLERS.get(
+                options.get(
+                    CONF_BUTTON_POLLING_CONTROLLER, DEFAULT_BUTTON_POLLING_CONTROLLER
+                ),
+                EmaPollingController,
+            )(),
         )
+        hub_coordinator._hub_event_log_poller = poller
+    return poller
 
-        effective_latency = state.ema_ms + self.JITTER_WEIGHT * state.ema_jitter_ms
-        target = effective_latency / self._u_max
-        target = max(self.MIN_INTERVAL_MS, min(self.MAX_INTERVAL_MS, target))
 
-        state.cycles_since_change += 1
-        pct_change = (
-            abs(target - state.computed_interval_ms) / state.computed_interval_ms
-        )
-        if (
-            pct_change > self.HYSTERESIS_PCT
-            and state.cycles_since_change >= self.COOLDOWN_CYCLES
-        ):
-            state.computed_interval_ms = target
-            state.cycles_since_change = 0
+def _sensors_snapshot(children: list[TapoDevice]) -> dict[str, tuple]:
+    """State of the motion and contact sensors, to detect activity."""
+    snapshot = {}
+    for child in children:
+        if motion := child.get_component(MotionSensorComponent):
+            snapshot[child.device_id] = ("motion", motion.detected)
+        elif door := child.get_component(SmartDoorComponent):
+            snapshot[child.device_id] = ("contact", door.is_open)
+    return snapshot
 
-        self._coordinator.update_interval = timedelta(
-            milliseconds=state.computed_interval_ms
-        )
 
+def _multiple_request(requests: list[TapoRequest]) -> TapoRequest:
+    return TapoRequest.multiple_request(
+        MultipleRequestParams(requests)
+    ).with_request_time_millis(round(time.time() * 1000))
 
-def get_hub_event_log_poller(
-    hass: HomeAssistant,
-    coordinator: TapoDataCoordinator,
-    device: TriggerButtonDevice,
-    entry_id: str | None,
-) -> HubEventLogPoller:
-    """Get or create the shared event-log poller for a child coordinator."""
-    poller = getattr(coordinator, "_hub_event_log_poller", None)
-    if poller is None:
-        poller = HubEventLogPoller(hass, coordinator, device, entry_id)
-        coordinator._hub_event_log_poller = poller
-    return poller
+
+def _event_logs_request() -> TapoRequest:
+    return TapoRequest.get_child_event_logs(
+        GetTriggerLogsParams(EVENT_LOG_PROBE_SIZE, 0)
+    )
+
+
+def _parse_event_logs_response(child_response: dict[str, Any]) -> Try[EventLogs]:
+    if child_response.get("error_code", 0) != 0:
+        return Failure(Exception(f"control_child error {child_response['error_code']}"))
+    response = child_response["result"]["responseData"]["result"]["responses"][0]
+    if response.get("error_code", 0) != 0:
+        return Failure(Exception(f"get_trigger_logs error {response['error_code']}"))
+    return TriggerLogResponse[S200BEvent].try_from_json(
+        response["result"], parse_s200b_event
+    )
 
 
 EVENT_SINGLE_CLICK = "single_click"
@@ -259,8 +437,7 @@ async def async_setup_entry(
                 [
                     TapoButtonEvent(child_coordinator, device),
                     TapoDialEvent(child_coordinator, device),
-                ],
-                True,
+                ]
             )
 
 
@@ -276,92 +453,21 @@ class _TapoEventBase(CoordinatedTapoEntity, EventEntity):
     ) -> None:
         super().__init__(coordinator, device)
         self._device: TriggerButtonDevice = device
-        self._last_event_id: int | None = None
-        self._ha_started: bool = False
-        self._event_log_poller: HubEventLogPoller | None = None
 
     async def async_added_to_hass(self) -> None:
         await super().async_added_to_hass()
-        self._event_log_poller = get_hub_event_log_poller(
-            self.hass,
-            self.coordinator,
-            self._device,
-            getattr(self.coordinator, "_hub_entry_id", None),
-        )
+        # the cursor is restored, events can be delivered right away
+        poller = await async_get_hub_event_log_poller(self.hass, self.coordinator)
         self.async_on_remove(
-            self._event_log_poller.add_listener(self._handle_event_log_result)
+            poller.add_listener(self.coordinator, self._handle_event_log_result)
         )
-        if self.hass.state is CoreState.running:
-            self._ha_started = True
-        else:
-            self.hass.bus.async_listen_once(
-                EVENT_HOMEASSISTANT_STARTED, self._on_ha_started
-            )
-
-    @callback
-    def _on_ha_started(self, _event) -> None:
-        self._ha_started = True
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        if not self._ha_started:
-            return
-        if self._event_log_poller is None:
-            self._event_log_poller = get_hub_event_log_poller(
-                self.hass,
-                self.coordinator,
-                self._device,
-                getattr(self.coordinator, "_hub_entry_id", None),
-            )
-        self._event_log_poller.schedule_refresh()
-        self.async_write_ha_state()
+        poller.start()
 
     @callback
     def _handle_event_log_result(self, result: EventLogPollResult | None) -> None:
         if result is None:
             return
-        self._process_logs(result.logs)
-
-    async def _poll_and_fire_events(self) -> None:
-        try:
-            logs, _ = await fetch_event_logs(
-                self.coordinator,
-                self._device,
-                hass=self.hass,
-                entry_id=getattr(self.coordinator, "_hub_entry_id", None),
-            )
-        except Exception:
-            _LOGGER.debug("Failed to fetch event logs for %s", self._device.device_id)
-            return
-
-        self._process_logs(logs)
-
-    def _process_logs(self, logs) -> None:
-        if not self._ha_started:
-            return
-
-        if not logs.events:
-            return
-
-        latest = logs.events[0]
-        event_id = latest.id
-
-        if self._last_event_id is None:
-            self._last_event_id = event_id
-            return
-
-        if event_id == self._last_event_id:
-            return
-
-        new_events: list[S200BEvent] = []
-        for event in logs.events:
-            if event.id == self._last_event_id:
-                break
-            new_events.append(event)
-
-        self._last_event_id = event_id
-
-        for event in reversed(new_events):
+        for event in result.events:
             self._handle_event(event)
 
     def _handle_event(self, event: S200BEvent) -> None:
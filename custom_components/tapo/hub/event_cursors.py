@@ -0,0 +1,40 @@
+from typing import Optional
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.tapo.const import (
+    EVENT_CURSORS,
+    EVENT_CURSORS_SAVE_DELAY_S,
+    EVENT_CURSORS_STORAGE_VERSION,
+)
+from custom_components.tapo.domain_data import TapoDomainStore, async_get_domain_store
+
+
+class TapoEventCursorStore(TapoDomainStore[int]):
+    """Persisted id of the last event delivered for every trigger button.
+
+    Restoring it at setup lets the first poll after a restart deliver the
+    presses happened meanwhile, instead of just priming the cursor. Saves
+    are delayed but flushed on shutdown, so a clean restart never delivers
+    an event twice.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        super().__init__(
+            hass,
+            EVENT_CURSORS,
+            EVENT_CURSORS_STORAGE_VERSION,
+            EVENT_CURSORS_SAVE_DELAY_S,
+        )
+
+    def get(self, device_id: str) -> Optional[int]:
+        return self._get(device_id)
+
+    def save(self, device_id: str, event_id: int) -> None:
+        self._set(device_id, event_id)
+
+
+async def async_get_event_cursor_store(hass: HomeAssistant) -> TapoEventCursorStore:
+    return await async_get_domain_store(
+        hass, EVENT_CURSORS, lambda: TapoEventCursorStore(hass)
+    )
@@ -1,7 +1,8 @@
 from dataclasses import dataclass
 from datetime import timedelta
 import logging
-from typing import List
+import time
+from typing import Any, List
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_SCAN_INTERVAL
@@ -9,17 +10,24 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry, device_registry as dr
 from homeassistant.helpers.device_registry import DeviceRegistry
 from plugp100.devices.base import TapoDevice
-from plugp100.devices.children.trigger_button import TriggerButtonDevice
 from plugp100.devices.hub import TapoHub
 from plugp100.events.hub_device_tracker import DeviceAdded, HubDeviceEvent
 
 from custom_components.tapo.const import (
-    DEFAULT_BUTTON_POLLING_RATE_MS,
+    CONF_SETUP_CONCURRENCY,
     DEFAULT_POLLING_RATE_S,
+    DEFAULT_SETUP_CONCURRENCY,
     DOMAIN,
     PLATFORMS,
 )
 from custom_components.tapo.coordinators import HassTapoDeviceData, TapoDataCoordinator
+from custom_components.tapo.host_tracking import entry_needs_reload
+from custom_components.tapo.hub.request_broker import broker_hub_requests
+from custom_components.tapo.hub.tapo_hub_child_coordinator import (
+    TapoHubChildCoordinator,
+    TapoHubCoordinator,
+)
+from custom_components.tapo.setup_helpers import get_domain_option
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,10 +38,19 @@ class HassTapoHub:
     hub: TapoHub
 
     async def initialize_hub(self, hass: HomeAssistant):
+        setup_start = time.monotonic()
+        setup_diagnostics: dict[str, Any] = {}
+        # the hub and its children share one client: serialize all by priority
+        broker_hub_requests(self.hub)
         polling_rate = timedelta(
             seconds=self.entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_POLLING_RATE_S)
         )
-        hub_coordinator = TapoDataCoordinator(hass, self.hub, polling_rate)
+        concurrency = get_domain_option(
+            hass, CONF_SETUP_CONCURRENCY, DEFAULT_SETUP_CONCURRENCY
+        )
+        hub_coordinator = TapoHubCoordinator(
+            hass, self.hub, polling_rate, setup_concurrency=concurrency
+        )
         await hub_coordinator.async_config_entry_first_refresh()
         registry: DeviceRegistry = device_registry.async_get(hass)
         registry.async_get_or_create(
@@ -54,7 +71,7 @@ class HassTapoHub:
             self.hub.device_id,
         )
         child_coordinators = await self.setup_children(
-            hass, registry, self.hub.children, polling_rate
+            hass, registry, hub_coordinator, self.hub.children, setup_diagnostics
         )
         hass.data[DOMAIN][self.entry.entry_id] = HassTapoDeviceData(
             coordinator=hub_coordinator,
@@ -63,6 +80,8 @@ class HassTapoHub:
             ),
             child_coordinators=child_coordinators,
             device=self.hub,
+            setup_diagnostics=setup_diagnostics,
+            config_data=dict(self.entry.data),
         )
         # TODO: refactory with add_device and remove_device methods
         initial_device_ids = list(map(lambda x: x.device_id, self.hub.children))
@@ -78,6 +97,7 @@ class HassTapoHub:
             self.hub.subscribe_device_association(_handle_child_device_event)
         )
 
+        setup_diagnostics["hub_setup_ms"] = _elapsed_ms(setup_start)
         await hass.config_entries.async_forward_entry_setups(self.entry, PLATFORMS)
         return True
 
@@ -85,24 +105,28 @@ class HassTapoHub:
         self,
         hass: HomeAssistant,
         registry: DeviceRegistry,
+        hub_coordinator: TapoHubCoordinator,
         devices: List[TapoDevice],
-        polling_rate: timedelta,
+        setup_diagnostics: dict[str, Any] | None = None,
     ) -> List[TapoDataCoordinator]:
-        button_polling_rate = timedelta(milliseconds=DEFAULT_BUTTON_POLLING_RATE_MS)
+        # Children state is polled by the hub coordinator, trigger buttons
+        # event logs by the hub event log poller
         coordinators = [
-            TapoDataCoordinator(
-                hass,
-                child_device,
-                button_polling_rate
-                if isinstance(child_device, TriggerButtonDevice)
-                else polling_rate,
-            )
+            TapoHubChildCoordinator(hass, hub_coordinator, child_device, None)
             for child_device in devices
         ]
-
+        # the hub first refresh already set up the children, these only read
+        # the state it fetched
         for coordinator in coordinators:
-            coordinator._hub_entry_id = self.entry.entry_id
             await coordinator.async_config_entry_first_refresh()
+        if setup_diagnostics is not None:
+            setup_diagnostics.update(
+                {
+                    "children_count": len(coordinators),
+                    "children_setup_concurrency": hub_coordinator.setup_concurrency,
+                    "children_setup_ms": hub_coordinator.children_setup_ms,
+                }
+            )
 
         device_entries = [
             registry.async_get_or_create(
@@ -129,6 +153,11 @@ class HassTapoHub:
         return coordinators
 
 
+def _elapsed_ms(start: float) -> float:
+    return round((time.monotonic() - start) * 1000, 1)
+
+
 async def _on_options_update_listener(hass: HomeAssistant, config_entry: ConfigEntry):
     """Handle options update."""
-    await hass.config_entries.async_reload(config_entry.entry_id)
+    if entry_needs_reload(hass, config_entry):
+        await hass.config_entries.async_reload(config_entry.entry_id)
@@ -29,11 +29,11 @@ async def async_setup_entry(
     for child_coordinator in data.child_coordinators:
         device = child_coordinator.device
         if isinstance(device, KE100Device):
-            async_add_entities([TRVTemperatureOffset(child_coordinator, device)], True)
+            async_add_entities([TRVTemperatureOffset(child_coordinator, device)])
         elif isinstance(device, TriggerButtonDevice) and device.has_component(
             TriggerLogComponent
         ):
-            async_add_entities([PollUtilization(child_coordinator, device)], True)
+            async_add_entities([PollUtilization(child_coordinator, device)])
 
 
 class TRVTemperatureOffset(CoordinatedTapoEntity, NumberEntity):
@@ -99,7 +99,8 @@ class PollUtilization(CoordinatedTapoEntity, RestoreNumber):
 
     Lower = less aggressive polling (more stable, slower response).
     Higher = more aggressive polling (faster response, more hub load).
-    The PollLatencySensor reads this value to compute the polling interval.
+    The hub event log poller reads this value to compute the polling
+    interval, honouring the lowest one among the buttons of the hub.
     """
 
     _attr_has_entity_name = True
@@ -130,7 +131,7 @@ class PollUtilization(CoordinatedTapoEntity, RestoreNumber):
             last := await self.async_get_last_number_data()
         ) and last.native_value is not None:
             self._attr_native_value = last.native_value
-        # Store on coordinator so PollLatencySensor can read it
+        # Store on coordinator so the hub event log poller can read it
         self.coordinator._poll_utilization_pct = self._attr_native_value
 
     async def async_set_native_value(self, value: float) -> None:
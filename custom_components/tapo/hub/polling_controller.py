@@ -0,0 +1,134 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+from custom_components.tapo.const import DEFAULT_BUTTON_POLLING_RATE_MS
+
+
+@dataclass
+class AdaptivePollingState:
+    latency_ms: float | None = None
+    ema_ms: float | None = None
+    ema_jitter_ms: float | None = None
+    computed_interval_ms: float | None = None
+    cycles_since_change: int = 0
+
+
+class PollingController(ABC):
+    """Computes the event log polling interval of a hub.
+
+    The poller reports the latency of every cycle, or its failure, together
+    with the hub utilization budget: the fraction of time the hub may spend
+    serving the event log requests of all its buttons.
+    """
+
+    MIN_INTERVAL_MS = 300
+    MAX_INTERVAL_MS = 5000
+
+    def __init__(self):
+        self.state = AdaptivePollingState()
+
+    @property
+    def interval_ms(self) -> float:
+        return self.state.computed_interval_ms or DEFAULT_BUTTON_POLLING_RATE_MS
+
+    @abstractmethod
+    def on_sample(self, latency_ms: float, budget: float) -> None:
+        """Account a successful cycle which took `latency_ms`."""
+
+    @abstractmethod
+    def on_failure(self, budget: float) -> None:
+        """Account a failed or timed out cycle."""
+
+    def _clamp(self, interval_ms: float) -> float:
+        return max(self.MIN_INTERVAL_MS, min(self.MAX_INTERVAL_MS, interval_ms))
+
+
+class EmaPollingController(PollingController):
+    """Interval from the EMA latency and jitter, with hysteresis and cooldown."""
+
+    EMA_ALPHA = 0.3
+    JITTER_WEIGHT = 2.0
+    HYSTERESIS_PCT = 0.15
+    COOLDOWN_CYCLES = 5
+
+    def on_sample(self, latency_ms: float, budget: float) -> None:
+        state = self.state
+        state.latency_ms = round(latency_ms, 1)
+
+        if state.ema_ms is None:
+            state.ema_ms = latency_ms
+            state.ema_jitter_ms = 0.0
+            state.computed_interval_ms = max(self.MIN_INTERVAL_MS, latency_ms / budget)
+            return
+
+        state.ema_ms = self.EMA_ALPHA * latency_ms + (1 - self.EMA_ALPHA) * state.ema_ms
+        jitter = abs(latency_ms - state.ema_ms)
+        state.ema_jitter_ms = (
+            self.EMA_ALPHA * jitter + (1 - self.EMA_ALPHA) * state.ema_jitter_ms
+        )
+
+        effective_latency = state.ema_ms + self.JITTER_WEIGHT * state.ema_jitter_ms
+        target = self._clamp(effective_latency / budget)
+
+        state.cycles_since_change += 1
+        pct_change = (
+            abs(target - state.computed_interval_ms) / state.computed_interval_ms
+        )
+        if (
+            pct_change > self.HYSTERESIS_PCT
+            and state.cycles_since_change >= self.COOLDOWN_CYCLES
+        ):
+            state.computed_interval_ms = target
+            state.cycles_since_change = 0
+
+    def on_failure(self, budget: float) -> None:
+        self.state.latency_ms = None
+
+
+class BudgetPollingController(PollingController):
+    """AIMD controller keeping the hub utilization within its budget.
+
+    While a cycle stays within the budget (latency / interval) the interval
+    shrinks by ADDITIVE_STEP_MS; above it the interval grows by
+    BACKOFF_FACTOR, and by TIMEOUT_FACTOR when the cycle failed, so a
+    struggling hub is relieved at once and probed back slowly.
+    """
+
+    EMA_ALPHA = 0.3
+    ADDITIVE_STEP_MS = 100
+    BACKOFF_FACTOR = 1.5
+    TIMEOUT_FACTOR = 2.0
+
+    def on_sample(self, latency_ms: float, budget: float) -> None:
+        state = self.state
+        state.latency_ms = round(latency_ms, 1)
+        state.ema_ms = (
+            latency_ms
+            if state.ema_ms is None
+            else self.EMA_ALPHA * latency_ms + (1 - self.EMA_ALPHA) * state.ema_ms
+        )
+        if state.computed_interval_ms is None:
+            interval = latency_ms / budget
+        elif latency_ms / state.computed_interval_ms > budget:
+            interval = state.computed_interval_ms * self.BACKOFF_FACTOR
+        else:
+            interval = state.computed_interval_ms - self.ADDITIVE_STEP_MS
+        self._set_interval(self._clamp(interval))
+
+    def on_failure(self, budget: float) -> None:
+        self.state.latency_ms = None
+        self._set_interval(self._clamp(self.interval_ms * self.TIMEOUT_FACTOR))
+
+    def _set_interval(self, interval_ms: float) -> None:
+        state = self.state
+        if interval_ms == state.computed_interval_ms:
+            state.cycles_since_change += 1
+        else:
+            state.computed_interval_ms = interval_ms
+            state.cycles_since_change = 0
+
+
+POLLING_CONTROLLERS: dict[str, type[PollingController]] = {
+    "ema": EmaPollingController,
+    "budget": BudgetPollingController,
+}
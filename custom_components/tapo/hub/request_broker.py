@@ -0,0 +1,187 @@
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from enum import IntEnum
+import itertools
+import time
+from typing import Any, AsyncIterator, Optional
+
+from plugp100.api.protocol.tapo_protocol import TapoProtocol
+from plugp100.api.requests.tapo_request import TapoRequest
+from plugp100.api.transport.response import TapoResponse
+from plugp100.common.functional.tri import Try
+from plugp100.devices.base import TapoDevice
+
+from custom_components.tapo.const import HUB_BROKER_AGING_S
+from custom_components.tapo.device_adapter import wrap_protocol
+from custom_components.tapo.request_limiter import (
+    ProtocolWrapper,
+    is_command_method,
+    request_methods,
+)
+
+
+class HubRequestPriority(IntEnum):
+    COMMAND = 0
+    EVENT_LOG = 1
+    STATE = 2
+    CLIMATE = 3
+    ENERGY = 4
+    FIRMWARE = 5
+
+
+_METHOD_PRIORITIES = {
+    "get_trigger_logs": HubRequestPriority.EVENT_LOG,
+    "get_temp_humidity_records": HubRequestPriority.CLIMATE,
+    "get_energy_usage": HubRequestPriority.ENERGY,
+    "get_current_power": HubRequestPriority.ENERGY,
+    "get_device_usage": HubRequestPriority.ENERGY,
+    "get_latest_fw": HubRequestPriority.FIRMWARE,
+    "get_fw_download_state": HubRequestPriority.FIRMWARE,
+}
+
+
+def hub_request_priority(request: TapoRequest) -> HubRequestPriority:
+    """Priority class of a hub request; children state polls fall in STATE."""
+    methods = request_methods(request)
+    if any(is_command_method(method) for method in methods):
+        return HubRequestPriority.COMMAND
+    return min(
+        (
+            _METHOD_PRIORITIES.get(method, HubRequestPriority.STATE)
+            for method in methods
+        ),
+        default=HubRequestPriority.STATE,
+    )
+
+
+@dataclass
+class _Waiter:
+    priority: HubRequestPriority
+    order: int
+    enqueued_at: float
+    future: asyncio.Future = field(compare=False)
+
+
+@dataclass
+class _PriorityStats:
+    requests: int = 0
+    total_wait_s: float = 0.0
+    max_wait_s: float = 0.0
+
+
+class HubRequestBroker:
+    """Owns the traffic to a hub, sending one request at a time by priority.
+
+    Waiting requests are served by priority class, FIFO within a class. To
+    keep scheduling fair a waiter gains one class every `aging_s` seconds
+    spent in the queue, so firmware checks are delayed but never starved.
+    """
+
+    def __init__(self, aging_s: float = HUB_BROKER_AGING_S):
+        self._aging_s = aging_s
+        self._busy = False
+        self._waiters: list[_Waiter] = []
+        self._counter = itertools.count()
+        self._stats = {priority: _PriorityStats() for priority in HubRequestPriority}
+
+    @asynccontextmanager
+    async def slot(self, priority: HubRequestPriority) -> AsyncIterator[None]:
+        enqueued_at = time.monotonic()
+        if self._busy or self._waiters:
+            waiter = _Waiter(
+                priority,
+                next(self._counter),
+                enqueued_at,
+                asyncio.get_running_loop().create_future(),
+            )
+            self._waiters.append(waiter)
+            try:
+                await waiter.future
+            except asyncio.CancelledError:
+                if waiter.future.done() and not waiter.future.cancelled():
+                    # the slot was handed over right before the cancellation
+                    self._release()
+                elif waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                raise
+        else:
+            self._busy = True
+        self._record_wait(priority, time.monotonic() - enqueued_at)
+        try:
+            yield
+        finally:
+            self._release()
+
+    def _release(self) -> None:
+        self._waiters = [w for w in self._waiters if not w.future.done()]
+        if not self._waiters:
+            self._busy = False
+            return
+        now = time.monotonic()
+        waiter = min(
+            self._waiters,
+            key=lambda w: (
+                w.priority - int((now - w.enqueued_at) // self._aging_s),
+                w.order,
+            ),
+        )
+        self._waiters.remove(waiter)
+        # hand the slot over, keeping the broker busy
+        waiter.future.set_result(None)
+
+    def _record_wait(self, priority: HubRequestPriority, wait_s: float) -> None:
+        stats = self._stats[priority]
+        stats.requests += 1
+        stats.total_wait_s += wait_s
+        stats.max_wait_s = max(stats.max_wait_s, wait_s)
+
+    def diagnostics(self) -> dict[str, Any]:
+        return {
+            "busy": self._busy,
+            "queue_depth": {
+                priority.name.lower(): sum(
+                    1 for w in self._waiters if w.priority == priority
+                )
+                for priority in HubRequestPriority
+            },
+            "wait": {
+                priority.name.lower(): {
+                    "requests": stats.requests,
+                    "avg_ms": round(stats.total_wait_s / stats.requests * 1000, 1)
+                    if stats.requests
+                    else 0,
+                    "max_ms": round(stats.max_wait_s * 1000, 1),
+                }
+                for priority, stats in self._stats.items()
+            },
+        }
+
+
+class HubBrokerProtocol(ProtocolWrapper):
+    """Protocol wrapper routing every hub request through its broker."""
+
+    def __init__(self, protocol: TapoProtocol, broker: HubRequestBroker):
+        super().__init__(protocol)
+        self.broker = broker
+
+    async def send_request(
+        self, request: TapoRequest, retry: int = 3
+    ) -> Try[TapoResponse[dict[str, Any]]]:
+        async with self.broker.slot(hub_request_priority(request)):
+            return await self.inner.send_request(request, retry)
+
+
+def broker_hub_requests(hub: TapoDevice) -> HubRequestBroker:
+    """Route all the requests to `hub` and its children through a broker."""
+    protocol = hub.client.protocol
+    if not isinstance(protocol, HubBrokerProtocol):
+        protocol = wrap_protocol(
+            hub.client, lambda inner: HubBrokerProtocol(inner, HubRequestBroker())
+        )
+    return protocol.broker
+
+
+def get_hub_request_broker(device: TapoDevice) -> Optional[HubRequestBroker]:
+    protocol = device.client.protocol
+    return protocol.broker if isinstance(protocol, HubBrokerProtocol) else None
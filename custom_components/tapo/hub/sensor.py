@@ -31,11 +31,10 @@ from custom_components.tapo.const import DOMAIN
 from custom_components.tapo.coordinators import HassTapoDeviceData, TapoDataCoordinator
 from custom_components.tapo.entity import CoordinatedTapoEntity
 from custom_components.tapo.hub.event import (
-    AdaptivePollingState,
     EventLogPollResult,
-    fetch_event_logs,
-    get_hub_event_log_poller,
+    async_get_hub_event_log_poller,
 )
+from custom_components.tapo.hub.polling_controller import AdaptivePollingState
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -71,7 +70,7 @@ async def async_setup_entry(
                 PollLatencySensor(child_coordinator, child_coordinator.device)
             )
 
-        async_add_entities(sensors, True)
+        async_add_entities(sensors)
 
 
 class HumiditySensor(CoordinatedTapoEntity, SensorEntity):
@@ -211,19 +210,14 @@ class PollLatencySensor(CoordinatedTapoEntity, SensorEntity):
         super().__init__(coordinator, device)
         self._device: TriggerButtonDevice = device
         self._ha_started: bool = False
-        self._event_log_poller = None
 
     async def async_added_to_hass(self) -> None:
         await super().async_added_to_hass()
-        self._event_log_poller = get_hub_event_log_poller(
-            self.hass,
-            self.coordinator,
-            self._device,
-            getattr(self.coordinator, "_hub_entry_id", None),
-        )
+        poller = await async_get_hub_event_log_poller(self.hass, self.coordinator)
         self.async_on_remove(
-            self._event_log_poller.add_listener(self._handle_event_log_result)
+            poller.add_listener(self.coordinator, self._handle_event_log_result)
         )
+        poller.start()
         if self.hass.state is CoreState.running:
             self._ha_started = True
         else:
@@ -279,14 +273,6 @@ class PollLatencySensor(CoordinatedTapoEntity, SensorEntity):
     def _handle_coordinator_update(self) -> None:
         if not self._ha_started or not self.enabled:
             return
-        if self._event_log_poller is None:
-            self._event_log_poller = get_hub_event_log_poller(
-                self.hass,
-                self.coordinator,
-                self._device,
-                getattr(self.coordinator, "_hub_entry_id", None),
-            )
-        self._event_log_poller.schedule_refresh()
         self.async_write_ha_state()
 
     @callback
@@ -298,20 +284,6 @@ class PollLatencySensor(CoordinatedTapoEntity, SensorEntity):
             return
         self.async_write_ha_state()
 
-    async def _measure_latency(self) -> None:
-        try:
-            _, latency_ms = await fetch_event_logs(
-                self.coordinator,
-                self._device,
-                hass=self.hass,
-                entry_id=getattr(self.coordinator, "_hub_entry_id", None),
-            )
-        except Exception:
-            self.async_write_ha_state()
-            return
-
-        self.async_write_ha_state()
-
     @property
     def _adaptive_state(self) -> AdaptivePollingState:
         state = getattr(self.coordinator, "_adaptive_polling_state", None)
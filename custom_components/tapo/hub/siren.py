@@ -28,7 +28,7 @@ async def async_setup_entry(
                 (await data.device.get_supported_alarm_tones()).get_or_raise().tones
             )
             async_add_devices(
-                [HubSiren(data.coordinator, data.device, available_tones)], True
+                [HubSiren(data.coordinator, data.device, available_tones)]
             )
 
 
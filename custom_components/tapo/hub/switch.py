@@ -19,14 +19,13 @@ async def async_setup_entry(
     for child_coordinator in data.child_coordinators:
         device = child_coordinator.device
         if isinstance(device, SwitchChildDevice):
-            async_add_entities([SwitchTapoChild(child_coordinator, device)], True)
+            async_add_entities([SwitchTapoChild(child_coordinator, device)])
         elif isinstance(device, KE100Device):
             async_add_entities(
                 [
                     TRVFrostProtection(child_coordinator, device),
                     TRVChildLock(child_coordinator, device),
-                ],
-                True,
+                ]
             )
 
 
@@ -0,0 +1,206 @@
+import asyncio
+from datetime import timedelta
+import logging
+import time
+from typing import Any, Optional
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from plugp100.devices.base import TapoDevice
+from plugp100.devices.hub import TapoHub
+from plugp100.models.child import ChildDeviceList
+from plugp100.models.components import Components
+
+from custom_components.tapo.coordinators import TapoDataCoordinator
+from custom_components.tapo.device_adapter import (
+    async_apply_state,
+    async_initialize_hub,
+    child_id,
+    is_initialized,
+)
+from custom_components.tapo.helpers import gather_with_concurrency
+
+_LOGGER = logging.getLogger(__name__)
+
+ChildrenState = dict[str, dict[str, Any]]
+
+
+class TapoHubCoordinator(TapoDataCoordinator):
+    """Hub coordinator which also polls all the hub children in one cycle.
+
+    The whole (paged) child device list is fetched once per cycle and its
+    entries are fanned out to the registered TapoHubChildCoordinator, so a hub
+    with N children costs a couple of requests per cycle instead of N.
+
+    The first refresh builds the children from that same list and sets them
+    up from one batched component list request, instead of the device info
+    request and component negotiation per child of TapoHub.update(). Up to
+    `setup_concurrency` children apply their first state at once.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        device: TapoHub,
+        polling_interval: timedelta,
+        setup_concurrency: int = 1,
+    ):
+        super().__init__(hass, device, polling_interval)
+        self._children_lock = asyncio.Lock()
+        self._children_state: ChildrenState = {}
+        self._children_updated_at: Optional[float] = None
+        self.setup_concurrency = setup_concurrency
+        self.children_setup_ms: Optional[float] = None
+
+    @property
+    def children_state(self) -> ChildrenState:
+        return self._children_state
+
+    async def poll_update(self):
+        if not is_initialized(self.device):
+            await self._async_initialize()
+            return
+        await self.device.update()
+        await self.async_update_children()
+
+    async def _async_initialize(self) -> None:
+        client = self.device.client
+        components = (await client.get_component_negotiation()).get_or_raise()
+        state = (await client.get_device_info()).get_or_raise()
+        start = time.monotonic()
+        child_list = (await client.get_child_device_list(all_pages=True)).get_or_raise()
+        await async_initialize_hub(self.device, state, components, child_list)
+        async with self._children_lock:
+            self._children_state = await self._apply_children_state(
+                child_list, self.setup_concurrency
+            )
+            self._children_updated_at = time.monotonic()
+        self.children_setup_ms = round((time.monotonic() - start) * 1000, 1)
+
+    @callback
+    def invalidate_children(self) -> None:
+        self._children_updated_at = None
+
+    async def async_update_children(self, max_age: float = 0) -> ChildrenState:
+        """Fetch and apply the state of every child, unless fresh enough."""
+        async with self._children_lock:
+            if (
+                self._children_updated_at is not None
+                and time.monotonic() - self._children_updated_at < max_age
+            ):
+                return self._children_state
+            self._children_state = await self._fetch_children_state()
+            self._children_updated_at = time.monotonic()
+            return self._children_state
+
+    async def _fetch_children_state(self) -> ChildrenState:
+        if not self.device.children:
+            return {}
+        client = self.device.client
+        child_list = (await client.get_child_device_list(all_pages=True)).get_or_raise()
+        return await self._apply_children_state(child_list)
+
+    async def _apply_children_state(
+        self, child_list: ChildDeviceList, concurrency: int = 1
+    ) -> ChildrenState:
+        children: list[TapoDevice] = self.device.children
+        states = {
+            child["device_id"]: child
+            for child in child_list.child_device_list
+            if child.get("device_id") is not None
+        }
+        components = {}
+        if not all(is_initialized(child) for child in children):
+            components = await self._fetch_children_components()
+
+        async def _apply(child: TapoDevice) -> None:
+            if state := states.get(child_id(child)):
+                await _apply_child_state(child, state, components.get(child_id(child)))
+            else:
+                _LOGGER.debug("Child %s missing from hub child list", child_id(child))
+
+        await gather_with_concurrency(
+            concurrency, [_apply(child) for child in children]
+        )
+        return states
+
+    async def _fetch_children_components(self) -> dict[str, Components]:
+        response = await self.device.client.get_child_device_component_list()
+        if not response.is_success():
+            return {}
+        return {
+            child["device_id"]: Components.try_from_json(child)
+            for child in response.get().get("child_component_list", [])
+            if child.get("device_id") is not None
+        }
+
+
+class TapoHubChildCoordinator(TapoDataCoordinator):
+    """Coordinator of a hub child fed by the hub batched polling.
+
+    It issues no request of its own: refreshes are served from the hub
+    children snapshot, which is fetched again only when older than the hub
+    polling interval or when a refresh is explicitly requested (e.g. after a
+    command).
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        hub_coordinator: TapoHubCoordinator,
+        device: TapoDevice,
+        polling_interval: Optional[timedelta],
+    ):
+        super().__init__(hass, device, polling_interval)
+        self._hub_coordinator = hub_coordinator
+        self._unsub_hub_listener: Optional[CALLBACK_TYPE] = (
+            hub_coordinator.async_add_listener(self._handle_hub_update)
+        )
+
+    @property
+    def hub_coordinator(self) -> TapoHubCoordinator:
+        return self._hub_coordinator
+
+    async def poll_update(self):
+        max_age = (
+            self._hub_coordinator.update_interval.total_seconds()
+            if self._hub_coordinator.update_interval
+            else 0
+        )
+        children_state = await self._hub_coordinator.async_update_children(max_age)
+        return children_state.get(child_id(self.device))
+
+    async def async_request_refresh(self) -> None:
+        self._hub_coordinator.invalidate_children()
+        await super().async_request_refresh()
+
+    async def async_shutdown(self) -> None:
+        if self._unsub_hub_listener:
+            self._unsub_hub_listener()
+            self._unsub_hub_listener = None
+        await super().async_shutdown()
+
+    @callback
+    def _handle_hub_update(self) -> None:
+        if self._hub_coordinator.last_update_success:
+            self.async_set_updated_data(
+                self._hub_coordinator.children_state.get(child_id(self.device))
+            )
+        else:
+            self.async_set_update_error(self._hub_coordinator.last_exception)
+
+
+async def _apply_child_state(
+    child: TapoDevice,
+    state: dict[str, Any],
+    components: Optional[Components] = None,
+) -> None:
+    """Update a hub child from its child list entry.
+
+    The device info request of the child is saved, but not the ones its
+    components may issue (e.g. Countdown). A new child whose components could
+    not be listed falls back to a full child.update().
+    """
+    if not is_initialized(child) and components is None:
+        await child.update()
+    else:
+        await async_apply_state(child, state, components)
@@ -41,7 +41,7 @@ async def async_setup_entry(
     data = cast(HassTapoDeviceData, hass.data[DOMAIN][entry.entry_id])
     if isinstance(data.device, TapoBulb):
         light = TapoLightEntity(data.coordinator, data.device)
-        async_add_entities([light], True)
+        async_add_entities([light])
 
 
 class TapoLightEntity(CoordinatedTapoEntity, LightEntity):
@@ -1,3 +1,5 @@
+from functools import partial
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_SCAN_INTERVAL
 from homeassistant.core import HomeAssistant
@@ -5,6 +7,7 @@ from homeassistant.helpers import device_registry as dr
 from plugp100.devices import connect
 
 from custom_components.tapo.const import CONF_MAC, DEFAULT_POLLING_RATE_S
+from custom_components.tapo.request_limiter import async_connect_device
 from custom_components.tapo.setup_helpers import (
     create_aiohttp_session,
     create_device_config,
@@ -12,8 +15,13 @@ from custom_components.tapo.setup_helpers import (
 
 
 async def migrate_entry_to_v8(hass: HomeAssistant, config_entry: ConfigEntry):
-    session = create_aiohttp_session(hass)
-    device = await connect(config=create_device_config(config_entry), session=session)
+    device_config = create_device_config(config_entry)
+    session = create_aiohttp_session(hass, device_config.host)
+    device = await async_connect_device(
+        hass,
+        device_config.host,
+        partial(connect, config=device_config, session=session),
+    )
     await device.update()
     new_data = {**config_entry.data}
     scan_interval = new_data.pop(CONF_SCAN_INTERVAL, DEFAULT_POLLING_RATE_S)
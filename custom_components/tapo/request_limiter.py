@@ -0,0 +1,268 @@
+import asyncio
+from collections import defaultdict
+from contextlib import asynccontextmanager
+import heapq
+import itertools
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+import async_timeout
+from homeassistant.core import HomeAssistant
+from plugp100.api.protocol.tapo_protocol import TapoProtocol
+from plugp100.api.requests.tapo_request import (
+    ControlChildParams,
+    MultipleRequestParams,
+    TapoRequest,
+)
+from plugp100.api.transport.response import TapoResponse
+from plugp100.common.functional.tri import Failure, Try
+from plugp100.devices.base import TapoDevice
+
+from custom_components.tapo.adaptive_timeout import AdaptiveTimeout
+from custom_components.tapo.const import (
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_MAX_HOST_REQUESTS,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_MAX_HOST_REQUESTS,
+    REQUEST_LIMITER,
+)
+from custom_components.tapo.device_adapter import wrap_protocol
+from custom_components.tapo.domain_data import get_domain_singleton
+from custom_components.tapo.setup_helpers import get_domain_option
+
+PRIORITY_COMMAND = 0
+PRIORITY_POLL = 1
+PRIORITY_BACKGROUND = 2
+
+_COMMAND_METHODS = {
+    "add_countdown_rule",
+    "device_reboot",
+    "fw_download",
+    "play_alarm",
+    "stop_alarm",
+}
+_BACKGROUND_METHODS = {
+    "get_auto_update_info",
+    "get_fw_download_state",
+    "get_latest_fw",
+}
+
+
+def request_priority(request: TapoRequest) -> int:
+    """Priority of a request, lower values are served first."""
+    methods = request_methods(request)
+    if any(is_command_method(method) for method in methods):
+        return PRIORITY_COMMAND
+    if methods and all(method in _BACKGROUND_METHODS for method in methods):
+        return PRIORITY_BACKGROUND
+    return PRIORITY_POLL
+
+
+def is_command_method(method: str) -> bool:
+    return method.startswith("set_") or method in _COMMAND_METHODS
+
+
+def request_methods(request: TapoRequest) -> list[str]:
+    """Methods carried by a request, unwrapping child and multiple requests."""
+    params = request.params
+    if isinstance(params, ControlChildParams):
+        return request_methods(params.requestData)
+    if isinstance(params, MultipleRequestParams):
+        return [
+            method for inner in params.requests for method in request_methods(inner)
+        ]
+    return [request.method]
+
+
+def request_operation(request: TapoRequest) -> str:
+    """Operation type of a request, to keep latency samples apart."""
+    return "+".join(request_methods(request))
+
+
+class _PrioritySemaphore:
+    """Semaphore waking up waiters by priority, then by arrival order."""
+
+    def __init__(self, limit: int):
+        self._limit = limit
+        self._in_use = 0
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._counter = itertools.count()
+
+    @property
+    def in_use(self) -> int:
+        return self._in_use
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for _, _, waiter in self._waiters if not waiter.done())
+
+    async def acquire(self, priority: int) -> None:
+        if self._in_use < self._limit and not self.queued:
+            self._in_use += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # the slot was handed over right before the cancellation
+                self.release()
+            raise
+
+    def release(self) -> None:
+        while self._waiters:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                # hand the slot over, keeping it in use
+                waiter.set_result(None)
+                return
+        self._in_use -= 1
+
+
+class TapoRequestLimiter:
+    """Domain wide cap of the concurrent requests sent to the devices.
+
+    Requests need both a slot of their host and a global one. Waiters are
+    served by priority, so user commands overtake polls and background
+    checks queued during a boot storm.
+    """
+
+    def __init__(self, global_limit: int, host_limit: int):
+        self._host_limit = host_limit
+        self._global = _PrioritySemaphore(global_limit)
+        self._hosts: dict[str, _PrioritySemaphore] = {}
+        self._requests = 0
+        self._total_wait_s = 0.0
+        self._max_wait_s = 0.0
+
+    @asynccontextmanager
+    async def slot(self, host: str, priority: int) -> AsyncIterator[None]:
+        host_semaphore = self._hosts.setdefault(
+            host, _PrioritySemaphore(self._host_limit)
+        )
+        start = time.monotonic()
+        await host_semaphore.acquire(priority)
+        try:
+            await self._global.acquire(priority)
+        except BaseException:
+            host_semaphore.release()
+            raise
+        self._record_wait(time.monotonic() - start)
+        try:
+            yield
+        finally:
+            self._global.release()
+            host_semaphore.release()
+
+    def _record_wait(self, wait_s: float) -> None:
+        self._requests += 1
+        self._total_wait_s += wait_s
+        self._max_wait_s = max(self._max_wait_s, wait_s)
+
+    def diagnostics(self) -> dict[str, Any]:
+        return {
+            "requests": self._requests,
+            "in_flight": self._global.in_use,
+            "queued": self._global.queued
+            + sum(semaphore.queued for semaphore in self._hosts.values()),
+            "avg_wait_ms": round(self._total_wait_s / self._requests * 1000, 1)
+            if self._requests
+            else 0,
+            "max_wait_ms": round(self._max_wait_s * 1000, 1),
+        }
+
+
+class ProtocolWrapper(TapoProtocol):
+    """Protocol delegating to `inner`, the base of the integration wrappers."""
+
+    def __init__(self, protocol: TapoProtocol):
+        self.inner = protocol
+
+    @property
+    def name(self) -> str:
+        return self.inner.name
+
+    async def close(self):
+        await self.inner.close()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.inner, name)
+
+
+class LimitedTapoProtocol(ProtocolWrapper):
+    """Protocol wrapper sending every request through the request limiter.
+
+    Requests are abandoned after the adaptive timeout of their operation,
+    which is measured once the slot is acquired, so waiting behind other
+    requests neither counts as device latency nor times out.
+    """
+
+    def __init__(self, protocol: TapoProtocol, limiter: TapoRequestLimiter, host: str):
+        super().__init__(protocol)
+        self._limiter = limiter
+        self._host = host
+        self.timeouts: defaultdict[str, AdaptiveTimeout] = defaultdict(AdaptiveTimeout)
+
+    @property
+    def host(self) -> str:
+        return self._host
+
+    def follow_host(self, host: str) -> None:
+        """Take the slots of `host`, forgetting the latency of the old one."""
+        self._host = host
+        self.timeouts.clear()
+
+    async def send_request(
+        self, request: TapoRequest, retry: int = 3
+    ) -> Try[TapoResponse[dict[str, Any]]]:
+        async with self._limiter.slot(self._host, request_priority(request)):
+            timeout = self.timeouts[request_operation(request)]
+            limit_s = timeout.timeout
+            start = time.monotonic()
+            try:
+                async with async_timeout.timeout(limit_s):
+                    response = await self.inner.send_request(request, retry)
+            except asyncio.TimeoutError:
+                timeout.record_timeout()
+                return Failure(asyncio.TimeoutError(f"Timeout after {limit_s:.1f}s"))
+            if response.is_success():
+                timeout.record_success(time.monotonic() - start)
+            return response
+
+
+def get_request_limiter(hass: HomeAssistant) -> TapoRequestLimiter:
+    return get_domain_singleton(
+        hass,
+        REQUEST_LIMITER,
+        lambda: TapoRequestLimiter(
+            get_domain_option(
+                hass, CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS
+            ),
+            get_domain_option(hass, CONF_MAX_HOST_REQUESTS, DEFAULT_MAX_HOST_REQUESTS),
+        ),
+    )
+
+
+def limit_device_requests(hass: HomeAssistant, device: TapoDevice) -> None:
+    """Route the requests of `device` (and its children) through the limiter."""
+    if not isinstance(device.client.protocol, LimitedTapoProtocol):
+        limiter = get_request_limiter(hass)
+        wrap_protocol(
+            device.client,
+            lambda protocol: LimitedTapoProtocol(protocol, limiter, device.host),
+        )
+
+
+async def async_connect_device(
+    hass: HomeAssistant, host: str, connect: Callable[[], Awaitable[TapoDevice]]
+) -> TapoDevice:
+    """Create a device with `connect`, routing all of its requests to the limiter.
+
+    plugp100 guesses the protocol and fetches the device info before the
+    client exists to be wrapped, so `connect` runs under one slot of `host`.
+    """
+    async with get_request_limiter(hass).slot(host, PRIORITY_POLL):
+        device = await connect()
+    limit_device_requests(hass, device)
+    return device
@@ -0,0 +1,116 @@
+import itertools
+import math
+import random
+from typing import Any, Hashable, Optional
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.tapo.const import (
+    POLL_MAX_SLOTS,
+    POLL_SCHEDULER,
+    POLL_SLOT_WIDTH_S,
+)
+from custom_components.tapo.domain_data import get_domain_singleton
+
+
+class TapoPollScheduler:
+    """Domain wide scheduler spreading the coordinators polls over time.
+
+    Every polling interval is split in slots of POLL_SLOT_WIDTH_S seconds, at
+    most POLL_MAX_SLOTS of them, and each coordinator is pinned to the least
+    occupied slot of its interval, so devices sharing the same interval no
+    longer poll in lockstep. A random jitter inside the slot is applied to
+    every tick. Only the occupied slots are stored.
+
+    Coordinators acquiring with the same `group` share the slot of the group,
+    which is held until the last of them releases it.
+    """
+
+    def __init__(
+        self, slot_width: float = POLL_SLOT_WIDTH_S, max_slots: int = POLL_MAX_SLOTS
+    ):
+        self._slot_width = slot_width
+        self._max_slots = max_slots
+        self._occupancy: dict[float, dict[int, int]] = {}
+        self._assignments: dict[Hashable, tuple[float, int]] = {}
+        self._owners: dict[Hashable, Hashable] = {}
+        self._members: dict[Hashable, set[Hashable]] = {}
+
+    def acquire(
+        self, key: Hashable, interval: float, group: Optional[Hashable] = None
+    ) -> int:
+        """Pin `key`, or its `group`, to a slot of `interval`; returns the slot."""
+        owner = key if group is None else group
+        if (previous := self._owners.get(key)) is not None and previous != owner:
+            self.release(key)
+        self._owners[key] = owner
+        self._members.setdefault(owner, set()).add(key)
+        if (assignment := self._assignments.get(owner)) is not None:
+            if assignment[0] == interval:
+                return assignment[1]
+            self._free(owner)
+        occupancy = self._occupancy.setdefault(interval, {})
+        if len(occupancy) < self._slot_count(interval):
+            slot = next(slot for slot in itertools.count() if slot not in occupancy)
+        else:
+            slot = min(occupancy, key=lambda used: (occupancy[used], used))
+        occupancy[slot] = occupancy.get(slot, 0) + 1
+        self._assignments[owner] = (interval, slot)
+        return slot
+
+    def release(self, key: Hashable) -> None:
+        if (owner := self._owners.pop(key, None)) is not None:
+            members = self._members[owner]
+            members.discard(key)
+            if not members:
+                del self._members[owner]
+                self._free(owner)
+
+    def _free(self, owner: Hashable) -> None:
+        if (assignment := self._assignments.pop(owner, None)) is not None:
+            interval, slot = assignment
+            occupancy = self._occupancy[interval]
+            occupancy[slot] -= 1
+            if not occupancy[slot]:
+                del occupancy[slot]
+            if not occupancy:
+                del self._occupancy[interval]
+
+    def next_refresh(
+        self,
+        key: Hashable,
+        now: float,
+        interval: float,
+        group: Optional[Hashable] = None,
+    ) -> float:
+        """Return the loop time of the next tick of `key` after `now`.
+
+        Ticks are aligned to the slot phase of the coordinator; a tick falling
+        within half an interval from now is moved to the following period.
+        """
+        slot = self.acquire(key, interval, group)
+        phase = slot * interval / self._slot_count(interval)
+        periods = math.ceil((now + interval / 2 - phase) / interval)
+        jitter = random.uniform(0, min(self._slot_width, interval))
+        return phase + periods * interval + jitter
+
+    def _slot_count(self, interval: float) -> int:
+        return max(1, min(self._max_slots, math.floor(interval / self._slot_width)))
+
+    def diagnostics(self) -> dict[str, Any]:
+        return {
+            "slot_width_s": self._slot_width,
+            "coordinators": len(self._owners),
+            "intervals": {
+                str(interval): {
+                    "slots": self._slot_count(interval),
+                    "used_slots": len(occupancy),
+                    "max_per_slot": max(occupancy.values()),
+                }
+                for interval, occupancy in self._occupancy.items()
+            },
+        }
+
+
+def get_poll_scheduler(hass: HomeAssistant) -> TapoPollScheduler:
+    return get_domain_singleton(hass, POLL_SCHEDULER, TapoPollScheduler)
@@ -68,7 +68,7 @@ def _setup_from_coordinator(
                 for factory in SUPPORTED_ENERGY_SENSOR
             ]
         )
-    async_add_entities(sensors, True)
+    async_add_entities(sensors)
 
 
 def _setup_socket_sensors(
@@ -81,7 +81,7 @@ def _setup_socket_sensors(
             SocketTapoSensor(coordinator, coordinator.device, factory())
             for factory in SUPPORTED_ENERGY_SENSOR
         ]
-        async_add_entities(sensors, True)
+        async_add_entities(sensors)
 
 
 class TapoSensor(CoordinatedTapoEntity, SensorEntity):
@@ -145,5 +145,5 @@ class SocketTapoSensor(TapoSensor):
             "manufacturer": "TP-Link",
             "sw_version": self.device.firmware_version,
             "hw_version": self.device.device_info.hardware_version,
-            "via_device": (DOMAIN, self.device._parent_info.device_id),
+            "via_device": (DOMAIN, self.device.parent_device_id),
         }
@@ -81,11 +81,12 @@ class CurrentEnergySensorSource(TapoSensorSource):
 
     def get_value(self, coordinator: TapoDataCoordinator) -> StateType:
         if energy := _get_energy_component(coordinator):
+            # power is refreshed every poll, energy usage only once every N
+            if energy.power_info and energy.power_info.current_power is not None:
+                return energy.power_info.current_power
             info = energy.energy_info
             if info and info.current_power is not None:
                 return _milli_to_base(info.current_power)
-            if energy.power_info and energy.power_info.current_power is not None:
-                return energy.power_info.current_power
         return None
 
 
@@ -0,0 +1,91 @@
+import asyncio
+from contextlib import asynccontextmanager
+import logging
+from typing import AsyncIterator, Optional
+
+import aiohttp
+from aiohttp import ClientSession, TCPConnector
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
+
+from custom_components.tapo.const import (
+    SESSION_KEEPALIVE_S,
+    SESSION_POOL,
+    SESSION_POOL_SIZE,
+)
+from custom_components.tapo.domain_data import get_domain_singleton
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TapoSessionPool:
+    """Per host client sessions sharing a single bounded connection pool.
+
+    Every host gets its own session, so the device session cookies stay
+    isolated, while the TCP connections are kept alive and pooled by one
+    connector shared by all the entries, config flows and migrations.
+    """
+
+    def __init__(self):
+        self._connector: Optional[TCPConnector] = None
+        self._sessions: dict[str, ClientSession] = {}
+
+    def get(self, host: str) -> ClientSession:
+        session = self._sessions.get(host)
+        if session is None or session.closed:
+            session = self._new_session()
+            self._sessions[host] = session
+        return session
+
+    @asynccontextmanager
+    async def probe_session(self) -> AsyncIterator[ClientSession]:
+        """Throwaway session on the shared connector, for one-off probes.
+
+        Probes (e.g. of config flows) may never become entries, so their
+        session is closed once done instead of being kept for the host.
+        """
+        session = self._new_session()
+        try:
+            yield session
+        finally:
+            await session.close()
+
+    async def async_release(self, host: str) -> None:
+        if (session := self._sessions.pop(host, None)) is not None:
+            await session.close()
+
+    async def async_close(self, _event: Optional[Event] = None) -> None:
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        await asyncio.gather(*(session.close() for session in sessions))
+        if self._connector is not None:
+            await self._connector.close()
+            self._connector = None
+
+    def _new_session(self) -> ClientSession:
+        return ClientSession(
+            connector=self._get_connector(),
+            connector_owner=False,
+            cookie_jar=aiohttp.CookieJar(unsafe=True, quote_cookie=False),
+            headers={"User-Agent": SERVER_SOFTWARE},
+        )
+
+    def _get_connector(self) -> TCPConnector:
+        if self._connector is None or self._connector.closed:
+            # devices are reached by IP, so there is nothing worth caching in DNS
+            self._connector = TCPConnector(
+                limit=SESSION_POOL_SIZE,
+                use_dns_cache=False,
+                keepalive_timeout=SESSION_KEEPALIVE_S,
+            )
+        return self._connector
+
+
+def get_session_pool(hass: HomeAssistant) -> TapoSessionPool:
+    def _create_pool() -> TapoSessionPool:
+        pool = TapoSessionPool()
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, pool.async_close)
+        return pool
+
+    return get_domain_singleton(hass, SESSION_POOL, _create_pool)
@@ -1,23 +1,31 @@
 import logging
+from typing import Any
 
-import aiohttp
 from aiohttp import ClientSession
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
 from plugp100.common.credentials import AuthCredential
 from plugp100.devices.factory import DeviceConnectConfiguration
 
-from custom_components.tapo.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
+from custom_components.tapo.const import (
+    CONF_HOST,
+    CONF_PASSWORD,
+    CONF_USERNAME,
+    DOMAIN,
+    DOMAIN_CONFIG,
+)
+from custom_components.tapo.session_pool import get_session_pool
 
 _LOGGGER = logging.getLogger(__name__)
 
 
-def create_aiohttp_session(hass: HomeAssistant) -> ClientSession:
-    session = async_create_clientsession(
-        hass, cookie_jar=aiohttp.CookieJar(unsafe=True, quote_cookie=False)
-    )
-    return session
+def create_aiohttp_session(hass: HomeAssistant, host: str) -> ClientSession:
+    return get_session_pool(hass).get(host)
+
+
+def get_domain_option(hass: HomeAssistant, key: str, default: Any) -> Any:
+    domain_config = hass.data.get(DOMAIN, {}).get(DOMAIN_CONFIG, {})
+    return domain_config.get(key, default)
 
 
 def create_device_config(config: ConfigEntry) -> DeviceConnectConfiguration:
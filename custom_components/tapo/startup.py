@@ -0,0 +1,43 @@
+import random
+from typing import Callable, Optional
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.start import async_at_started
+
+
+@callback
+def async_call_after_started(
+    hass: HomeAssistant,
+    action: Callable[[], None],
+    max_delay_s: float,
+) -> CALLBACK_TYPE:
+    """Run `action` once Home Assistant has started, plus a random delay.
+
+    Requests which are not needed to use the devices, like the firmware
+    checks, wait for the end of the startup and are spread over
+    `max_delay_s`, so they do not compete with the state polls of the other
+    devices. Returns a callback cancelling the pending call.
+    """
+    unsub_delay: Optional[CALLBACK_TYPE] = None
+
+    @callback
+    def _run(_now) -> None:
+        nonlocal unsub_delay
+        unsub_delay = None
+        action()
+
+    @callback
+    def _started(_hass: HomeAssistant) -> None:
+        nonlocal unsub_delay
+        unsub_delay = async_call_later(hass, random.uniform(0, max_delay_s), _run)
+
+    unsub_started = async_at_started(hass, _started)
+
+    @callback
+    def _cancel() -> None:
+        unsub_started()
+        if unsub_delay is not None:
+            unsub_delay()
+
+    return _cancel
@@ -34,11 +34,10 @@ async def async_setup_device_switch(
     if isinstance(device, TapoPlug):
         if device.is_strip:
             async_add_devices(
-                [TapoPlugEntity(data.coordinator, sock) for sock in device.sockets],
-                True,
+                [TapoPlugEntity(data.coordinator, sock) for sock in device.sockets]
             )
         else:
-            async_add_devices([TapoPlugEntity(data.coordinator, device)], True)
+            async_add_devices([TapoPlugEntity(data.coordinator, device)])
 
 
 class TapoPlugEntity(CoordinatedTapoEntity, SwitchEntity):
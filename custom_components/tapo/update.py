@@ -8,7 +8,7 @@ from homeassistant.components.update import (
     UpdateEntityFeature,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from plugp100.devices.base import TapoDevice
@@ -20,8 +20,15 @@ from plugp100.models.firmware import (
 )
 
 from custom_components.tapo import DOMAIN, HassTapoDeviceData
+from custom_components.tapo.const import FIRMWARE_REFRESH_DELAY_MAX_S
 from custom_components.tapo.coordinators import TapoDataCoordinator
 from custom_components.tapo.entity import CoordinatedTapoEntity
+from custom_components.tapo.firmware_cache import (
+    TapoFirmwareCache,
+    async_get_firmware_cache,
+    firmware_key,
+)
+from custom_components.tapo.startup import async_call_after_started
 
 POLL_DELAY_IDLE = timedelta(seconds=6 * 60 * 60)
 POLL_DELAY_UPGRADE = timedelta(seconds=60)
@@ -33,55 +40,113 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     data = cast(HassTapoDeviceData, hass.data[DOMAIN][entry.entry_id])
-    if data.coordinator.is_hub:
-        coordinators = [
-            TapoDeviceFirmwareDataCoordinator(hass, coordinator.device, POLL_DELAY_IDLE)
-            for coordinator in data.child_coordinators
-        ]
-    else:
-        coordinators = [
-            TapoDeviceFirmwareDataCoordinator(
-                hass, data.coordinator.device, POLL_DELAY_IDLE
-            )
-        ]
-
+    devices = (
+        [coordinator.device for coordinator in data.child_coordinators]
+        if data.coordinator.is_hub
+        else [data.coordinator.device]
+    )
+    # one coordinator checks all the children of a hub
+    coordinator = TapoDeviceFirmwareDataCoordinator(
+        hass,
+        data.coordinator.device,
+        POLL_DELAY_IDLE,
+        await async_get_firmware_cache(hass),
+        devices,
+    )
+    coordinator.load_cached()
     async_add_entities(
-        [
-            TapoDeviceFirmwareEntity(coordinator, coordinator.device)
-            for coordinator in coordinators
-        ],
-        True,
+        [TapoDeviceFirmwareEntity(coordinator, device) for device in devices]
+    )
+
+    # The first check waits for the end of the startup and is spread over a
+    # window, instead of running with the state polls of every other device.
+    @callback
+    def _first_refresh() -> None:
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), "tapo firmware check"
+        )
+
+    entry.async_on_unload(
+        async_call_after_started(hass, _first_refresh, FIRMWARE_REFRESH_DELAY_MAX_S)
     )
 
 
 class TapoDeviceFirmwareDataCoordinator(TapoDataCoordinator):
+    """Firmware status of `devices`, the device itself or the hub children.
+
+    The latest firmware is checked once per model, hardware and firmware
+    version and cached; the download state is fetched only for the devices
+    with an update available, which are the only ones that can be upgrading.
+    The auto upgrade setting it carries is kept for the other devices.
+    """
+
     def __init__(
-        self, hass: HomeAssistant, device: TapoDevice, polling_interval: timedelta
+        self,
+        hass: HomeAssistant,
+        device: TapoDevice,
+        polling_interval: timedelta,
+        cache: TapoFirmwareCache,
+        devices: Optional[list[TapoDevice]] = None,
     ):
         super().__init__(hass, device, polling_interval)
-        self._latest_firmware: Optional[LatestFirmware] = None
-        self._download_status: Optional[FirmwareDownloadProgress] = None
+        self._cache = cache
+        self._devices = devices if devices is not None else [device]
+        self._latest_firmware: dict[str, LatestFirmware] = {}
+        self._download_status: dict[str, FirmwareDownloadProgress] = {}
+        self._auto_upgrade: dict[str, bool] = {}
 
-    @property
-    def latest_firmware(self) -> Optional[LatestFirmware]:
-        return self._latest_firmware
+    def latest_firmware(self, device: TapoDevice) -> Optional[LatestFirmware]:
+        return self._latest_firmware.get(device.device_id)
 
-    @property
-    def download_progress(self) -> Optional[FirmwareDownloadProgress]:
-        return self._download_status
+    def download_progress(
+        self, device: TapoDevice
+    ) -> Optional[FirmwareDownloadProgress]:
+        return self._download_status.get(device.device_id)
+
+    def auto_upgrade(self, device: TapoDevice) -> Optional[bool]:
+        """Last known auto upgrade setting, None until a download state is read."""
+        return self._auto_upgrade.get(device.device_id)
+
+    def load_cached(self) -> None:
+        for device in self._devices:
+            if latest := self._cache.get(firmware_key(device)):
+                self._latest_firmware[device.device_id] = latest
 
     async def poll_update(self):
-        self._latest_firmware = (await self.device.get_latest_firmware()).get_or_raise()
-        self._download_status = (
-            await self.device.get_firmware_download_state()
-        ).get_or_raise()
-        if (
-            self._download_status.status == FirmwareDownloadStatus.DOWNLOADING
-            or self._download_status.status == FirmwareDownloadStatus.PREPARING
-        ):
-            self.update_interval = POLL_DELAY_UPGRADE
-        else:
-            self.update_interval = POLL_DELAY_IDLE
+        groups: dict[str, list[TapoDevice]] = {}
+        for device in self._devices:
+            groups.setdefault(firmware_key(device), []).append(device)
+
+        error = None
+        for key, devices in groups.items():
+            latest = self._cache.get(key)
+            if latest is None:
+                result = await devices[0].get_latest_firmware()
+                if not result.is_success():
+                    error = result.error()
+                    continue
+                latest = result.get()
+                self._cache.save(key, latest)
+            for device in devices:
+                self._latest_firmware[device.device_id] = latest
+                if not latest.need_to_upgrade:
+                    self._download_status.pop(device.device_id, None)
+                    continue
+                download = await device.get_firmware_download_state()
+                if download.is_success():
+                    self._download_status[device.device_id] = download.get()
+                    self._auto_upgrade[device.device_id] = download.get().auto_upgrade
+                else:
+                    error = download.error()
+        if error is not None and not self._latest_firmware:
+            raise error
+
+        upgrading = any(
+            status.status
+            in (FirmwareDownloadStatus.DOWNLOADING, FirmwareDownloadStatus.PREPARING)
+            for status in self._download_status.values()
+        )
+        self.update_interval = POLL_DELAY_UPGRADE if upgrading else POLL_DELAY_IDLE
         return self._latest_firmware
 
 
@@ -93,6 +158,8 @@ class TapoDeviceFirmwareEntity(CoordinatedTapoEntity, UpdateEntity):
         | UpdateEntityFeature.RELEASE_NOTES
     )
     _attr_device_class = UpdateDeviceClass.FIRMWARE
+    # state comes from the firmware coordinator, not from the device state
+    _skip_unchanged_writes = False
 
     coordinator: TapoDeviceFirmwareDataCoordinator
 
@@ -104,8 +171,8 @@ class TapoDeviceFirmwareEntity(CoordinatedTapoEntity, UpdateEntity):
 
     def release_notes(self) -> str | None:
         """Get the release notes for the latest update."""
-        status = self.coordinator.latest_firmware
-        if status.need_to_upgrade:
+        status = self.coordinator.latest_firmware(self.device)
+        if status and status.need_to_upgrade:
             return status.release_note
         return None
 
@@ -135,16 +202,16 @@ class TapoDeviceFirmwareEntity(CoordinatedTapoEntity, UpdateEntity):
 
     @property
     def latest_version(self) -> str | None:
-        status = self.coordinator.latest_firmware
+        status = self.coordinator.latest_firmware(self.device)
         return (
             status.firmware_version
-            if status.firmware_version and status.need_to_upgrade
+            if status and status.firmware_version and status.need_to_upgrade
             else self.device.firmware_version
         )
 
     @property
     def in_progress(self) -> bool | int | None:
-        download_progress = self.coordinator.download_progress
+        download_progress = self.coordinator.download_progress(self.device)
         if download_progress is None:
             return False
         if download_progress.status in (
@@ -155,9 +222,8 @@ class TapoDeviceFirmwareEntity(CoordinatedTapoEntity, UpdateEntity):
         return False
 
     @property
-    def auto_update(self) -> bool:
-        download_progress = self.coordinator.download_progress
-        return download_progress.auto_upgrade if download_progress else False
+    def auto_update(self) -> bool | None:
+        return self.coordinator.auto_upgrade(self.device)
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -70,11 +70,16 @@ def expected_lingering_tasks() -> bool:
     return True
 
 
+async def _no_discovered_devices(*_args):
+    return
+    yield
+
+
 @pytest.fixture(autouse=True)
 def disable_background_discovery():
     with patch(
-        "custom_components.tapo.discovery_tapo_devices",
-        AsyncMock(return_value={}),
+        "custom_components.tapo.discovery.stream_tapo_devices",
+        _no_discovered_devices,
     ):
         yield
 
@@ -122,8 +127,8 @@ async def setup_platform(
         "custom_components.tapo.hass_tapo.connect", AsyncMock(return_value=device)
     ):
         with patch(
-            "custom_components.tapo.discovery_tapo_devices",
-            AsyncMock(return_value={}),
+            "custom_components.tapo.discovery.stream_tapo_devices",
+            _no_discovered_devices,
         ):
             with patch.object(
                 hass.config_entries,
@@ -17,6 +17,7 @@ from custom_components.tapo import (
     DOMAIN,
 )
 from custom_components.tapo.const import STEP_DISCOVERY_REQUIRE_AUTH
+from custom_components.tapo.session_pool import get_session_pool
 
 from .conftest import IP_ADDRESS, MAC_ADDRESS
 
@@ -58,6 +59,28 @@ async def test_discovery_auth(
     assert auth_result["data"][CONF_DISCOVERED_DEVICE_INFO] == mock_discovery.as_dict
 
 
+async def test_failed_probe_leaves_no_session(hass: HomeAssistant) -> None:
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    with patch(
+        "custom_components.tapo.config_flow.connect",
+        AsyncMock(side_effect=Exception("unreachable")),
+    ) as connect:
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            user_input={
+                CONF_HOST: IP_ADDRESS,
+                CONF_USERNAME: "fake_username",
+                CONF_PASSWORD: "fake_password",
+            },
+        )
+
+    assert result["errors"] == {"base": "cannot_connect"}
+    assert connect.call_args.kwargs["session"].closed
+    assert IP_ADDRESS not in get_session_pool(hass)._sessions
+
+
 async def test_discovery_ip_change_dhcp(
     hass: HomeAssistant, mock_discovery: DiscoveredDevice
 ) -> None:
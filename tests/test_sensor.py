@@ -50,3 +50,12 @@ async def test_switch_emeter(hass: HomeAssistant, device: MagicMock):
     }
     for state_id, values in expected_emeter.items():
         assert hass.states.get(state_id).state == str(values["value"])
+
+
+async def test_setup_does_not_refresh_again_per_entity(hass: HomeAssistant):
+    device = mock_plug(with_emeter=True)
+    await setup_platform(hass, device, [SENSOR_DOMAIN])
+    await hass.async_block_till_done()
+
+    # setup_platform, entry setup and the coordinator first refresh
+    assert device.update.await_count == 3
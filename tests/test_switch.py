@@ -1,5 +1,7 @@
 """Test tapo switch."""
 
+from unittest.mock import AsyncMock
+
 from homeassistant.components.switch import (
     DOMAIN as SWITCH_DOMAIN,
     SERVICE_TURN_OFF,
@@ -85,3 +87,16 @@ async def test_plug_strip_child_onoff(hass: HomeAssistant):
         )
         sock.turn_off.assert_called_once()
         sock.turn_off.reset_mock()
+
+
+async def test_plug_strip_failed_socket_is_skipped(hass: HomeAssistant):
+    device = mock_plug_strip()
+    device.sockets[1].update = AsyncMock(side_effect=Exception("socket timeout"))
+    config_entry = await setup_platform(hass, device, [SWITCH_DOMAIN])
+    data = hass.data[DOMAIN][config_entry.entry_id]
+    assert [c.device for c in data.child_coordinators] == [
+        device.sockets[0],
+        device.sockets[2],
+    ]
+    assert data.setup_diagnostics["sockets_count"] == 3
+    assert data.setup_diagnostics["sockets_failed"] == 1
@@ -0,0 +1,253 @@
+"""Offline simulation of the hub event log poller.
+
+`replay_latency_trace` feeds a latency trace straight to a polling
+controller, so controllers can be compared cycle by cycle.
+
+`simulate_poller` drives a real HubEventLogPoller against simulated trigger
+buttons on a virtual clock: every request to the hub consumes the next
+latency of a synthetic or recorded trace (None for a timeout), presses show
+up in the button logs at their scheduled time and the timer of the poller
+jumps the clock forward. The report gives the event detection delay, the
+share of time the hub spent serving the poller and how often the interval
+changed, so the polling constants can be tuned and checked in CI without
+devices.
+"""
+
+from dataclasses import dataclass, field
+import itertools
+from typing import Iterable, Optional, Sequence
+from unittest.mock import MagicMock, Mock, patch
+
+from plugp100.common.functional.tri import Failure, Success, Try
+from plugp100.errors import TapoException
+from plugp100.models.hub_children.button import S200BEvent, SingleClickEvent
+from plugp100.models.hub_children.logs import TriggerLogResponse
+
+from custom_components.tapo.coordinators import TapoDataCoordinator
+from custom_components.tapo.hub.event import EventLogPollResult, HubEventLogPoller
+from custom_components.tapo.hub.event_cursors import TapoEventCursorStore
+from custom_components.tapo.hub.polling_controller import PollingController
+
+
+@dataclass
+class TraceReplay:
+    """Outcome of a latency trace replayed against a controller."""
+
+    intervals_ms: list[float] = field(default_factory=list)
+    utilizations: list[float] = field(default_factory=list)
+    failures: int = 0
+
+    @property
+    def mean_interval_ms(self) -> float:
+        return sum(self.intervals_ms) / len(self.intervals_ms)
+
+    @property
+    def mean_utilization(self) -> float:
+        return sum(self.utilizations) / len(self.utilizations)
+
+    @property
+    def interval_changes(self) -> int:
+        return sum(
+            1
+            for previous, current in zip(self.intervals_ms, self.intervals_ms[1:])
+            if previous != current
+        )
+
+
+def replay_latency_trace(
+    controller: PollingController,
+    trace: Iterable[Optional[float]],
+    budget: float,
+) -> TraceReplay:
+    """Feed a recorded latency trace (None for failures) to `controller`.
+
+    Each cycle is issued with the interval in effect when it started, so
+    the replay is deterministic and controllers can be compared offline.
+    """
+    replay = TraceReplay()
+    for latency_ms in trace:
+        interval_ms = controller.interval_ms
+        replay.intervals_ms.append(interval_ms)
+        if latency_ms is None:
+            replay.failures += 1
+            controller.on_failure(budget)
+        else:
+            replay.utilizations.append(latency_ms / interval_ms)
+            controller.on_sample(latency_ms, budget)
+    return replay
+
+
+class VirtualClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return 1_700_000_000 + self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@dataclass
+class SimulationReport:
+    duration_s: float
+    cycles: int
+    busy_s: float
+    intervals_s: list[float] = field(default_factory=list)
+    detection_delays_s: list[float] = field(default_factory=list)
+    missed_events: int = 0
+
+    @property
+    def mean_detection_delay_s(self) -> float:
+        return sum(self.detection_delays_s) / len(self.detection_delays_s)
+
+    @property
+    def max_detection_delay_s(self) -> float:
+        return max(self.detection_delays_s)
+
+    @property
+    def utilization(self) -> float:
+        return self.busy_s / self.duration_s
+
+    @property
+    def interval_changes(self) -> int:
+        return sum(
+            1
+            for previous, current in zip(self.intervals_s, self.intervals_s[1:])
+            if previous != current
+        )
+
+
+class _Hub:
+    """Serves the requests of the simulated buttons one latency at a time."""
+
+    def __init__(
+        self,
+        clock: VirtualClock,
+        latencies_ms: Iterable[Optional[float]],
+        timeout_s: float,
+    ):
+        self.clock = clock
+        self.busy_s = 0.0
+        self._latencies_ms = itertools.cycle(latencies_ms)
+        self._timeout_s = timeout_s
+
+    def serve(self) -> bool:
+        latency_ms = next(self._latencies_ms)
+        elapsed_s = self._timeout_s if latency_ms is None else latency_ms / 1000
+        self.clock.advance(elapsed_s)
+        self.busy_s += elapsed_s
+        return latency_ms is not None
+
+
+class _SimulatedButton:
+    """Trigger button whose log holds the presses happened so far."""
+
+    def __init__(self, device_id: str, hub: _Hub, presses: Sequence[float]):
+        self.device_id = device_id
+        self._child_id = device_id
+        self.presses = sorted(presses)
+        self._hub = hub
+
+    async def get_event_logs(
+        self, page_size: int, start_id: int = 0
+    ) -> Try[TriggerLogResponse[S200BEvent]]:
+        if not self._hub.serve():
+            return Failure(TimeoutError("simulated timeout"))
+        latest_id = sum(1 for at in self.presses if at <= self._hub.clock.now)
+        start_id = start_id or latest_id
+        events = [
+            SingleClickEvent(event_id, round(self.presses[event_id - 1]))
+            for event_id in range(start_id, max(start_id - page_size, 0), -1)
+        ]
+        return Success(TriggerLogResponse(latest_id, latest_id, events))
+
+
+async def simulate_poller(
+    cursor_store: TapoEventCursorStore,
+    latencies_ms: Sequence[Optional[float]],
+    duration_s: float,
+    presses: Sequence[Sequence[float]] = ((),),
+    controller: Optional[PollingController] = None,
+    timeout_s: float = 5.0,
+    **poller_kwargs,
+) -> SimulationReport:
+    """Run the poller for `duration_s` virtual seconds.
+
+    `presses` holds the press times of every simulated button, the latency
+    trace is replayed in a loop for the requests of all of them.
+    """
+    clock = VirtualClock()
+    hub = _Hub(clock, latencies_ms, timeout_s)
+    hub_coordinator = Mock(TapoDataCoordinator)
+    hub_coordinator.device.children = []
+    # one request per button, as on hubs rejecting batched requests
+    hub_coordinator.device.client.execute_raw_request = _unsupported
+    hass = MagicMock()
+    pending = []
+    hass.async_create_task = MagicMock(side_effect=pending.append)
+    intervals_s = []
+    buttons = [
+        _SimulatedButton(f"simulated_{index}", hub, button_presses)
+        for index, button_presses in enumerate(presses)
+    ]
+    delivered: dict[str, list[tuple[int, float]]] = {}
+
+    def _call_later(_hass, delay_s: float, _action) -> MagicMock:
+        intervals_s.append(delay_s)
+        return MagicMock()
+
+    with (
+        patch("custom_components.tapo.hub.event.time", clock),
+        patch("custom_components.tapo.hub.event.async_call_later", _call_later),
+    ):
+        poller = HubEventLogPoller(
+            hass, hub_coordinator, cursor_store, controller=controller, **poller_kwargs
+        )
+        for button in buttons:
+            cursor_store.save(button.device_id, 0)
+            coordinator = Mock(TapoDataCoordinator)
+            coordinator.device = button
+            poller.add_listener(coordinator, _recorder(clock, delivered, button))
+        poller.start()
+        cycles = 0
+        while pending and clock.now < duration_s:
+            await pending.pop()
+            cycles += 1
+            clock.advance(intervals_s[-1])
+            poller._handle_timer(None)
+        for refresh in pending:
+            refresh.close()
+
+    report = SimulationReport(
+        duration_s=clock.now, cycles=cycles, busy_s=hub.busy_s, intervals_s=intervals_s
+    )
+    for button in buttons:
+        seen = dict(delivered.get(button.device_id, []))
+        for event_id, pressed_at in enumerate(button.presses, start=1):
+            if event_id in seen:
+                report.detection_delays_s.append(seen[event_id] - pressed_at)
+            elif pressed_at <= clock.now:
+                report.missed_events += 1
+    return report
+
+
+def _recorder(
+    clock: VirtualClock,
+    delivered: dict[str, list[tuple[int, float]]],
+    button: _SimulatedButton,
+):
+    def _record(result: Optional[EventLogPollResult]) -> None:
+        if result is not None:
+            delivered.setdefault(button.device_id, []).extend(
+                (event.id, clock.now) for event in result.events
+            )
+
+    return _record
+
+
+async def _unsupported(_request):
+    return Failure(TapoException(-40106, "multipleRequest not supported"))
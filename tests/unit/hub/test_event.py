@@ -1,28 +1,36 @@
 import asyncio
 import time
-from unittest.mock import AsyncMock, MagicMock, Mock
+from unittest.mock import AsyncMock, MagicMock, Mock, call, patch
 
-from plugp100.common.functional.tri import Success
+from homeassistant.core import HomeAssistant
+from plugp100.common.functional.tri import Failure, Success
+from plugp100.components.smart_door import SmartDoorComponent
 from plugp100.devices.children.trigger_button import TriggerButtonDevice
+from plugp100.errors import TapoException
 from plugp100.models.hub_children.button import (
     DoubleClickEvent,
     RotationEvent,
     SingleClickEvent,
 )
+from plugp100.models.hub_children.logs import TriggerLogResponse
 import pytest
 
 from custom_components.tapo.coordinators import TapoDataCoordinator
+from custom_components.tapo.entity import CoordinatedTapoEntity
 from custom_components.tapo.hub.event import (
     EVENT_DOUBLE_CLICK,
     EVENT_ROTATION,
     EVENT_SINGLE_CLICK,
-    AdaptivePollingState,
+    EventLogPollResult,
     HubEventLogPoller,
     TapoButtonEvent,
     TapoDialEvent,
-    _do_fetch,
-    _get_hub_lock,
-    fetch_event_logs,
+    async_get_hub_event_log_poller,
+)
+from custom_components.tapo.hub.event_cursors import TapoEventCursorStore
+from custom_components.tapo.hub.polling_controller import (
+    BudgetPollingController,
+    PollingController,
 )
 from tests.conftest import _mock_hub_child_device
 
@@ -35,113 +43,41 @@ def _mock_trigger_device():
     return device, logs
 
 
-class TestGetHubLock:
-    def test_creates_lock_on_first_call(self):
-        hass_data = {}
-        hass = MagicMock()
-        hass.data = hass_data
-        lock = _get_hub_lock(hass, "entry_1")
-        assert isinstance(lock, asyncio.Lock)
-        assert "tapo_hub_event_lock_entry_1" in hass_data
-
-    def test_returns_same_lock_on_subsequent_calls(self):
-        hass = MagicMock()
-        hass.data = {}
-        lock1 = _get_hub_lock(hass, "entry_1")
-        lock2 = _get_hub_lock(hass, "entry_1")
-        assert lock1 is lock2
-
-    def test_different_entries_get_different_locks(self):
-        hass = MagicMock()
-        hass.data = {}
-        lock1 = _get_hub_lock(hass, "entry_1")
-        lock2 = _get_hub_lock(hass, "entry_2")
-        assert lock1 is not lock2
-
-
-class TestFetchEventLogs:
-    @pytest.fixture(autouse=True)
-    def init_data(self):
-        self.coordinator = Mock(TapoDataCoordinator)
-        self.device, self.logs = _mock_trigger_device()
-        # Clear any cache
-        if hasattr(self.coordinator, "_event_log_cache"):
-            del self.coordinator._event_log_cache
-        self.coordinator._event_log_cache = None
-
-    async def test_fetches_from_device(self):
-        logs, latency = await fetch_event_logs(self.coordinator, self.device)
-        self.device.get_event_logs.assert_called_once_with(page_size=5, start_id=0)
-        assert logs is self.logs
-        assert latency >= 0
-
-    async def test_returns_cached_result_within_validity_window(self):
-        # First call populates cache
-        await fetch_event_logs(self.coordinator, self.device)
-        # Second call should hit cache
-        await fetch_event_logs(self.coordinator, self.device)
-        # Only one actual HTTP call
-        self.device.get_event_logs.assert_called_once()
-
-    async def test_cache_expires_after_validity_window(self):
-        await fetch_event_logs(self.coordinator, self.device)
-        # Expire the cache
-        self.coordinator._event_log_cache["timestamp"] = time.monotonic() - 1.0
-        await fetch_event_logs(self.coordinator, self.device)
-        assert self.device.get_event_logs.call_count == 2
-
-    async def test_uses_hub_lock_when_provided(self):
-        hass = MagicMock()
-        hass.data = {}
-        await fetch_event_logs(
-            self.coordinator, self.device, hass=hass, entry_id="entry_1"
-        )
-        assert "tapo_hub_event_lock_entry_1" in hass.data
-
-    async def test_works_without_lock(self):
-        logs, latency = await fetch_event_logs(self.coordinator, self.device)
-        assert logs is self.logs
+def _logs_batch_result(count: int) -> dict:
+    child_result = {
+        "responseData": {
+            "result": {
+                "responses": [
+                    {
+                        "method": "get_trigger_logs",
+                        "result": {"start_id": 0, "sum": 0, "logs": []},
+                        "error_code": 0,
+                    }
+                ]
+            }
+        }
+    }
+    return {
+        "responses": [
+            {"method": "control_child", "result": child_result, "error_code": 0}
+            for _ in range(count)
+        ]
+    }
 
-    async def test_custom_page_size(self):
-        await fetch_event_logs(self.coordinator, self.device, page_size=10)
-        self.device.get_event_logs.assert_called_once_with(page_size=10, start_id=0)
 
-    async def test_records_latency_in_cache(self):
-        await fetch_event_logs(self.coordinator, self.device)
-        cache = self.coordinator._event_log_cache
-        assert "timestamp" in cache
-        assert "logs" in cache
-        assert "latency_ms" in cache
-        assert cache["latency_ms"] >= 0
-
-
-class TestDoFetch:
-    @pytest.fixture(autouse=True)
-    def init_data(self):
-        self.coordinator = Mock(TapoDataCoordinator)
-        self.device, self.logs = _mock_trigger_device()
-        self.coordinator._event_log_cache = None
-
-    async def test_rechecks_cache_inside_lock(self):
-        # Simulate another device having just populated the cache
-        self.coordinator._event_log_cache = {
-            "timestamp": time.monotonic(),
-            "logs": self.logs,
-            "latency_ms": 50.0,
-        }
-        logs, latency = await _do_fetch(self.coordinator, self.device, 5)
-        # Should return cached result without calling device
-        self.device.get_event_logs.assert_not_called()
-        assert latency == 50.0
+async def _cursor_store(hass: HomeAssistant) -> TapoEventCursorStore:
+    store = TapoEventCursorStore(hass)
+    await store.async_load()
+    return store
 
 
 class TestHubEventLogPoller:
     @pytest.fixture(autouse=True)
-    def init_data(self):
+    async def init_data(self, hass: HomeAssistant):
+        self.hub_coordinator = Mock(TapoDataCoordinator)
         self.coordinator = Mock(TapoDataCoordinator)
-        self.coordinator._event_log_cache = None
-        self.coordinator._hub_entry_id = "entry_1"
         self.device, self.logs = _mock_trigger_device()
+        self.coordinator.device = self.device
         self.hass = MagicMock()
         self.hass.data = {}
         self.pending_task = None
@@ -152,22 +88,33 @@ class TestHubEventLogPoller:
 
         self.hass.async_create_task = MagicMock(side_effect=_create_task)
         self.poller = HubEventLogPoller(
-            self.hass, self.coordinator, self.device, "entry_1"
+            self.hass, self.hub_coordinator, await _cursor_store(hass)
         )
 
+    def _add_button(self, device_id: str) -> tuple[MagicMock, MagicMock]:
+        coordinator = Mock(TapoDataCoordinator)
+        device, _ = _mock_trigger_device()
+        device.device_id = device_id
+        device._child_id = device_id
+        coordinator.device = device
+        listener = MagicMock()
+        self.poller.add_listener(coordinator, listener)
+        return device, listener
+
     async def test_schedule_refresh_deduplicates_inflight_work(self):
+        self.poller.add_listener(self.coordinator, MagicMock())
         self.poller.schedule_refresh()
         self.poller.schedule_refresh()
 
         assert self.hass.async_create_task.call_count == 1
         await self.pending_task
-        self.device.get_event_logs.assert_called_once()
+        self.device.get_event_logs.assert_called_once_with(page_size=1, start_id=0)
 
     async def test_schedule_refresh_notifies_all_listeners(self):
         first_listener = MagicMock()
         second_listener = MagicMock()
-        self.poller.add_listener(first_listener)
-        self.poller.add_listener(second_listener)
+        self.poller.add_listener(self.coordinator, first_listener)
+        self.poller.add_listener(self.coordinator, second_listener)
 
         self.poller.schedule_refresh()
         await self.pending_task
@@ -175,58 +122,260 @@ class TestHubEventLogPoller:
         first_listener.assert_called_once()
         second_listener.assert_called_once()
         result = first_listener.call_args.args[0]
-        assert result.logs is self.logs
+        assert result.events == []
         assert result.latency_ms >= 0
 
+    async def test_buttons_share_one_batched_request(self):
+        client = self.hub_coordinator.device.client
+        client.execute_raw_request = AsyncMock(
+            return_value=Success(_logs_batch_result(3))
+        )
+        buttons = [self._add_button(f"button_{i}") for i in range(3)]
+
+        self.poller.schedule_refresh()
+        await self.pending_task
+
+        client.execute_raw_request.assert_awaited_once()
+        for device, listener in buttons:
+            device.get_event_logs.assert_not_called()
+            assert listener.call_args.args[0].events == []
+
+    async def test_falls_back_to_one_request_per_button(self):
+        client = self.hub_coordinator.device.client
+        client.execute_raw_request = AsyncMock(
+            return_value=Failure(TapoException(-40106, "unknown method"))
+        )
+        buttons = [self._add_button(f"button_{i}") for i in range(2)]
+
+        self.poller.schedule_refresh()
+        await self.pending_task
+        self.poller.schedule_refresh()
+        await self.pending_task
+
+        client.execute_raw_request.assert_awaited_once()
+        for device, listener in buttons:
+            assert device.get_event_logs.await_count == 2
+            assert listener.call_count == 2
+
+    async def test_transient_batch_failure_retries_the_batch(self):
+        client = self.hub_coordinator.device.client
+        client.execute_raw_request = AsyncMock(
+            side_effect=[
+                Failure(TimeoutError("timeout")),
+                Success(_logs_batch_result(2)),
+            ]
+        )
+        buttons = [self._add_button(f"button_{i}") for i in range(2)]
+
+        self.poller.schedule_refresh()
+        await self.pending_task
+        self.poller.schedule_refresh()
+        await self.pending_task
+
+        assert client.execute_raw_request.await_count == 2
+        for device, listener in buttons:
+            device.get_event_logs.assert_not_called()
+            assert listener.call_args_list[0].args[0] is None
+            assert listener.call_args_list[1].args[0].events == []
+
+    async def test_failed_fetch_notifies_none(self):
+        listener = MagicMock()
+        self.poller.add_listener(self.coordinator, listener)
+        self.device.get_event_logs = AsyncMock(return_value=Failure(Exception("x")))
+
+        self.poller.schedule_refresh()
+        await self.pending_task
+
+        listener.assert_called_once_with(None)
+        assert self.poller.adaptive_state.latency_ms is None
+
     async def test_schedule_refresh_updates_shared_adaptive_state(self):
+        self.poller.add_listener(self.coordinator, MagicMock())
         self.poller.schedule_refresh()
         await self.pending_task
 
         state = self.coordinator._adaptive_polling_state
-        assert isinstance(state, AdaptivePollingState)
+        assert state is self.poller.adaptive_state
         assert state.latency_ms is not None
         assert state.ema_ms is not None
         assert state.ema_jitter_ms == 0.0
-        assert state.computed_interval_ms >= HubEventLogPoller.MIN_INTERVAL_MS
+        assert state.computed_interval_ms >= PollingController.MIN_INTERVAL_MS
 
-    def test_apply_latency_sample_uses_poll_utilization_from_coordinator(self):
-        self.coordinator._poll_utilization_pct = 50
-        self.poller._apply_latency_sample(120.0)
-
-        state = self.poller.adaptive_state
-        assert state.computed_interval_ms == HubEventLogPoller.MIN_INTERVAL_MS
-
-    def test_apply_latency_sample_changes_interval_after_cooldown(self):
-        self.poller._adaptive_state = AdaptivePollingState(
-            latency_ms=80.0,
-            ema_ms=200.0,
-            ema_jitter_ms=50.0,
-            computed_interval_ms=500.0,
-            cycles_since_change=HubEventLogPoller.COOLDOWN_CYCLES,
+    async def test_start_schedules_next_cycle(self):
+        self.poller.add_listener(self.coordinator, MagicMock())
+        with patch("custom_components.tapo.hub.event.async_call_later") as call_later:
+            self.poller.start()
+            await self.pending_task
+
+        call_later.assert_called_once_with(
+            self.hass, self.poller.interval_s, self.poller._handle_timer
         )
-        self.coordinator._adaptive_polling_state = self.poller._adaptive_state
 
-        self.poller._apply_latency_sample(500.0)
+    async def test_removing_last_listener_stops_polling(self):
+        remove = self.poller.add_listener(self.coordinator, MagicMock())
+        unsub_timer = MagicMock()
+        with patch(
+            "custom_components.tapo.hub.event.async_call_later",
+            return_value=unsub_timer,
+        ):
+            self.poller.start()
+            await self.pending_task
+
+        remove()
+
+        unsub_timer.assert_called_once()
+
+    def test_slows_down_after_quiet_period(self):
+        assert not self.poller.is_idle
+        assert self.poller.interval_s == 1
+
+        self.poller._last_activity = time.monotonic() - 601
+
+        assert self.poller.is_idle
+        assert self.poller.interval_s == 10
 
-        assert self.poller.adaptive_state.cycles_since_change == 0
-        assert self.poller.adaptive_state.computed_interval_ms != 500.0
+    async def test_button_event_ends_idle(self):
+        self.poller.add_listener(self.coordinator, MagicMock())
+        self.poller._last_activity = time.monotonic() - 601
+        self.logs.events = [MagicMock(id=1)]
+        self.poller._cursor_store.save(self.device.device_id, 0)
 
-    def test_apply_latency_sample_clamps_interval_bounds(self):
-        self.poller._adaptive_state = AdaptivePollingState(
-            latency_ms=80.0,
-            ema_ms=2000.0,
-            ema_jitter_ms=500.0,
-            computed_interval_ms=300.0,
-            cycles_since_change=HubEventLogPoller.COOLDOWN_CYCLES,
+        self.poller.schedule_refresh()
+        await self.pending_task
+
+        assert not self.poller.is_idle
+
+    async def test_sensor_activity_polls_right_away(self):
+        door = MagicMock()
+        door.get_component = lambda component: (
+            MagicMock(is_open=door.is_open) if component is SmartDoorComponent else None
         )
-        self.coordinator._adaptive_polling_state = self.poller._adaptive_state
+        door.is_open = False
+        self.hub_coordinator.device.children = [door]
+        self.poller._handle_hub_update()
+        self.poller._last_activity = time.monotonic() - 601
+        self.poller._unsub_timer = MagicMock()
+
+        door.is_open = True
+        self.poller._handle_hub_update()
+
+        assert not self.poller.is_idle
+        self.hass.async_create_task.assert_called_once()
+
+    def test_budget_is_the_lowest_poll_utilization(self):
+        self.coordinator._poll_utilization_pct = 50
+        self.poller.add_listener(self.coordinator, MagicMock())
+        other = Mock(TapoDataCoordinator)
+        other.device, _ = _mock_trigger_device()
+        other.device.device_id = "other"
+        other._poll_utilization_pct = 10
+        self.poller.add_listener(other, MagicMock())
+
+        assert self.poller._u_max == pytest.approx(0.1)
+
+    async def test_failed_cycle_is_reported_to_the_controller(self):
+        controller = BudgetPollingController()
+        controller.state.computed_interval_ms = 500.0
+        self.poller._controller = controller
+        self.poller.add_listener(self.coordinator, MagicMock())
+        self.device.get_event_logs = AsyncMock(return_value=Failure(Exception("x")))
+
+        self.poller.schedule_refresh()
+        await self.pending_task
+
+        assert self.poller.interval_s == pytest.approx(1)
+
+
+def _event(event_id: int, cls=SingleClickEvent) -> MagicMock:
+    event = MagicMock(spec=cls)
+    event.__class__ = cls
+    event.id = event_id
+    return event
+
 
-        self.poller._apply_latency_sample(2500.0)
+def _logs(*event_ids: int) -> TriggerLogResponse:
+    events = [_event(event_id) for event_id in event_ids]
+    return TriggerLogResponse(event_ids[0] if event_ids else 0, len(events), events)
 
-        assert (
-            self.poller.adaptive_state.computed_interval_ms
-            <= HubEventLogPoller.MAX_INTERVAL_MS
+
+class TestIncrementalEventLogs:
+    @pytest.fixture(autouse=True)
+    async def init_data(self, hass: HomeAssistant):
+        self.latest_id = 0
+        self.device, _ = _mock_trigger_device()
+        self.device.get_event_logs = AsyncMock(side_effect=self._get_event_logs)
+        self.coordinator = Mock(TapoDataCoordinator)
+        self.coordinator.device = self.device
+        self.cursor_store = await _cursor_store(hass)
+        self.poller = HubEventLogPoller(
+            MagicMock(), Mock(TapoDataCoordinator), self.cursor_store
         )
+        self.listener = MagicMock()
+        self.poller.add_listener(self.coordinator, self.listener)
+
+    async def _get_event_logs(self, page_size: int, start_id: int) -> Success:
+        """Simulate a hub log holding the events 1..latest_id."""
+        start_id = start_id or self.latest_id
+        return Success(_logs(*range(start_id, max(start_id - page_size, 0), -1)))
+
+    async def _poll(self, latest_id: int) -> list[int] | None:
+        self.latest_id = latest_id
+        await self.poller._async_refresh()
+        result = self.listener.call_args.args[0]
+        return [event.id for event in result.events] if result else None
+
+    async def test_first_probe_seeds_cursor(self):
+        assert await self._poll(100) == []
+        assert self.cursor_store.get(self.device.device_id) == 100
+
+    async def test_only_newer_events_are_delivered(self):
+        await self._poll(100)
+
+        assert await self._poll(100) == []
+        assert await self._poll(101) == [101]
+        assert self.device.get_event_logs.await_count == 3
+
+    async def test_restored_cursor_delivers_missed_events(self):
+        self.cursor_store.save(self.device.device_id, 98)
+
+        assert await self._poll(100) == [99, 100]
+
+    async def test_burst_is_caught_up_by_paging(self):
+        await self._poll(50)
+        self.device.get_event_logs.reset_mock()
+
+        assert await self._poll(75) == list(range(51, 76))
+        # the probe, then pages of 10, 10 and 4 events
+        assert self.device.get_event_logs.await_count == 4
+        assert self.cursor_store.get(self.device.device_id) == 75
+
+    async def test_failed_catch_up_keeps_cursor(self):
+        await self._poll(50)
+        self.latest_id = 53
+        self.device.get_event_logs.side_effect = [
+            await self._get_event_logs(1, 0),
+            Failure(Exception("x")),
+        ]
+
+        assert await self._poll(53) is None
+        assert self.cursor_store.get(self.device.device_id) == 50
+
+    async def test_log_reset_moves_cursor_back(self):
+        await self._poll(50)
+
+        assert await self._poll(3) == []
+        assert self.cursor_store.get(self.device.device_id) == 3
+
+
+class TestGetHubEventLogPoller:
+    async def test_buttons_of_a_hub_share_the_poller(self, hass: HomeAssistant):
+        hub_coordinator = Mock(TapoDataCoordinator)
+        first = MagicMock(hub_coordinator=hub_coordinator)
+        second = MagicMock(hub_coordinator=hub_coordinator)
+
+        assert await async_get_hub_event_log_poller(
+            hass, first
+        ) is await async_get_hub_event_log_poller(hass, second)
 
 
 class TestTapoButtonEvent:
@@ -304,112 +453,55 @@ class TestTapoDialEvent:
         self.entity._trigger_event.assert_not_called()
 
 
-class TestTapoEventBaseStartupDeferral:
-    @pytest.fixture(autouse=True)
-    def init_data(self):
-        self.coordinator = Mock(TapoDataCoordinator)
-        self.device, _ = _mock_trigger_device()
-        self.entity = TapoButtonEvent(coordinator=self.coordinator, device=self.device)
-
-    def test_ha_started_defaults_false(self):
-        assert self.entity._ha_started is False
-
-    def test_handle_coordinator_update_skips_when_not_started(self):
-        self.entity.hass = MagicMock()
-        self.entity.async_write_ha_state = MagicMock()
-        self.entity._handle_coordinator_update()
-        self.entity.hass.async_create_task.assert_not_called()
-
-    def test_handle_coordinator_update_runs_when_started(self):
-        self.entity._ha_started = True
-        self.entity.hass = MagicMock()
-        self.entity.async_write_ha_state = MagicMock()
-        self.entity._handle_coordinator_update()
-        self.entity.hass.async_create_task.assert_called_once()
-
-    def test_on_ha_started_callback(self):
-        self.entity._on_ha_started(None)
-        assert self.entity._ha_started is True
+class TestTapoEventBaseSetup:
+    async def test_added_to_hass_starts_the_poller(self):
+        coordinator = Mock(TapoDataCoordinator)
+        device, _ = _mock_trigger_device()
+        entity = TapoButtonEvent(coordinator=coordinator, device=device)
+        entity.hass = MagicMock()
+        poller = MagicMock()
+        with (
+            patch.object(CoordinatedTapoEntity, "async_added_to_hass", AsyncMock()),
+            patch(
+                "custom_components.tapo.hub.event.async_get_hub_event_log_poller",
+                AsyncMock(return_value=poller),
+            ),
+        ):
+            await entity.async_added_to_hass()
+
+        poller.add_listener.assert_called_once_with(
+            coordinator, entity._handle_event_log_result
+        )
+        poller.start.assert_called_once()
 
 
-class TestPollAndFireEvents:
+class TestHandleEventLogResult:
     @pytest.fixture(autouse=True)
     def init_data(self):
         self.coordinator = Mock(TapoDataCoordinator)
-        self.coordinator._hub_entry_id = "entry_1"
-        self.coordinator._event_log_cache = None
-        self.device, self.logs = _mock_trigger_device()
+        self.device, _ = _mock_trigger_device()
         self.entity = TapoButtonEvent(coordinator=self.coordinator, device=self.device)
         self.entity.hass = MagicMock()
-        self.entity._ha_started = True
         self.entity._trigger_event = MagicMock()
         self.entity.async_write_ha_state = MagicMock()
 
-    async def test_first_poll_seeds_last_event_id(self):
-        event = MagicMock(spec=SingleClickEvent)
-        event.__class__ = SingleClickEvent
-        event.id = 100
-        self.logs.events = [event]
-        await self.entity._poll_and_fire_events()
-        assert self.entity._last_event_id == 100
-        # First poll should NOT fire event (just seeds)
+    def test_new_events_fire_in_order(self):
+        self.entity._handle_event_log_result(
+            EventLogPollResult(
+                events=[_event(100), _event(101, DoubleClickEvent)], latency_ms=10.0
+            )
+        )
+        assert self.entity._trigger_event.call_args_list == [
+            call(EVENT_SINGLE_CLICK),
+            call(EVENT_DOUBLE_CLICK),
+        ]
+
+    def test_no_events_does_nothing(self):
+        self.entity._handle_event_log_result(
+            EventLogPollResult(events=[], latency_ms=10.0)
+        )
         self.entity._trigger_event.assert_not_called()
 
-    async def test_new_event_fires(self):
-        # Seed
-        event1 = MagicMock(spec=SingleClickEvent)
-        event1.__class__ = SingleClickEvent
-        event1.id = 100
-        self.logs.events = [event1]
-        await self.entity._poll_and_fire_events()
-
-        # Expire cache
-        self.coordinator._event_log_cache["timestamp"] = time.monotonic() - 1.0
-
-        # New event
-        event2 = MagicMock(spec=SingleClickEvent)
-        event2.__class__ = SingleClickEvent
-        event2.id = 101
-        self.logs.events = [event2, event1]
-        await self.entity._poll_and_fire_events()
-        self.entity._trigger_event.assert_called_once_with(EVENT_SINGLE_CLICK)
-
-    async def test_same_event_id_does_not_fire(self):
-        event = MagicMock(spec=SingleClickEvent)
-        event.__class__ = SingleClickEvent
-        event.id = 100
-        self.logs.events = [event]
-        await self.entity._poll_and_fire_events()
-
-        # Expire cache
-        self.coordinator._event_log_cache["timestamp"] = time.monotonic() - 1.0
-
-        # Same event
-        await self.entity._poll_and_fire_events()
+    def test_failed_fetch_is_ignored(self):
+        self.entity._handle_event_log_result(None)
         self.entity._trigger_event.assert_not_called()
-
-    async def test_double_click_event_fires(self):
-        event1 = MagicMock(spec=SingleClickEvent)
-        event1.__class__ = SingleClickEvent
-        event1.id = 100
-        self.logs.events = [event1]
-        await self.entity._poll_and_fire_events()
-
-        self.coordinator._event_log_cache["timestamp"] = time.monotonic() - 1.0
-
-        event2 = MagicMock(spec=DoubleClickEvent)
-        event2.__class__ = DoubleClickEvent
-        event2.id = 101
-        self.logs.events = [event2, event1]
-        await self.entity._poll_and_fire_events()
-        self.entity._trigger_event.assert_called_once_with(EVENT_DOUBLE_CLICK)
-
-    async def test_empty_events_does_nothing(self):
-        self.logs.events = []
-        await self.entity._poll_and_fire_events()
-        assert self.entity._last_event_id is None
-
-    async def test_fetch_exception_is_handled(self):
-        self.device.get_event_logs = AsyncMock(side_effect=Exception("timeout"))
-        # Should not raise
-        await self.entity._poll_and_fire_events()
@@ -0,0 +1,31 @@
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.tapo.hub.event_cursors import (
+    TapoEventCursorStore,
+    async_get_event_cursor_store,
+)
+
+
+async def test_cursors_are_restored(hass: HomeAssistant, hass_storage: dict[str, Any]):
+    hass_storage["tapo.event_cursors"] = {
+        "version": 1,
+        "key": "tapo.event_cursors",
+        "data": {"button_1": 42},
+    }
+
+    store = await async_get_event_cursor_store(hass)
+
+    assert store.get("button_1") == 42
+    assert store.get("button_2") is None
+    assert await async_get_event_cursor_store(hass) is store
+
+
+async def test_save_updates_cursor(hass: HomeAssistant):
+    store = TapoEventCursorStore(hass)
+    await store.async_load()
+
+    store.save("button_1", 7)
+
+    assert store.get("button_1") == 7
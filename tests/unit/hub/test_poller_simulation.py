@@ -0,0 +1,85 @@
+import random
+
+from homeassistant.core import HomeAssistant
+import pytest
+
+from custom_components.tapo.hub.event import HubEventLogPoller
+from custom_components.tapo.hub.event_cursors import TapoEventCursorStore
+from custom_components.tapo.hub.polling_controller import (
+    BudgetPollingController,
+    EmaPollingController,
+)
+from tests.unit.hub.poller_simulation import simulate_poller
+
+# a press every 30 seconds for ten minutes
+PRESSES = [[30.0 * i + 7 for i in range(1, 20)]]
+# a hub answering in ~120ms which gets congested and times out for a while
+CONGESTED_TRACE = [120.0] * 50 + [900.0, None, None, 900.0] * 5 + [120.0] * 50
+
+
+class TestPollerSimulation:
+    @pytest.fixture(autouse=True)
+    async def init_data(self, hass: HomeAssistant):
+        self.cursor_store = TapoEventCursorStore(hass)
+        await self.cursor_store.async_load()
+
+    async def test_steady_hub(self):
+        report = await simulate_poller(self.cursor_store, [120.0], 600, PRESSES)
+
+        assert report.missed_events == 0
+        assert report.mean_detection_delay_s < 0.5
+        assert report.utilization <= HubEventLogPoller.DEFAULT_U_MAX
+        assert report.interval_changes == 0
+
+    async def test_jittery_hub_keeps_interval_stable(self):
+        rng = random.Random(0)
+        trace = [max(20.0, rng.gauss(150, 40)) for _ in range(500)]
+
+        report = await simulate_poller(self.cursor_store, trace, 600, PRESSES)
+
+        assert report.missed_events == 0
+        assert report.mean_detection_delay_s < 1
+        assert report.interval_changes < report.cycles * 0.15
+
+    async def test_budget_controller_relieves_congested_hub(self):
+        ema = await simulate_poller(
+            self.cursor_store,
+            CONGESTED_TRACE,
+            600,
+            PRESSES,
+            controller=EmaPollingController(),
+        )
+        budget = await simulate_poller(
+            self.cursor_store,
+            CONGESTED_TRACE,
+            600,
+            PRESSES,
+            controller=BudgetPollingController(),
+        )
+
+        assert ema.missed_events == budget.missed_events == 0
+        assert ema.utilization > HubEventLogPoller.DEFAULT_U_MAX
+        assert budget.utilization < HubEventLogPoller.DEFAULT_U_MAX
+
+    async def test_idle_hub_slows_down_but_detects_presses(self):
+        report = await simulate_poller(
+            self.cursor_store,
+            [120.0],
+            1800,
+            [[1500.0]],
+            idle_after_s=600,
+            idle_interval_s=10,
+        )
+
+        assert 10 in report.intervals_s
+        assert report.missed_events == 0
+        assert report.max_detection_delay_s <= 10 + 0.12
+
+    async def test_buttons_share_the_hub(self):
+        report = await simulate_poller(
+            self.cursor_store, [120.0], 300, [[30.0 * i for i in range(1, 10)]] * 3
+        )
+
+        assert report.missed_events == 0
+        assert len(report.detection_delays_s) == 27
+        assert report.utilization <= HubEventLogPoller.DEFAULT_U_MAX
@@ -0,0 +1,112 @@
+import pytest
+
+from custom_components.tapo.hub.polling_controller import (
+    AdaptivePollingState,
+    BudgetPollingController,
+    EmaPollingController,
+    PollingController,
+)
+from tests.unit.hub.poller_simulation import replay_latency_trace
+
+# a hub answering in ~120ms which slows down to ~600ms and times out twice
+CONGESTION_TRACE = [120.0] * 20 + [600.0, None, None, 600.0] + [120.0] * 20
+
+
+class TestEmaPollingController:
+    def test_first_sample_sets_interval_from_budget(self):
+        controller = EmaPollingController()
+
+        controller.on_sample(120.0, 0.1)
+
+        assert controller.interval_ms == pytest.approx(1200)
+
+    def test_changes_interval_after_cooldown(self):
+        controller = EmaPollingController()
+        controller.state = AdaptivePollingState(
+            latency_ms=80.0,
+            ema_ms=200.0,
+            ema_jitter_ms=50.0,
+            computed_interval_ms=500.0,
+            cycles_since_change=EmaPollingController.COOLDOWN_CYCLES,
+        )
+
+        controller.on_sample(500.0, 0.35)
+
+        assert controller.state.cycles_since_change == 0
+        assert controller.interval_ms != 500.0
+
+    def test_clamps_interval_bounds(self):
+        controller = EmaPollingController()
+        controller.state = AdaptivePollingState(
+            latency_ms=80.0,
+            ema_ms=2000.0,
+            ema_jitter_ms=500.0,
+            computed_interval_ms=300.0,
+            cycles_since_change=EmaPollingController.COOLDOWN_CYCLES,
+        )
+
+        controller.on_sample(2500.0, 0.35)
+
+        assert controller.interval_ms == PollingController.MAX_INTERVAL_MS
+
+    def test_failure_keeps_interval(self):
+        controller = EmaPollingController()
+        controller.on_sample(120.0, 0.1)
+
+        controller.on_failure(0.1)
+
+        assert controller.state.latency_ms is None
+        assert controller.interval_ms == pytest.approx(1200)
+
+
+class TestBudgetPollingController:
+    def test_speeds_up_additively_within_budget(self):
+        controller = BudgetPollingController()
+        controller.on_sample(100.0, 0.1)
+        assert controller.interval_ms == pytest.approx(1000)
+
+        controller.on_sample(50.0, 0.1)
+
+        assert controller.interval_ms == pytest.approx(900)
+
+    def test_backs_off_multiplicatively_over_budget(self):
+        controller = BudgetPollingController()
+        controller.on_sample(100.0, 0.1)
+
+        controller.on_sample(200.0, 0.1)
+
+        assert controller.interval_ms == pytest.approx(1500)
+        assert controller.state.cycles_since_change == 0
+
+    def test_timeout_doubles_interval_up_to_max(self):
+        controller = BudgetPollingController()
+        controller.on_sample(100.0, 0.1)
+
+        controller.on_failure(0.1)
+        assert controller.interval_ms == pytest.approx(2000)
+        for _ in range(5):
+            controller.on_failure(0.1)
+
+        assert controller.interval_ms == PollingController.MAX_INTERVAL_MS
+        assert controller.state.latency_ms is None
+
+
+class TestReplayLatencyTrace:
+    def test_replay_is_deterministic(self):
+        first = replay_latency_trace(BudgetPollingController(), CONGESTION_TRACE, 0.1)
+        second = replay_latency_trace(BudgetPollingController(), CONGESTION_TRACE, 0.1)
+
+        assert first == second
+        assert first.failures == 2
+        assert len(first.intervals_ms) == len(CONGESTION_TRACE)
+
+    def test_compare_controllers(self):
+        ema = replay_latency_trace(EmaPollingController(), CONGESTION_TRACE, 0.1)
+        budget = replay_latency_trace(BudgetPollingController(), CONGESTION_TRACE, 0.1)
+
+        # the timeouts leave the EMA interval alone, the budget one backs off
+        assert ema.intervals_ms[22] == ema.intervals_ms[23]
+        assert budget.intervals_ms[23] > budget.intervals_ms[22]
+        # spending less of the hub budget, at the cost of a probing interval
+        assert budget.mean_utilization < ema.mean_utilization
+        assert budget.interval_changes > ema.interval_changes
@@ -0,0 +1,132 @@
+import asyncio
+from unittest.mock import patch
+
+from plugp100.api.requests.tapo_request import TapoRequest
+
+from custom_components.tapo.hub.request_broker import (
+    HubRequestBroker,
+    HubRequestPriority,
+    hub_request_priority,
+)
+
+
+def test_hub_request_priority():
+    set_child = TapoRequest.control_child(
+        "child", TapoRequest.set_device_info({"device_on": True})
+    )
+    assert hub_request_priority(set_child) == HubRequestPriority.COMMAND
+    assert (
+        hub_request_priority(TapoRequest.get_child_device_list(0))
+        == HubRequestPriority.STATE
+    )
+    trigger_logs = TapoRequest.control_child(
+        "child", TapoRequest(method="get_trigger_logs", params=None)
+    )
+    assert hub_request_priority(trigger_logs) == HubRequestPriority.EVENT_LOG
+    assert (
+        hub_request_priority(TapoRequest(method="get_latest_fw", params=None))
+        == HubRequestPriority.FIRMWARE
+    )
+
+
+class TestHubRequestBroker:
+    async def _serve(self, broker: HubRequestBroker, requests: list[tuple]):
+        served = []
+        release = asyncio.Event()
+
+        async def _request(name: str, priority: HubRequestPriority):
+            async with broker.slot(priority):
+                served.append(name)
+                if name == "busy":
+                    await release.wait()
+
+        busy = asyncio.create_task(_request("busy", HubRequestPriority.STATE))
+        await asyncio.sleep(0)
+        tasks = [asyncio.create_task(_request(*request)) for request in requests]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(busy, *tasks)
+        return served
+
+    async def test_serves_by_priority_then_fifo(self):
+        broker = HubRequestBroker()
+        served = await self._serve(
+            broker,
+            [
+                ("firmware", HubRequestPriority.FIRMWARE),
+                ("state_1", HubRequestPriority.STATE),
+                ("event_log", HubRequestPriority.EVENT_LOG),
+                ("state_2", HubRequestPriority.STATE),
+                ("command", HubRequestPriority.COMMAND),
+            ],
+        )
+
+        assert served == [
+            "busy",
+            "command",
+            "event_log",
+            "state_1",
+            "state_2",
+            "firmware",
+        ]
+        diagnostics = broker.diagnostics()
+        assert not diagnostics["busy"]
+        assert diagnostics["queue_depth"]["state"] == 0
+        assert diagnostics["wait"]["state"]["requests"] == 3
+
+    async def test_aged_requests_are_not_starved(self):
+        broker = HubRequestBroker(aging_s=1)
+        with patch(
+            "custom_components.tapo.hub.request_broker.time.monotonic"
+        ) as monotonic:
+            monotonic.return_value = 0
+            served = []
+            release = asyncio.Event()
+
+            async def _request(name: str, priority: HubRequestPriority):
+                async with broker.slot(priority):
+                    served.append(name)
+                    if name == "busy":
+                        await release.wait()
+
+            busy = asyncio.create_task(_request("busy", HubRequestPriority.STATE))
+            await asyncio.sleep(0)
+            firmware = asyncio.create_task(
+                _request("firmware", HubRequestPriority.FIRMWARE)
+            )
+            await asyncio.sleep(0)
+            # the firmware check waited long enough to overtake a climate poll
+            monotonic.return_value = 3
+            climate = asyncio.create_task(
+                _request("climate", HubRequestPriority.CLIMATE)
+            )
+            await asyncio.sleep(0)
+            release.set()
+            await asyncio.gather(busy, firmware, climate)
+
+        assert served == ["busy", "firmware", "climate"]
+
+    async def test_cancelled_waiter_leaves_the_queue(self):
+        broker = HubRequestBroker()
+        release = asyncio.Event()
+
+        async def _busy():
+            async with broker.slot(HubRequestPriority.STATE):
+                await release.wait()
+
+        async def _waiting():
+            async with broker.slot(HubRequestPriority.ENERGY):
+                pass
+
+        busy = asyncio.create_task(_busy())
+        await asyncio.sleep(0)
+        waiting = asyncio.create_task(_waiting())
+        await asyncio.sleep(0)
+        assert broker.diagnostics()["queue_depth"]["energy"] == 1
+        waiting.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        await busy
+
+        assert broker.diagnostics()["queue_depth"]["energy"] == 0
+        assert not broker.diagnostics()["busy"]
@@ -12,7 +12,7 @@ from plugp100.devices.children.trigger_button import TriggerButtonDevice
 import pytest
 
 from custom_components.tapo.coordinators import TapoDataCoordinator
-from custom_components.tapo.hub.event import AdaptivePollingState
+from custom_components.tapo.hub.polling_controller import AdaptivePollingState
 from custom_components.tapo.hub.sensor import (
     COMPONENT_MAPPING,
     BatteryLevelSensor,
@@ -159,14 +159,14 @@ class TestPollLatencySensorStartupDeferral:
         self.sensor.hass = MagicMock()
         self.sensor.async_write_ha_state = MagicMock()
         self.sensor._handle_coordinator_update()
-        self.sensor.hass.async_create_task.assert_not_called()
+        self.sensor.async_write_ha_state.assert_not_called()
 
     def test_handle_coordinator_update_runs_when_started(self):
         self.sensor._ha_started = True
         self.sensor.hass = MagicMock()
         self.sensor.async_write_ha_state = MagicMock()
         self.sensor._handle_coordinator_update()
-        self.sensor.hass.async_create_task.assert_called_once()
+        self.sensor.async_write_ha_state.assert_called_once()
 
     def test_handle_coordinator_update_skips_when_disabled(self):
         self.sensor._ha_started = True
@@ -174,7 +174,6 @@ class TestPollLatencySensorStartupDeferral:
         self.sensor.async_write_ha_state = MagicMock()
         self.sensor.registry_entry = MagicMock(disabled=True)
         self.sensor._handle_coordinator_update()
-        self.sensor.hass.async_create_task.assert_not_called()
         self.sensor.async_write_ha_state.assert_not_called()
 
     def test_on_ha_started_callback(self):
@@ -0,0 +1,202 @@
+import base64
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+from homeassistant.core import HomeAssistant
+from plugp100.common.functional.tri import Success
+from plugp100.components.smart_door import SmartDoorComponent
+from plugp100.devices.children.door import SmartDoorSensor
+from plugp100.devices.hub import TapoHub
+from plugp100.models.child import ChildDeviceList
+from plugp100.models.components import Components
+import pytest
+
+from custom_components.tapo.hub.tapo_hub_child_coordinator import (
+    TapoHubChildCoordinator,
+    TapoHubCoordinator,
+)
+
+
+def _child_state(device_id: str, is_open: bool) -> dict:
+    return {
+        "device_id": device_id,
+        "hw_id": "hw",
+        "oem_id": "oem",
+        "fw_ver": "1.0.0 Build 1",
+        "hw_ver": "1.0",
+        "mac": "AABBCCDDEEFF",
+        "nickname": base64.b64encode(device_id.encode()).decode(),
+        "model": "T110",
+        "type": "SMART.TAPOSENSOR",
+        "parent_device_id": "hub",
+        "is_open": is_open,
+        "at_low_battery": False,
+    }
+
+
+def _child_component_list(device_id: str) -> dict:
+    return {
+        "device_id": device_id,
+        "component_list": [{"id": "battery_detect", "ver_code": 1}],
+    }
+
+
+def _mock_hub(children_count: int):
+    client = MagicMock()
+    hub = MagicMock(auto_spec=TapoHub)
+    hub.__class__ = TapoHub
+    hub.client = client
+    hub.update = AsyncMock(return_value=None)
+    hub.children = [
+        SmartDoorSensor("1.2.3.4", 80, client, f"child_{i}", "parent")
+        for i in range(children_count)
+    ]
+    client.get_child_device_component_list = AsyncMock(
+        return_value=Success(
+            {
+                "child_component_list": [
+                    _child_component_list(child._child_id) for child in hub.children
+                ]
+            }
+        )
+    )
+    _set_children_open(hub, True)
+    return hub
+
+
+def _set_children_open(hub: MagicMock, is_open: bool):
+    hub.client.get_child_device_list = AsyncMock(
+        return_value=Success(
+            ChildDeviceList(
+                [_child_state(child._child_id, is_open) for child in hub.children],
+                0,
+                len(hub.children),
+            )
+        )
+    )
+
+
+class TestTapoHubCoordinator:
+    @pytest.fixture(autouse=True)
+    def init_data(self, hass: HomeAssistant):
+        self.hub = _mock_hub(children_count=40)
+        self.coordinator = TapoHubCoordinator(hass, self.hub, timedelta(seconds=30))
+
+    async def test_poll_fetches_all_children_in_one_cycle(self):
+        await self.coordinator.poll_update()
+
+        self.hub.client.get_child_device_list.assert_awaited_once_with(all_pages=True)
+        self.hub.client.get_child_device_component_list.assert_awaited_once()
+        assert len(self.coordinator.children_state) == 40
+        for child in self.hub.children:
+            assert child.get_component(SmartDoorComponent).is_open is True
+
+    async def test_components_are_negotiated_only_once(self):
+        await self.coordinator.poll_update()
+        _set_children_open(self.hub, False)
+        await self.coordinator.poll_update()
+
+        self.hub.client.get_child_device_component_list.assert_awaited_once()
+        for child in self.hub.children:
+            assert child.get_component(SmartDoorComponent).is_open is False
+
+    async def test_fresh_snapshot_is_reused(self):
+        await self.coordinator.async_update_children()
+        await self.coordinator.async_update_children(max_age=30)
+
+        self.hub.client.get_child_device_list.assert_awaited_once()
+
+    async def test_invalidate_forces_fetch(self):
+        await self.coordinator.async_update_children()
+        self.coordinator.invalidate_children()
+        await self.coordinator.async_update_children(max_age=30)
+
+        assert self.hub.client.get_child_device_list.await_count == 2
+
+
+class TestHubSetup:
+    @pytest.fixture(autouse=True)
+    def init_data(self, hass: HomeAssistant):
+        self.client = MagicMock()
+        self.client.get_component_negotiation = AsyncMock(
+            return_value=Success(Components({"control_child": 1}))
+        )
+        self.client.get_device_info = AsyncMock(
+            return_value=Success(
+                {**_child_state("hub", False), "model": "H100", "type": "SMART.TAPOHUB"}
+            )
+        )
+        self.client.get_child_device_list = AsyncMock(
+            return_value=Success(
+                ChildDeviceList(
+                    [_child_state(f"child_{i}", True) for i in range(10)], 0, 10
+                )
+            )
+        )
+        self.client.get_child_device_component_list = AsyncMock(
+            return_value=Success(
+                {
+                    "child_component_list": [
+                        _child_component_list(f"child_{i}") for i in range(10)
+                    ]
+                }
+            )
+        )
+        self.client.control_child = AsyncMock()
+        self.hub = TapoHub("1.2.3.4", 80, self.client)
+        self.coordinator = TapoHubCoordinator(
+            hass, self.hub, timedelta(seconds=30), setup_concurrency=4
+        )
+
+    async def test_children_are_set_up_from_batched_requests(self):
+        await self.coordinator.poll_update()
+
+        assert [child.device_id for child in self.hub.children] == [
+            f"child_{i}" for i in range(10)
+        ]
+        for child in self.hub.children:
+            assert child.get_component(SmartDoorComponent).is_open is True
+        # no device info request nor component negotiation per child
+        self.client.control_child.assert_not_called()
+        self.client.get_component_negotiation.assert_awaited_once()
+        self.client.get_child_device_list.assert_awaited_once_with(all_pages=True)
+        self.client.get_child_device_component_list.assert_awaited_once()
+        assert self.coordinator.children_setup_ms is not None
+
+    async def test_later_polls_update_the_hub_in_place(self):
+        await self.coordinator.poll_update()
+        await self.coordinator.poll_update()
+
+        self.client.get_component_negotiation.assert_awaited_once()
+        assert self.client.get_device_info.await_count == 2
+        assert len(self.hub.children) == 10
+        self.client.control_child.assert_not_called()
+
+
+class TestTapoHubChildCoordinator:
+    @pytest.fixture(autouse=True)
+    def init_data(self, hass: HomeAssistant):
+        self.hub = _mock_hub(children_count=3)
+        self.hub_coordinator = TapoHubCoordinator(hass, self.hub, timedelta(seconds=30))
+        self.coordinators = [
+            TapoHubChildCoordinator(hass, self.hub_coordinator, child, None)
+            for child in self.hub.children
+        ]
+
+    async def test_children_refresh_shares_hub_request(self):
+        await self.hub_coordinator.async_refresh()
+        for coordinator in self.coordinators:
+            await coordinator.async_refresh()
+
+        self.hub.client.get_child_device_list.assert_awaited_once()
+        for coordinator in self.coordinators:
+            assert coordinator.data["device_id"] == coordinator.device._child_id
+
+    async def test_hub_update_is_fanned_out_to_children(self):
+        listener = MagicMock()
+        self.coordinators[0].async_add_listener(listener)
+
+        await self.hub_coordinator.async_refresh()
+
+        listener.assert_called_once()
+        assert self.coordinators[0].data["is_open"] is True
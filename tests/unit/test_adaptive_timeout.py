@@ -0,0 +1,45 @@
+import pytest
+
+from custom_components.tapo.adaptive_timeout import AdaptiveTimeout
+from custom_components.tapo.const import (
+    ADAPTIVE_TIMEOUT_MAX_S,
+    ADAPTIVE_TIMEOUT_MIN_S,
+    ADAPTIVE_TIMEOUT_MIN_SAMPLES,
+)
+
+
+def test_max_timeout_until_enough_samples():
+    timeout = AdaptiveTimeout()
+    for _ in range(ADAPTIVE_TIMEOUT_MIN_SAMPLES - 1):
+        timeout.record_success(0.2)
+
+    assert timeout.timeout == ADAPTIVE_TIMEOUT_MAX_S
+
+
+def test_timeout_follows_p99_latency():
+    timeout = AdaptiveTimeout()
+    for _ in range(99):
+        timeout.record_success(0.2)
+    timeout.record_success(0.4)
+
+    assert timeout.p99 == 0.2
+    assert timeout.timeout == pytest.approx(0.6)
+
+
+def test_timeout_is_clamped():
+    timeout = AdaptiveTimeout()
+    for _ in range(ADAPTIVE_TIMEOUT_MIN_SAMPLES):
+        timeout.record_success(0.01)
+
+    assert timeout.timeout == ADAPTIVE_TIMEOUT_MIN_S
+
+
+def test_timeout_is_relaxed_after_a_timeout():
+    timeout = AdaptiveTimeout()
+    for _ in range(ADAPTIVE_TIMEOUT_MIN_SAMPLES):
+        timeout.record_success(0.2)
+
+    timeout.record_timeout()
+    assert timeout.timeout == ADAPTIVE_TIMEOUT_MAX_S
+    timeout.record_success(0.2)
+    assert timeout.timeout < ADAPTIVE_TIMEOUT_MAX_S
@@ -0,0 +1,105 @@
+from unittest.mock import AsyncMock, MagicMock
+
+from plugp100.common.functional.tri import Failure, Success
+from plugp100.errors import TapoException
+import pytest
+
+from custom_components.tapo.components.child_energy_component import (
+    ChildEnergyComponent,
+    StripEnergyFetcher,
+)
+
+CHILD_IDS = ["socket_0", "socket_1", "socket_2"]
+
+
+def _energy_responses(power_w: int) -> list[dict]:
+    return [
+        {
+            "method": "get_energy_usage",
+            "result": {"today_energy": 10, "month_energy": 100},
+            "error_code": 0,
+        },
+        {
+            "method": "get_current_power",
+            "result": {"current_power": power_w},
+            "error_code": 0,
+        },
+    ]
+
+
+def _control_child_result(power_w: int) -> dict:
+    return {"responseData": {"result": {"responses": _energy_responses(power_w)}}}
+
+
+def _batch_result() -> dict:
+    return {
+        "responses": [
+            {
+                "method": "control_child",
+                "result": _control_child_result(i),
+                "error_code": 0,
+            }
+            for i in range(len(CHILD_IDS))
+        ]
+    }
+
+
+class TestStripEnergyFetcher:
+    @pytest.fixture(autouse=True)
+    def init_data(self):
+        self.client = MagicMock()
+        self.fetcher = StripEnergyFetcher(self.client, CHILD_IDS, validity=15)
+        self.components = [
+            ChildEnergyComponent(self.client, child_id, self.fetcher)
+            for child_id in CHILD_IDS
+        ]
+
+    async def test_all_sockets_share_one_request(self):
+        self.client.execute_raw_request = AsyncMock(
+            return_value=Success(_batch_result())
+        )
+
+        for component in self.components:
+            await component.update()
+
+        self.client.execute_raw_request.assert_awaited_once()
+        for i, component in enumerate(self.components):
+            assert component.power_info.current_power == i
+            assert component.energy_info.current_power == i * 1000
+
+    async def test_falls_back_to_one_request_per_socket(self):
+        self.client.execute_raw_request = AsyncMock(
+            side_effect=[Failure(TapoException(-1002, "invalid request"))]
+            + [Success(_control_child_result(i)) for i in range(len(CHILD_IDS))]
+        )
+
+        for component in self.components:
+            await component.update()
+
+        assert self.client.execute_raw_request.await_count == 1 + len(CHILD_IDS)
+        assert self.components[2].power_info.current_power == 2
+
+    async def test_transient_failure_retries_the_batch(self):
+        self.client.execute_raw_request = AsyncMock(
+            side_effect=[Failure(TimeoutError("timeout")), Success(_batch_result())]
+        )
+
+        await self.components[0].update()
+        assert self.components[0].power_info is None
+        self.fetcher._fetched_at = None
+        await self.components[0].update()
+
+        assert self.client.execute_raw_request.await_count == 2
+        assert self.components[0].power_info.current_power == 0
+
+    async def test_socket_error_does_not_fail_the_others(self):
+        batch = _batch_result()
+        batch["responses"][1] = {"method": "control_child", "error_code": -1301}
+        self.client.execute_raw_request = AsyncMock(return_value=Success(batch))
+
+        for component in self.components:
+            await component.update()
+
+        self.client.execute_raw_request.assert_awaited_once()
+        assert self.components[1].power_info is None
+        assert self.components[2].power_info.current_power == 2
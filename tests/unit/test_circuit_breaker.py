@@ -0,0 +1,62 @@
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiohttp
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import UpdateFailed
+import pytest
+
+from custom_components.tapo.circuit_breaker import DeviceCircuitBreaker
+from custom_components.tapo.coordinators import TapoDataCoordinator
+
+
+def test_backoff_grows_exponentially_up_to_ceiling():
+    breaker = DeviceCircuitBreaker(
+        "1.2.3.4", 80, failure_threshold=2, max_backoff_s=100
+    )
+
+    delays = [breaker.record_failure(30) for _ in range(5)]
+
+    assert delays == [None, 30, 60, 100, 100]
+    assert breaker.is_open
+    breaker.record_success()
+    assert not breaker.is_open
+
+
+class TestCoordinatorCircuitBreaker:
+    @pytest.fixture(autouse=True)
+    def init_data(self, hass: HomeAssistant):
+        self.device = MagicMock()
+        self.device.host = "1.2.3.4"
+        self.device.port = 80
+        self.device.update = AsyncMock(
+            side_effect=aiohttp.ClientConnectionError("unreachable")
+        )
+        self.coordinator = TapoDataCoordinator(hass, self.device, timedelta(seconds=30))
+
+    async def _failed_update(self) -> UpdateFailed:
+        with pytest.raises(UpdateFailed) as error:
+            await self.coordinator._async_update_data()
+        return error.value
+
+    async def test_unreachable_device_is_backed_off_and_probed(self):
+        retries = [(await self._failed_update()).retry_after for _ in range(3)]
+        assert retries == [None, None, 30]
+
+        with patch.object(
+            DeviceCircuitBreaker, "async_probe", AsyncMock(return_value=False)
+        ):
+            assert (await self._failed_update()).retry_after == 60
+        assert self.device.update.await_count == 3
+
+    async def test_success_closes_the_breaker(self):
+        for _ in range(3):
+            await self._failed_update()
+        self.device.update = AsyncMock(return_value=None)
+
+        with patch.object(
+            DeviceCircuitBreaker, "async_probe", AsyncMock(return_value=True)
+        ):
+            await self.coordinator._async_update_data()
+
+        assert not self.coordinator._circuit_breaker.is_open
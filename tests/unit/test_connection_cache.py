@@ -0,0 +1,134 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiohttp
+from homeassistant.core import HomeAssistant
+from plugp100.common.functional.tri import Failure, Success
+from plugp100.devices import DeviceConnectConfiguration, TapoPlug
+from plugp100.errors import TapoError, TapoException
+from plugp100.models.components import Components
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.tapo import async_remove_entry
+from custom_components.tapo.connection_cache import (
+    TapoConnectionCache,
+    async_get_connection_cache,
+    async_update_with_cached_components,
+    cached_connect_config,
+)
+from custom_components.tapo.const import DOMAIN
+from custom_components.tapo.hass_tapo import HassTapo
+
+CACHED = {
+    "encryption_type": "klap",
+    "encryption_version": 2,
+    "device_type": "SMART.TAPOPLUG",
+    "firmware_version": "1.0.0",
+    "components": {"device": 2, "countdown": 1},
+}
+
+
+def _device(protocol_version: str = "Klap V2") -> MagicMock:
+    device = MagicMock()
+    device.protocol_version = protocol_version
+    device.components = Components(dict(CACHED["components"]))
+    device.device_info.type = CACHED["device_type"]
+    device.firmware_version = CACHED["firmware_version"]
+    return device
+
+
+class TestTapoConnectionCache:
+    @pytest.fixture(autouse=True)
+    async def init_data(self, hass: HomeAssistant):
+        self.cache = TapoConnectionCache(hass)
+        await self.cache.async_load()
+
+    async def test_save_and_invalidate(self):
+        self.cache.save("entry", _device())
+        assert self.cache.get("entry") == CACHED
+
+        self.cache.invalidate("entry")
+        assert self.cache.get("entry") is None
+
+    async def test_unknown_protocol_is_not_cached(self):
+        self.cache.save("entry", _device(protocol_version="Unknown"))
+        assert self.cache.get("entry") is None
+
+
+class TestConnectFromCache:
+    @pytest.fixture(autouse=True)
+    async def init_data(self, hass: HomeAssistant):
+        self.entry = MockConfigEntry(domain=DOMAIN, data={})
+        self.entry.add_to_hass(hass)
+        self.cache = await async_get_connection_cache(hass)
+        self.cache.save(self.entry.entry_id, _device())
+        self.device = MagicMock()
+        self.device.client.close = AsyncMock()
+        with patch(
+            "custom_components.tapo.hass_tapo.connect",
+            AsyncMock(return_value=self.device),
+        ):
+            yield
+
+    async def _initialize(self, hass: HomeAssistant, error: Exception) -> None:
+        self.device.client.get_device_info = AsyncMock(return_value=Failure(error))
+        hass_tapo = HassTapo(self.entry, DeviceConnectConfiguration(host="1.2.3.4"))
+        with (
+            patch.object(HassTapo, "_connect", AsyncMock(side_effect=RuntimeError)),
+            pytest.raises(Exception),
+        ):
+            await hass_tapo.initialize_device(hass)
+        self.device.client.close.assert_awaited_once()
+
+    async def test_offline_device_keeps_the_cache(self, hass: HomeAssistant):
+        await self._initialize(hass, aiohttp.ClientConnectionError("unreachable"))
+
+        assert self.cache.get(self.entry.entry_id) == CACHED
+
+    async def test_rejected_connection_invalidates_the_cache(self, hass: HomeAssistant):
+        error = TapoException(TapoError.INVALID_CREDENTIAL.value, "invalid")
+        await self._initialize(hass, error)
+
+        assert self.cache.get(self.entry.entry_id) is None
+
+    async def test_removed_entry_drops_the_cache(self, hass: HomeAssistant):
+        await async_remove_entry(hass, self.entry)
+
+        assert self.cache.get(self.entry.entry_id) is None
+
+
+def test_cached_connect_config_skips_guessing():
+    config = cached_connect_config(DeviceConnectConfiguration(host="1.2.3.4"), CACHED)
+
+    assert config.encryption_type == "klap"
+    assert config.encryption_version == 2
+    assert config.device_type == "SMART.TAPOPLUG"
+
+
+async def test_update_with_cached_components_skips_negotiation():
+    cached = {**CACHED, "components": {"device": 2}}
+    client = MagicMock()
+    client.get_device_info = AsyncMock(
+        return_value=Success(
+            {
+                "device_id": "123",
+                "hw_id": "hw",
+                "oem_id": "oem",
+                "fw_ver": "1.0.0 Build 1",
+                "hw_ver": "1.0",
+                "mac": "AABBCCDDEEFF",
+                "nickname": "",
+                "model": "P100",
+                "type": "SMART.TAPOPLUG",
+                "device_on": True,
+            }
+        )
+    )
+    client.get_component_negotiation = AsyncMock()
+    device = TapoPlug("1.2.3.4", 80, client)
+
+    await async_update_with_cached_components(device, cached)
+
+    client.get_component_negotiation.assert_not_called()
+    assert device.components.has("device")
+    assert device.is_on is True
@@ -0,0 +1,57 @@
+from unittest.mock import AsyncMock, MagicMock
+
+from plugp100.components.energy import EnergyComponent
+from plugp100.devices import TapoPlug
+from plugp100.models.components import Components
+import pytest
+
+from custom_components.tapo.device_adapter import (
+    async_apply_state,
+    child_id,
+    is_initialized,
+    set_component,
+)
+
+STATE = {
+    "device_id": "123",
+    "hw_id": "hw",
+    "oem_id": "oem",
+    "fw_ver": "1.0.0 Build 1",
+    "hw_ver": "1.0",
+    "mac": "AABBCCDDEEFF",
+    "nickname": "",
+    "model": "P100",
+    "type": "SMART.TAPOPLUG",
+    "device_on": True,
+}
+
+
+class TestDeviceAdapter:
+    @pytest.fixture(autouse=True)
+    def init_data(self):
+        self.client = MagicMock()
+        self.client.get_device_info = AsyncMock()
+        self.device = TapoPlug("1.2.3.4", 80, self.client)
+
+    async def test_first_state_needs_components(self):
+        with pytest.raises(ValueError):
+            await async_apply_state(self.device, STATE)
+
+        assert not is_initialized(self.device)
+
+    async def test_later_states_keep_the_components(self):
+        await async_apply_state(self.device, STATE, Components({"device": 2}))
+        await async_apply_state(self.device, {**STATE, "device_on": False})
+
+        assert is_initialized(self.device)
+        assert self.device.components.has("device")
+        assert self.device.is_on is False
+        self.client.get_device_info.assert_not_called()
+
+    def test_replacement_component_is_found_by_replaced_type(self):
+        component = MagicMock(EnergyComponent)
+
+        set_component(self.device, EnergyComponent, component)
+
+        assert self.device.get_component(EnergyComponent) is component
+        assert child_id(self.device) is None
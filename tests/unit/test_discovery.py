@@ -0,0 +1,260 @@
+import dataclasses
+from ipaddress import IPv4Address
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from homeassistant.config_entries import SOURCE_IGNORE, ConfigEntryState
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+from plugp100.discovery import DiscoveredDevice
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.tapo.const import (
+    CONF_HOST,
+    DISCOVERY_FULL_SCAN_EVERY,
+    DOMAIN,
+)
+from custom_components.tapo.coordinators import HassTapoDeviceData
+from custom_components.tapo.discovery import TapoDiscoveryCache, stream_tapo_devices
+from tests.conftest import mock_discovered_device
+
+
+def _device(mac: str, ip: str) -> DiscoveredDevice:
+    return dataclasses.replace(mock_discovered_device(), mac=mac, ip=ip)
+
+
+def _found(*devices: DiscoveredDevice) -> dict[str, DiscoveredDevice]:
+    return {dr.format_mac(device.mac): device for device in devices}
+
+
+def _entry(
+    hass: HomeAssistant, device: DiscoveredDevice, host: str = "", **kwargs
+) -> MockConfigEntry:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id=dr.format_mac(device.mac),
+        data={CONF_HOST: host or device.ip},
+        **kwargs,
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+def _flows(hass: HomeAssistant, *devices: DiscoveredDevice):
+    """Pretend a discovery flow is in progress for every one of `devices`."""
+    return patch.object(
+        hass.config_entries.flow,
+        "async_progress_by_handler",
+        return_value=[
+            {"context": {"unique_id": dr.format_mac(device.mac)}} for device in devices
+        ],
+    )
+
+
+async def _discover(
+    cache: TapoDiscoveryCache, found: dict[str, DiscoveredDevice]
+) -> tuple[dict[str, DiscoveredDevice], MagicMock]:
+    async def _stream(_hass, _expected_macs):
+        for device in found.values():
+            yield device
+
+    with patch(
+        "custom_components.tapo.discovery.stream_tapo_devices",
+        MagicMock(side_effect=_stream),
+    ) as broadcast:
+        return _found(*[device async for device in cache.async_discover()]), broadcast
+
+
+class TestTapoDiscoveryCache:
+    async def test_reports_only_new_or_moved_devices(self, hass: HomeAssistant):
+        cache = TapoDiscoveryCache(hass)
+        first = _device("aa-bb-cc-00-00-01", "10.0.0.1")
+        second = _device("aa-bb-cc-00-00-02", "10.0.0.2")
+
+        changed, _ = await _discover(cache, _found(first))
+        assert list(changed) == ["aa:bb:cc:00:00:01"]
+
+        cache._rounds = 0
+        moved = dataclasses.replace(first, ip="10.0.0.9")
+        with _flows(hass, first):
+            changed, _ = await _discover(cache, _found(moved, second))
+        assert changed == _found(moved, second)
+
+        cache._rounds = 0
+        with _flows(hass, first, second):
+            changed, _ = await _discover(cache, _found(moved, second))
+        assert changed == {}
+
+    async def test_offers_again_devices_without_entry_or_flow(
+        self, hass: HomeAssistant
+    ):
+        cache = TapoDiscoveryCache(hass)
+        device = _device("aa-bb-cc-00-00-01", "10.0.0.1")
+        entry = _entry(hass, device)
+        await _discover(cache, _found(device))
+
+        await hass.config_entries.async_remove(entry.entry_id)
+        cache._rounds = 0
+        changed, _ = await _discover(cache, _found(device))
+
+        assert changed == _found(device)
+
+    async def test_skips_configured_and_ignored_devices(self, hass: HomeAssistant):
+        cache = TapoDiscoveryCache(hass)
+        configured = _device("aa-bb-cc-00-00-01", "10.0.0.1")
+        ignored = _device("aa-bb-cc-00-00-02", "10.0.0.2")
+        _entry(hass, configured)
+        _entry(hass, ignored, source=SOURCE_IGNORE)
+        moved = dataclasses.replace(configured, ip="10.0.0.9")
+
+        changed, _ = await _discover(
+            cache, _found(configured, dataclasses.replace(ignored, ip="10.0.0.8"))
+        )
+        assert changed == {}
+
+        cache._rounds = 0
+        changed, _ = await _discover(cache, _found(moved))
+        assert changed == _found(moved)
+
+    async def test_unicast_probes_between_broadcasts(self, hass: HomeAssistant):
+        cache = TapoDiscoveryCache(hass)
+        failing = _device("aa-bb-cc-00-00-01", "10.0.0.1")
+        _entry(hass, failing, state=ConfigEntryState.SETUP_RETRY)
+        _entry(hass, _device("aa-bb-cc-00-00-02", "10.0.0.2"))
+        await _discover(cache, {})
+
+        with patch(
+            "custom_components.tapo.discovery.TapoDiscovery.single_scan",
+            AsyncMock(return_value=failing),
+        ) as single_scan:
+            for _ in range(DISCOVERY_FULL_SCAN_EVERY - 1):
+                changed, broadcast = await _discover(cache, {})
+                assert changed == {}
+                broadcast.assert_not_called()
+
+            # only the entry failing to set up is probed
+            assert single_scan.await_count == DISCOVERY_FULL_SCAN_EVERY - 1
+            single_scan.assert_awaited_with("10.0.0.1", 2)
+            _, broadcast = await _discover(cache, {})
+            broadcast.assert_called_once_with(hass, None)
+
+    async def test_probes_loaded_entries_failing_to_poll(self, hass: HomeAssistant):
+        cache = TapoDiscoveryCache(hass)
+        failing = _device("aa-bb-cc-00-00-01", "10.0.0.1")
+        polling = _device("aa-bb-cc-00-00-02", "10.0.0.2")
+        for device, success in ((failing, False), (polling, True)):
+            entry = _entry(hass, device, state=ConfigEntryState.LOADED)
+            hass.data.setdefault(DOMAIN, {})[entry.entry_id] = HassTapoDeviceData(
+                device=MagicMock(),
+                coordinator=MagicMock(last_update_success=success),
+                config_entry_update_unsub=MagicMock(),
+                child_coordinators=[],
+            )
+        await _discover(cache, {})
+
+        with patch(
+            "custom_components.tapo.discovery.TapoDiscovery.single_scan",
+            AsyncMock(return_value=None),
+        ) as single_scan:
+            _, broadcast = await _discover(cache, {})
+
+        single_scan.assert_awaited_once_with("10.0.0.1", 2)
+        broadcast.assert_called_once_with(hass, {"aa:bb:cc:00:00:01"})
+
+    async def test_missing_device_brings_broadcast_forward(self, hass: HomeAssistant):
+        cache = TapoDiscoveryCache(hass)
+        failing = _device("aa-bb-cc-00-00-01", "10.0.0.1")
+        _entry(hass, failing, state=ConfigEntryState.SETUP_RETRY)
+        await _discover(cache, {})
+        moved = dataclasses.replace(failing, ip="10.0.0.9")
+
+        with patch(
+            "custom_components.tapo.discovery.TapoDiscovery.single_scan",
+            AsyncMock(return_value=None),
+        ):
+            changed, broadcast = await _discover(cache, _found(moved))
+
+        # the broadcast stops once the missing device answered
+        broadcast.assert_called_once_with(hass, {"aa:bb:cc:00:00:01"})
+        assert changed == _found(moved)
+
+    async def test_hosts_with_port_are_compared_and_probed_by_ip(
+        self, hass: HomeAssistant
+    ):
+        cache = TapoDiscoveryCache(hass)
+        failing = _device("aa-bb-cc-00-00-01", "10.0.0.1")
+        _entry(hass, failing, host="10.0.0.1:8080", state=ConfigEntryState.SETUP_RETRY)
+
+        changed, _ = await _discover(cache, _found(failing))
+        assert changed == {}
+
+        with patch(
+            "custom_components.tapo.discovery.TapoDiscovery.single_scan",
+            AsyncMock(return_value=failing),
+        ) as single_scan:
+            changed, broadcast = await _discover(cache, {})
+
+        single_scan.assert_awaited_once_with("10.0.0.1", 2)
+        broadcast.assert_not_called()
+
+
+class TestStreamTapoDevices:
+    @pytest.fixture(autouse=True)
+    def init_data(self):
+        self.replies = {
+            "255.255.255.255": [
+                _reply("aa-bb-cc-00-00-01"),
+                _reply("aa-bb-cc-00-00-02"),
+            ],
+            "10.0.0.255": [_reply("aa-bb-cc-00-00-01"), _reply("aa-bb-cc-00-00-03")],
+        }
+
+        self.closed = []
+
+        def _scan(broadcast, _port, _timeout):
+            try:
+                yield from self.replies[broadcast]
+            finally:
+                self.closed.append(broadcast)
+
+        with (
+            patch(
+                "custom_components.tapo.discovery.network.async_get_ipv4_broadcast_addresses",
+                AsyncMock(
+                    return_value=[IPv4Address(address) for address in self.replies]
+                ),
+            ),
+            patch("custom_components.tapo.discovery.scan", _scan),
+        ):
+            yield
+
+    async def test_yields_each_device_once(self, hass: HomeAssistant):
+        macs = [device.mac async for device in stream_tapo_devices(hass)]
+
+        assert sorted(macs) == [
+            "aa-bb-cc-00-00-01",
+            "aa-bb-cc-00-00-02",
+            "aa-bb-cc-00-00-03",
+        ]
+
+    async def test_stops_once_expected_devices_answered(self, hass: HomeAssistant):
+        self.replies["10.0.0.255"] = []
+
+        macs = [
+            device.mac
+            async for device in stream_tapo_devices(hass, {"aa:bb:cc:00:00:01"})
+        ]
+
+        assert macs == ["aa-bb-cc-00-00-01"]
+
+    async def test_closes_stopped_scans(self, hass: HomeAssistant):
+        self.replies["10.0.0.255"] = [_reply("aa-bb-cc-00-00-03")] * 3
+
+        [_ async for _ in stream_tapo_devices(hass, {"aa:bb:cc:00:00:03"})]
+        await hass.async_block_till_done()
+
+        assert sorted(self.closed) == ["10.0.0.255", "255.255.255.255"]
+
+
+def _reply(mac: str) -> dict:
+    return {**mock_discovered_device().as_dict, "mac": mac}
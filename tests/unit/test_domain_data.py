@@ -0,0 +1,37 @@
+from typing import Any
+from unittest.mock import MagicMock
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.tapo.domain_data import (
+    TapoDomainStore,
+    async_get_domain_store,
+    get_domain_singleton,
+)
+
+
+def test_singleton_is_created_once(hass: HomeAssistant):
+    factory = MagicMock(side_effect=object)
+
+    first = get_domain_singleton(hass, "thing", factory)
+
+    assert get_domain_singleton(hass, "thing", factory) is first
+    factory.assert_called_once()
+
+
+async def test_store_saves_only_changes(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+):
+    hass_storage["tapo.things"] = {"version": 1, "key": "tapo.things", "data": {"a": 1}}
+    store = await async_get_domain_store(
+        hass, "things", lambda: TapoDomainStore(hass, "things", 1, 0)
+    )
+    store._async_schedule_save = MagicMock(wraps=store._async_schedule_save)
+
+    store._set("a", 1)
+    store._set("b", 2)
+    store._remove("c")
+    store._remove("a")
+
+    assert store._data == {"b": 2}
+    assert store._async_schedule_save.call_count == 2
@@ -0,0 +1,76 @@
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from homeassistant.core import HomeAssistant
+from plugp100.common.functional.tri import Success
+import pytest
+
+from custom_components.tapo.components.child_energy_component import (
+    ChildEnergyComponent,
+)
+from custom_components.tapo.coordinators import TapoDataCoordinator
+from custom_components.tapo.entity import CoordinatedTapoEntity
+
+
+class TestSkipUnchangedStateWrites:
+    @pytest.fixture(autouse=True)
+    def init_data(self, hass: HomeAssistant):
+        self.device = MagicMock()
+        self.device.mac = "AABBCCDDEEFF"
+        self.device.raw_state = {"device_on": True, "rssi": -40}
+        self.device.get_device_components = []
+        self.coordinator = TapoDataCoordinator(hass, self.device, timedelta(seconds=30))
+        self.entity = CoordinatedTapoEntity(self.coordinator, self.device)
+        with patch(
+            "homeassistant.helpers.entity.Entity.async_write_ha_state"
+        ) as self.write:
+            yield
+
+    def _coordinator_update(self):
+        self.coordinator.async_update_listeners()
+        self.entity._handle_coordinator_update()
+
+    def test_unchanged_state_is_not_written(self):
+        self._coordinator_update()
+        self._coordinator_update()
+
+        assert self.write.call_count == 1
+
+    def test_changed_state_is_written(self):
+        self._coordinator_update()
+        self.device.raw_state = {"device_on": False, "rssi": -40}
+        self._coordinator_update()
+
+        assert self.write.call_count == 2
+
+    def test_availability_change_is_written(self):
+        self._coordinator_update()
+        self.coordinator.last_update_success = False
+        self._coordinator_update()
+
+        assert self.write.call_count == 2
+
+    def test_unknown_state_is_always_written(self):
+        self.device.raw_state = MagicMock()
+        self._coordinator_update()
+        self._coordinator_update()
+
+        assert self.write.call_count == 2
+
+    async def test_strip_socket_energy_change_is_written(self):
+        fetcher = MagicMock()
+        fetcher.fetch = AsyncMock(
+            return_value=(Success({"today_energy": 10}), Success({"current_power": 5}))
+        )
+        energy = ChildEnergyComponent(MagicMock(), "socket_0", fetcher)
+        self.device.get_device_components = [energy]
+        await energy.update()
+        self._coordinator_update()
+        fetcher.fetch.return_value = (
+            Success({"today_energy": 11}),
+            Success({"current_power": 7}),
+        )
+        await energy.update()
+        self._coordinator_update()
+
+        assert self.write.call_count == 2
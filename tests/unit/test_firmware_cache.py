@@ -0,0 +1,130 @@
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from homeassistant.core import HomeAssistant
+from plugp100.common.functional.tri import Failure, Success
+from plugp100.models.firmware import (
+    FirmwareDownloadProgress,
+    FirmwareDownloadStatus,
+    LatestFirmware,
+)
+import pytest
+
+from custom_components.tapo.const import FIRMWARE_CACHE_TTL_S
+from custom_components.tapo.firmware_cache import TapoFirmwareCache, firmware_key
+from custom_components.tapo.update import (
+    POLL_DELAY_IDLE,
+    POLL_DELAY_UPGRADE,
+    TapoDeviceFirmwareDataCoordinator,
+)
+
+
+def _latest(need_to_upgrade: bool = False) -> LatestFirmware:
+    return LatestFirmware("1", "1.2.0", "2024-01-01", "notes", 100, need_to_upgrade)
+
+
+def _device(device_id: str, model: str = "T310") -> MagicMock:
+    device = MagicMock()
+    device.device_id = device_id
+    device.model = model
+    device.device_info.hardware_version = "1.0"
+    device.firmware_version = "1.1.0"
+    device.get_latest_firmware = AsyncMock(return_value=Success(_latest()))
+    device.get_firmware_download_state = AsyncMock(
+        return_value=Success(
+            FirmwareDownloadProgress(FirmwareDownloadStatus.DOWNLOADING, 10, 0, 0, 0)
+        )
+    )
+    return device
+
+
+class TestTapoFirmwareCache:
+    @pytest.fixture(autouse=True)
+    async def init_data(self, hass: HomeAssistant):
+        self.cache = TapoFirmwareCache(hass)
+        await self.cache.async_load()
+
+    async def test_results_expire_after_ttl(self):
+        self.cache.save("T310/1.0/1.1.0", _latest())
+        assert self.cache.get("T310/1.0/1.1.0") == _latest()
+
+        with patch(
+            "custom_components.tapo.firmware_cache.time.time",
+            return_value=time.time() + FIRMWARE_CACHE_TTL_S + 1,
+        ):
+            assert self.cache.get("T310/1.0/1.1.0") is None
+
+    def test_key_by_model_hardware_and_firmware(self):
+        assert firmware_key(_device("a")) == "T310/1.0/1.1.0"
+
+
+class TestTapoDeviceFirmwareDataCoordinator:
+    @pytest.fixture(autouse=True)
+    async def init_data(self, hass: HomeAssistant):
+        self.cache = TapoFirmwareCache(hass)
+        await self.cache.async_load()
+        self.children = [_device("a"), _device("b"), _device("c", model="S200B")]
+        self.coordinator = TapoDeviceFirmwareDataCoordinator(
+            hass, MagicMock(), POLL_DELAY_IDLE, self.cache, self.children
+        )
+
+    async def test_one_check_per_model(self):
+        await self.coordinator.poll_update()
+
+        first, second, other = self.children
+        assert first.get_latest_firmware.await_count == 1
+        second.get_latest_firmware.assert_not_called()
+        assert other.get_latest_firmware.await_count == 1
+        assert self.coordinator.latest_firmware(second) == _latest()
+        # nothing to download, so no download state requested
+        first.get_firmware_download_state.assert_not_called()
+        assert self.coordinator.update_interval == POLL_DELAY_IDLE
+
+    async def test_cached_results_skip_the_check(self):
+        self.cache.save(firmware_key(self.children[0]), _latest())
+        self.cache.save(firmware_key(self.children[2]), _latest())
+
+        self.coordinator.load_cached()
+        assert self.coordinator.latest_firmware(self.children[1]) == _latest()
+        await self.coordinator.poll_update()
+
+        for child in self.children:
+            child.get_latest_firmware.assert_not_called()
+
+    async def test_download_state_of_devices_to_upgrade(self):
+        self.cache.save(firmware_key(self.children[0]), _latest(need_to_upgrade=True))
+        self.children[2].get_latest_firmware.return_value = Failure(Exception("x"))
+
+        await self.coordinator.poll_update()
+
+        assert self.children[1].get_firmware_download_state.await_count == 1
+        assert (
+            self.coordinator.download_progress(self.children[1]).status
+            == FirmwareDownloadStatus.DOWNLOADING
+        )
+        assert self.coordinator.latest_firmware(self.children[2]) is None
+        assert self.coordinator.update_interval == POLL_DELAY_UPGRADE
+
+    async def test_auto_upgrade_is_kept_once_up_to_date(self):
+        key = firmware_key(self.children[0])
+        self.cache.save(key, _latest(need_to_upgrade=True))
+        self.children[0].get_firmware_download_state.return_value = Success(
+            FirmwareDownloadProgress(FirmwareDownloadStatus.IDLE, 0, 0, 0, True)
+        )
+        assert self.coordinator.auto_upgrade(self.children[0]) is None
+
+        await self.coordinator.poll_update()
+        self.cache.save(key, _latest())
+        await self.coordinator.poll_update()
+
+        assert self.coordinator.download_progress(self.children[0]) is None
+        assert self.coordinator.auto_upgrade(self.children[0]) is True
+        # never read for the devices which had nothing to download
+        assert self.coordinator.auto_upgrade(self.children[2]) is None
+
+    async def test_raises_when_nothing_could_be_checked(self):
+        for child in self.children:
+            child.get_latest_firmware.return_value = Failure(Exception("x"))
+
+        with pytest.raises(Exception):
+            await self.coordinator.poll_update()
@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+
+from custom_components.tapo.helpers import gather_with_concurrency
+
+
+class TestGatherWithConcurrency:
+    async def test_bounds_running_awaitables(self):
+        running = 0
+        max_running = 0
+
+        async def _task(value: int) -> int:
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return value
+
+        result = await gather_with_concurrency(3, [_task(i) for i in range(10)])
+
+        assert result == list(range(10))
+        assert max_running == 3
+
+    async def test_returns_exceptions_when_requested(self):
+        async def _fail():
+            raise ValueError("boom")
+
+        async def _ok():
+            return 1
+
+        result = await gather_with_concurrency(
+            2, [_fail(), _ok()], return_exceptions=True
+        )
+
+        assert isinstance(result[0], ValueError)
+        assert result[1] == 1
+
+    async def test_failure_cancels_the_others(self):
+        cancelled = asyncio.Event()
+
+        async def _fail():
+            raise ValueError("boom")
+
+        async def _slow():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with pytest.raises(ValueError):
+            await gather_with_concurrency(2, [_slow(), _fail(), _slow()])
+
+        assert cancelled.is_set()
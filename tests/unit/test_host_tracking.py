@@ -0,0 +1,166 @@
+import asyncio
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant
+from plugp100.api.tapo_client import TapoClient
+from plugp100.common.functional.tri import Failure, Success
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.tapo.const import CONF_HOST, CONF_MAC, DOMAIN
+from custom_components.tapo.coordinators import HassTapoDeviceData, TapoDataCoordinator
+from custom_components.tapo.host_tracking import (
+    async_move_device_host,
+    async_move_discovered_devices,
+    entry_needs_reload,
+)
+from custom_components.tapo.hub.request_broker import broker_hub_requests
+from custom_components.tapo.request_limiter import LimitedTapoProtocol
+from tests.conftest import mock_discovered_device
+
+MAC = "1a:22:33:b4:c5:66"
+
+
+def _protocol(mac: str = MAC) -> MagicMock:
+    protocol = MagicMock()
+    protocol.send_request = AsyncMock(
+        return_value=Success(MagicMock(result={"mac": mac.replace(":", "-")}))
+    )
+    protocol.close = AsyncMock()
+    return protocol
+
+
+class TestHostTracking:
+    @pytest.fixture(autouse=True)
+    def init_data(self, hass: HomeAssistant):
+        self.entry = MockConfigEntry(
+            domain=DOMAIN,
+            unique_id=MAC,
+            data={CONF_HOST: "10.0.0.1", CONF_MAC: MAC},
+            state=ConfigEntryState.LOADED,
+        )
+        self.entry.add_to_hass(hass)
+        self.old_protocol = _protocol()
+        self.child = MagicMock(host="10.0.0.1")
+        self.device = MagicMock(host="10.0.0.1", port=80, children=[self.child])
+        self.device.update = AsyncMock()
+        self.device.client = TapoClient(
+            MagicMock(),
+            "http://10.0.0.1:80/app",
+            LimitedTapoProtocol(self.old_protocol, MagicMock(), "10.0.0.1"),
+        )
+        self.coordinator = TapoDataCoordinator(hass, self.device, timedelta(seconds=30))
+        hass.data.setdefault(DOMAIN, {})[self.entry.entry_id] = HassTapoDeviceData(
+            device=self.device,
+            coordinator=self.coordinator,
+            config_entry_update_unsub=MagicMock(),
+            child_coordinators=[],
+            config_data=dict(self.entry.data),
+        )
+
+    def _connect(self, protocol: MagicMock):
+        async def _connected_device(**_kwargs):
+            await asyncio.sleep(0)
+            device = MagicMock(host="10.0.0.9")
+            device.client = TapoClient(MagicMock(), "http://10.0.0.9:80/app", protocol)
+            return device
+
+        return patch(
+            "custom_components.tapo.host_tracking.connect",
+            AsyncMock(side_effect=_connected_device),
+        )
+
+    async def test_moves_live_device_without_reload(self, hass: HomeAssistant):
+        new_protocol = _protocol()
+        with self._connect(new_protocol):
+            assert await async_move_device_host(hass, self.entry, "10.0.0.9")
+
+        limited = self.device.client.protocol
+        assert limited.inner is new_protocol
+        assert limited.host == "10.0.0.9"
+        assert self.device.host == self.child.host == "10.0.0.9"
+        assert self.device.client._url == "http://10.0.0.9:80/app"
+        assert self.entry.data[CONF_HOST] == "10.0.0.9"
+        assert not entry_needs_reload(hass, self.entry)
+        self.old_protocol.close.assert_awaited_once()
+
+    async def test_concurrent_moves_connect_once(self, hass: HomeAssistant):
+        with self._connect(_protocol()) as connect:
+            moved = await asyncio.gather(
+                async_move_device_host(hass, self.entry, "10.0.0.9"),
+                async_move_device_host(hass, self.entry, "10.0.0.9"),
+            )
+
+        assert moved == [True, True]
+        connect.assert_awaited_once()
+        self.old_protocol.close.assert_awaited_once()
+
+    async def test_hub_check_goes_through_the_broker(self, hass: HomeAssistant):
+        broker = broker_hub_requests(self.device)
+        new_protocol = _protocol()
+
+        with self._connect(new_protocol):
+            assert await async_move_device_host(hass, self.entry, "10.0.0.9")
+
+        assert broker.diagnostics()["wait"]["state"]["requests"] == 1
+        assert self.device.client.protocol.inner.inner is new_protocol
+
+    async def test_moved_device_is_polled_despite_open_breaker(
+        self, hass: HomeAssistant
+    ):
+        breaker = self.coordinator._circuit_breaker
+        while not breaker.is_open:
+            breaker.record_failure(30)
+
+        with self._connect(_protocol()):
+            assert await async_move_device_host(hass, self.entry, "10.0.0.9")
+
+        assert not breaker.is_open
+        assert breaker._host == "10.0.0.9"
+        self.device.update.assert_awaited_once()
+        assert self.coordinator.last_update_success
+
+    async def test_other_device_at_address_is_not_used(self, hass: HomeAssistant):
+        new_protocol = _protocol("aa:aa:aa:aa:aa:aa")
+        with self._connect(new_protocol):
+            assert not await async_move_device_host(hass, self.entry, "10.0.0.9")
+
+        assert self.device.client.protocol.inner is self.old_protocol
+        assert self.entry.data[CONF_HOST] == "10.0.0.1"
+        new_protocol.close.assert_awaited_once()
+
+    async def test_unreachable_address_is_not_used(self, hass: HomeAssistant):
+        new_protocol = _protocol()
+        new_protocol.send_request.return_value = Failure(Exception("timeout"))
+        with self._connect(new_protocol):
+            assert not await async_move_device_host(hass, self.entry, "10.0.0.9")
+
+        assert self.device.host == "10.0.0.1"
+
+    async def test_not_loaded_entry_is_left_to_reload(self, hass: HomeAssistant):
+        self.entry.mock_state(hass, ConfigEntryState.SETUP_RETRY)
+
+        assert not await async_move_device_host(hass, self.entry, "10.0.0.9")
+
+    def test_other_changes_need_reload(self, hass: HomeAssistant):
+        hass.config_entries.async_update_entry(
+            self.entry, data={**self.entry.data, "scan_interval": 10}
+        )
+
+        assert entry_needs_reload(hass, self.entry)
+
+    async def test_moved_devices_need_no_flow(self, hass: HomeAssistant):
+        moved = mock_discovered_device()
+        moved.ip = "10.0.0.9"
+        new_device = mock_discovered_device()
+        new_device.mac = "aa-aa-aa-aa-aa-aa"
+
+        with self._connect(_protocol()):
+            remaining = await async_move_discovered_devices(
+                hass, {MAC: moved, "aa:aa:aa:aa:aa:aa": new_device}
+            )
+
+        assert remaining == {"aa:aa:aa:aa:aa:aa": new_device}
+        assert self.device.host == "10.0.0.9"
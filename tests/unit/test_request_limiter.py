@@ -0,0 +1,134 @@
+import asyncio
+from unittest.mock import MagicMock
+
+from homeassistant.core import HomeAssistant
+from plugp100.api.requests.tapo_request import TapoRequest
+from plugp100.api.tapo_client import TapoClient
+from plugp100.common.functional.tri import Success
+
+from custom_components.tapo.const import (
+    ADAPTIVE_TIMEOUT_MAX_S,
+    ADAPTIVE_TIMEOUT_MIN_S,
+    ADAPTIVE_TIMEOUT_MIN_SAMPLES,
+)
+from custom_components.tapo.request_limiter import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_COMMAND,
+    PRIORITY_POLL,
+    LimitedTapoProtocol,
+    TapoRequestLimiter,
+    async_connect_device,
+    get_request_limiter,
+    request_priority,
+)
+
+
+def test_request_priority():
+    set_child = TapoRequest.control_child(
+        "child", TapoRequest.set_device_info({"device_on": True})
+    )
+    assert request_priority(set_child) == PRIORITY_COMMAND
+    assert request_priority(TapoRequest.get_device_info()) == PRIORITY_POLL
+    assert (
+        request_priority(TapoRequest(method="get_latest_fw", params=None))
+        == PRIORITY_BACKGROUND
+    )
+
+
+class TestTapoRequestLimiter:
+    async def test_host_limit_is_enforced(self):
+        limiter = TapoRequestLimiter(global_limit=10, host_limit=1)
+        running = 0
+        max_running = 0
+
+        async def _request():
+            nonlocal running, max_running
+            async with limiter.slot("1.2.3.4", PRIORITY_POLL):
+                running += 1
+                max_running = max(max_running, running)
+                await asyncio.sleep(0)
+                running -= 1
+
+        await asyncio.gather(*(_request() for _ in range(5)))
+
+        assert max_running == 1
+        assert limiter.diagnostics()["requests"] == 5
+        assert limiter.diagnostics()["in_flight"] == 0
+
+    async def test_commands_overtake_queued_polls(self):
+        limiter = TapoRequestLimiter(global_limit=1, host_limit=10)
+        served = []
+        release = asyncio.Event()
+
+        async def _request(name: str, host: str, priority: int):
+            async with limiter.slot(host, priority):
+                served.append(name)
+                if name == "busy":
+                    await release.wait()
+
+        busy = asyncio.create_task(_request("busy", "a", PRIORITY_POLL))
+        await asyncio.sleep(0)
+        polls = [
+            asyncio.create_task(_request(f"poll_{i}", f"h{i}", PRIORITY_POLL))
+            for i in range(3)
+        ]
+        command = asyncio.create_task(_request("command", "b", PRIORITY_COMMAND))
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(busy, command, *polls)
+
+        assert served[:2] == ["busy", "command"]
+
+
+class TestLimitedTapoProtocolTimeouts:
+    def _protocol(self, latency_s: float) -> LimitedTapoProtocol:
+        async def _send(_request, _retry):
+            await asyncio.sleep(latency_s)
+            return Success({})
+
+        inner = MagicMock()
+        inner.send_request = _send
+        protocol = LimitedTapoProtocol(
+            inner, TapoRequestLimiter(global_limit=10, host_limit=1), "1.2.3.4"
+        )
+        for _ in range(ADAPTIVE_TIMEOUT_MIN_SAMPLES):
+            protocol.timeouts["get_device_info"].record_success(0.01)
+        return protocol
+
+    async def test_queue_wait_does_not_count_as_latency(self):
+        protocol = self._protocol(ADAPTIVE_TIMEOUT_MIN_S * 0.6)
+
+        responses = await asyncio.gather(
+            protocol.send_request(TapoRequest.get_device_info()),
+            protocol.send_request(TapoRequest.get_device_info()),
+        )
+
+        assert all(response.is_success() for response in responses)
+
+    async def test_timeouts_are_kept_per_operation(self):
+        protocol = self._protocol(ADAPTIVE_TIMEOUT_MIN_S * 1.2)
+
+        response = await protocol.send_request(TapoRequest.get_device_info())
+        assert isinstance(response.error(), asyncio.TimeoutError)
+        assert protocol.timeouts["get_device_info"].timeout == ADAPTIVE_TIMEOUT_MAX_S
+
+        energy = TapoRequest.get_energy_usage()
+        assert (await protocol.send_request(energy)).is_success()
+        assert len(protocol.timeouts) == 2
+
+
+async def test_connect_runs_under_a_host_slot(hass: HomeAssistant):
+    limiter = get_request_limiter(hass)
+    device = MagicMock(host="1.2.3.4")
+    device.client = TapoClient(MagicMock(), "http://1.2.3.4:80/app", MagicMock())
+    in_flight = []
+
+    async def _connect():
+        in_flight.append(limiter.diagnostics()["in_flight"])
+        return device
+
+    assert await async_connect_device(hass, "1.2.3.4", _connect) is device
+
+    assert in_flight == [1]
+    assert isinstance(device.client.protocol, LimitedTapoProtocol)
+    assert device.client.protocol.host == "1.2.3.4"
@@ -0,0 +1,75 @@
+from unittest.mock import patch
+
+from custom_components.tapo.scheduler import TapoPollScheduler
+
+
+class TestTapoPollScheduler:
+    def test_coordinators_are_spread_across_slots(self):
+        scheduler = TapoPollScheduler(slot_width=1)
+
+        slots = [scheduler.acquire(key, 30) for key in range(60)]
+
+        assert sorted(slots[:30]) == list(range(30))
+        assert scheduler.diagnostics()["intervals"] == {
+            "30": {"slots": 30, "used_slots": 30, "max_per_slot": 2}
+        }
+
+    def test_release_frees_the_slot(self):
+        scheduler = TapoPollScheduler(slot_width=1)
+        scheduler.acquire("a", 30)
+        scheduler.acquire("b", 30)
+
+        scheduler.release("a")
+
+        assert scheduler.acquire("c", 30) == 0
+        assert scheduler.diagnostics()["coordinators"] == 2
+
+    def test_interval_change_moves_the_slot(self):
+        scheduler = TapoPollScheduler(slot_width=1)
+        scheduler.acquire("a", 30)
+
+        scheduler.acquire("a", 10)
+
+        assert scheduler.diagnostics()["intervals"] == {
+            "10": {"slots": 10, "used_slots": 1, "max_per_slot": 1}
+        }
+
+    def test_long_intervals_get_wider_slots(self):
+        scheduler = TapoPollScheduler(slot_width=1, max_slots=600)
+        scheduler.acquire("a", 21600)
+
+        with patch("custom_components.tapo.scheduler.random.uniform", return_value=0):
+            scheduler.acquire("b", 21600)
+            tick = scheduler.next_refresh("b", 0, 21600)
+
+        assert tick % 21600 == 36
+        assert scheduler.diagnostics()["intervals"] == {
+            "21600": {"slots": 600, "used_slots": 2, "max_per_slot": 1}
+        }
+
+    def test_next_refresh_is_aligned_to_slot_phase(self):
+        scheduler = TapoPollScheduler(slot_width=1)
+        scheduler.acquire("a", 30)
+        scheduler.acquire("b", 30)
+
+        with patch("custom_components.tapo.scheduler.random.uniform", return_value=0):
+            first = scheduler.next_refresh("b", 1000.2, 30)
+            second = scheduler.next_refresh("b", first + 0.5, 30)
+
+        assert first % 30 == 1
+        assert first >= 1000.2 + 15
+        assert second - first == 30
+
+    def test_group_members_share_one_slot(self):
+        scheduler = TapoPollScheduler(slot_width=1)
+        scheduler.acquire("other", 30)
+
+        slots = [scheduler.acquire(socket, 30, group="strip") for socket in "abc"]
+        scheduler.release("a")
+        scheduler.release("b")
+
+        assert slots == [1, 1, 1]
+        assert scheduler.acquire("d", 30) == 2
+        scheduler.release("c")
+        assert scheduler.acquire("e", 30) == 1
+        assert scheduler.diagnostics()["coordinators"] == 3
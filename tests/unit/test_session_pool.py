@@ -0,0 +1,39 @@
+from custom_components.tapo.session_pool import TapoSessionPool
+
+
+class TestTapoSessionPool:
+    async def test_sessions_are_per_host_on_a_shared_connector(self):
+        pool = TapoSessionPool()
+
+        session = pool.get("1.2.3.4")
+        other = pool.get("1.2.3.5")
+
+        assert pool.get("1.2.3.4") is session
+        assert other is not session
+        assert other.connector is session.connector
+        await pool.async_close()
+        assert session.closed and other.closed
+
+    async def test_release_closes_only_the_host_session(self):
+        pool = TapoSessionPool()
+        session = pool.get("1.2.3.4")
+        other = pool.get("1.2.3.5")
+
+        await pool.async_release("1.2.3.4")
+
+        assert session.closed
+        assert not other.closed
+        assert pool.get("1.2.3.4") is not session
+        await pool.async_close()
+
+    async def test_probe_session_is_not_kept(self):
+        pool = TapoSessionPool()
+        pooled = pool.get("1.2.3.4")
+
+        async with pool.probe_session() as session:
+            assert session.connector is pooled.connector
+
+        assert session.closed
+        assert not pooled.closed
+        assert pool.get("1.2.3.4") is pooled
+        await pool.async_close()
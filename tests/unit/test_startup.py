@@ -0,0 +1,40 @@
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+from homeassistant.core import CoreState, HomeAssistant
+import homeassistant.util.dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.tapo.startup import async_call_after_started
+
+
+class TestCallAfterStarted:
+    async def test_runs_after_started_and_delay(self, hass: HomeAssistant):
+        hass.set_state(CoreState.starting)
+        action = MagicMock()
+
+        with patch("custom_components.tapo.startup.random.uniform", return_value=30):
+            async_call_after_started(hass, action, 60)
+            async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=31))
+            await hass.async_block_till_done()
+            action.assert_not_called()
+
+            hass.set_state(CoreState.running)
+            hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+            await hass.async_block_till_done()
+            action.assert_not_called()
+
+            async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=31))
+            await hass.async_block_till_done()
+            action.assert_called_once()
+
+    async def test_cancel_drops_the_pending_call(self, hass: HomeAssistant):
+        action = MagicMock()
+
+        cancel = async_call_after_started(hass, action, 60)
+        cancel()
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=61))
+        await hass.async_block_till_done()
+
+        action.assert_not_called()
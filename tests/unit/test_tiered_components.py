@@ -0,0 +1,123 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from plugp100.common.functional.tri import Success
+from plugp100.components.countdown import Countdown
+from plugp100.components.energy import EnergyComponent
+from plugp100.devices import TapoPlug
+from plugp100.models.energy import EnergyInfo
+from plugp100.models.power import PowerInfo
+import pytest
+
+from custom_components.tapo.components.tiered_components import (
+    TieredCountdown,
+    TieredEnergyComponent,
+    apply_component_tiers,
+)
+from custom_components.tapo.sensors import CurrentEnergySensorSource
+
+INTERVAL_S = 30
+
+
+@pytest.fixture
+def clock():
+    """Loop time moved forward by the tests, one poll at a time."""
+    now = [1000.0]
+    with patch(
+        "custom_components.tapo.components.tiered_components.time.monotonic",
+        side_effect=lambda: now[0],
+    ):
+        yield now
+
+
+def _client() -> MagicMock:
+    client = MagicMock()
+    client.get_energy_usage = AsyncMock(return_value=Success(MagicMock()))
+    client.get_current_power = AsyncMock(return_value=Success(MagicMock()))
+    client.execute_raw_request = AsyncMock(return_value=Success({}))
+    return client
+
+
+async def test_energy_tiers_are_fetched_at_their_rate(clock):
+    client = _client()
+    component = TieredEnergyComponent(
+        client, power_every=1, energy_every=3, interval_s=INTERVAL_S
+    )
+
+    for _ in range(6):
+        await component.update()
+        clock[0] += INTERVAL_S
+
+    assert client.get_current_power.await_count == 6
+    assert client.get_energy_usage.await_count == 2
+    assert component.energy_info is not None
+
+
+async def test_current_power_follows_the_power_tier(clock):
+    client = _client()
+    client.get_energy_usage.return_value = Success(EnergyInfo({"current_power": 1000}))
+    component = TieredEnergyComponent(
+        client, power_every=1, energy_every=3, interval_s=INTERVAL_S
+    )
+    coordinator = MagicMock()
+    coordinator.device.get_component.return_value = component
+
+    for power in (1, 5):
+        client.get_current_power.return_value = Success(
+            PowerInfo({"current_power": power})
+        )
+        await component.update()
+
+    assert CurrentEnergySensorSource().get_value(coordinator) == 5
+
+
+async def test_countdown_is_fetched_once_every_n_polls(clock):
+    client = _client()
+    component = TieredCountdown(client, every=4, interval_s=INTERVAL_S)
+
+    # the scheduled polls are jittered within their slot
+    for jitter in (1, -1) * 4:
+        clock[0] += INTERVAL_S + jitter
+        await component.update()
+
+    assert client.execute_raw_request.await_count == 2
+
+
+async def test_refreshes_out_of_schedule_do_not_advance_the_tiers(clock):
+    client = _client()
+    component = TieredEnergyComponent(
+        client, power_every=1, energy_every=3, interval_s=INTERVAL_S
+    )
+
+    for _ in range(3):
+        await component.update()
+        # refreshes requested after commands
+        for _ in range(4):
+            clock[0] += 1
+            await component.update()
+        clock[0] += INTERVAL_S - 4
+
+    assert client.get_energy_usage.await_count == 1
+    assert client.get_current_power.await_count == 15
+
+
+async def test_tiers_start_from_the_replaced_components(clock):
+    client = _client()
+    device = TapoPlug("1.2.3.4", 80, client)
+    energy = EnergyComponent(client)
+    await energy.update()
+    device.add_component(energy)
+    device.add_component(Countdown(client))
+    rules = device.get_component(Countdown).get_countdown_rules()
+
+    apply_component_tiers(
+        device, INTERVAL_S, power_every=2, energy_every=2, countdown_every=2
+    )
+    tiered = device.get_component(EnergyComponent)
+    await tiered.update()
+    await device.get_component(Countdown).update()
+
+    assert isinstance(tiered, TieredEnergyComponent)
+    assert tiered.energy_info is energy.energy_info
+    assert client.get_energy_usage.await_count == 1
+    assert device.get_component(Countdown).get_countdown_rules() is rules
+    client.execute_raw_request.assert_not_called()